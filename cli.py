@@ -14,26 +14,54 @@ Odoo credentials are read from environment variables (``ODOO_HOSTNAME``,
 
 from __future__ import annotations
 
+import importlib
 import sys
 
 import click
 from loguru import logger
 
-from compute_price_brackets import cli as compute_price_brackets_cmd
-from gear_page import cli as gear_page_cmd
-from odoo_connector import get_connection
-from set_default_currency import cli as set_default_currency_cmd
-from sync_model import cli as sync_cmd
-from trigger_listing_compute import cli as trigger_listing_compute_cmd
-from trigger_weighted_score import cli as trigger_weighted_score_cmd
-from validate_model import cli as validate_cmd
-
 # Reconfigure loguru: clean single-line format, no timestamps or file references.
 logger.remove()
 logger.add(sys.stderr, format="<level>{message}</level>", colorize=True, level="INFO")
 
+#: Subcommand name → ``"module:attribute"`` of its Click command.
+SUBCOMMANDS: dict[str, str] = {
+    "gear-page": "gear_page:cli",
+    "sync": "sync_model:cli",
+    "validate": "validate_model:cli",
+    "trigger-weighted-score": "trigger_weighted_score:cli",
+    "trigger-listing-compute": "trigger_listing_compute:cli",
+    "compute-price-brackets": "compute_price_brackets:cli",
+    "set-default-currency": "set_default_currency:cli",
+}
+
+
+class LazyGroup(click.Group):
+    """Click group that imports a subcommand's module only when it is resolved.
+
+    Each command module pulls in its own dependencies (``odoolib``,
+    ``httpx``, ``jinja2``…), so importing them all up front made every
+    invocation pay for every command.  ``reverb2odoo sync …`` now imports
+    ``sync_model`` alone; listing commands in ``--help`` still loads all
+    of them, since Click needs each command's short help.
+    """
+
+    def __init__(self, *args, lazy_subcommands: dict[str, str] | None = None, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
 
-@click.group()
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return sorted({*super().list_commands(ctx), *self.lazy_subcommands})
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        import_path = self.lazy_subcommands.get(cmd_name)
+        if import_path is None:
+            return super().get_command(ctx, cmd_name)
+        module_name, attr = import_path.split(":")
+        return getattr(importlib.import_module(module_name), attr)
+
+
+@click.group(cls=LazyGroup, lazy_subcommands=SUBCOMMANDS)
 @click.version_option(package_name="reverb2odoo")
 @click.option(
     "--odoo-hostname",
@@ -68,6 +96,8 @@ def main(
     odoo_password: str,
 ) -> None:
     """reverb2odoo — Sync Reverb listings with Odoo."""
+    from odoo_connector import get_connection
+
     ctx.ensure_object(dict)
     ctx.obj["conn"] = get_connection(
         hostname=odoo_hostname,
@@ -77,13 +107,5 @@ def main(
     )
 
 
-main.add_command(gear_page_cmd)
-main.add_command(sync_cmd)
-main.add_command(validate_cmd)
-main.add_command(trigger_weighted_score_cmd)
-main.add_command(trigger_listing_compute_cmd)
-main.add_command(compute_price_brackets_cmd)
-main.add_command(set_default_currency_cmd)
-
 if __name__ == "__main__":
     main()
@@ -28,6 +28,7 @@ from rich.panel import Panel
 from rich.table import Table
 
 from models import GearRecord, ListingRecord, ModelsRecord
+from odoo_connector import batch_rpc, get_model_fields
 
 _console = Console()
 
@@ -183,10 +184,11 @@ _GEAR_SPEC_FIELDS: list[str] = [
 
 def _get_gear_field_meta(conn) -> dict[str, FieldMeta]:
     """Return FieldMeta for the known x_gear spec fields."""
-    raw_meta: dict[str, dict] = conn.get_model("x_gear").fields_get(_GEAR_SPEC_FIELDS)
+    raw_meta = get_model_fields(conn, "x_gear")
     return {
-        name: FieldMeta(name=name, **{k: v for k, v in raw.items() if k != "name"})
-        for name, raw in raw_meta.items()
+        name: FieldMeta(name=name, **{k: v for k, v in raw_meta[name].items() if k != "name"})
+        for name in _GEAR_SPEC_FIELDS
+        if name in raw_meta
     }
 
 
@@ -202,8 +204,7 @@ def _m2o_name(value: Any) -> str:
 
 
 def _available_fields(conn, model_name: str, wanted: list[str]) -> list[str]:
-    model = conn.get_model(model_name)
-    existing: set[str] = set(model.fields_get(wanted).keys())
+    existing = get_model_fields(conn, model_name)
     return [f for f in wanted if f in existing]
 
 
@@ -230,6 +231,8 @@ def _find_gear(conn, gear_ref: str) -> GearRecord:
 
 def _fetch_model(conn, model_id: int) -> ModelsRecord | None:
     model = conn.get_model("x_models")
+    # search_read, not read: a deleted model leaves a dangling id, and read()
+    # raises MissingError for it instead of returning nothing.
     results = model.search_read([("id", "=", model_id)], ModelsRecord.odoo_fields(), limit=1)
     return ModelsRecord.from_odoo(results[0]) if results else None
 
@@ -245,8 +248,12 @@ def _resolve_m2m_names(
     gear: GearRecord,
     field_meta: dict[str, FieldMeta],
 ) -> dict[str, list[str]]:
-    """Resolve many2many IDs to a list of display names per field."""
-    resolved: dict[str, list[str]] = {}
+    """Resolve many2many IDs to a list of display names per field.
+
+    The per-field ``read`` calls are independent, so they go out together
+    through :func:`batch_rpc`.
+    """
+    calls: dict[str, tuple[str, str, list, dict]] = {}
     for fname, meta in field_meta.items():
         if meta.type != "many2many":
             continue
@@ -255,12 +262,13 @@ def _resolve_m2m_names(
             continue
         if not meta.relation:
             continue
-        try:
-            records = conn.get_model(meta.relation).read(ids, ["display_name"])
-            resolved[fname] = [r["display_name"] for r in records]
-        except Exception:
-            resolved[fname] = []
-    return resolved
+        calls[fname] = (meta.relation, "read", [list(ids), ["display_name"]], {})
+
+    results = batch_rpc(conn, list(calls.values()), return_exceptions=True)
+    return {
+        fname: [] if isinstance(records, Exception) else [r["display_name"] for r in records]
+        for fname, records in zip(calls, results, strict=True)
+    }
 
 
 # ---------------------------------------------------------------------------
@@ -280,8 +288,12 @@ class _HTMLStripper(HTMLParser):
         return "".join(self._parts).strip()
 
 
+#: Tags that end a line of text in rich-text HTML fields.
+_LINE_BREAK_TAG_RE = re.compile(r"<br\s*/?>|</p>|</div>", re.IGNORECASE)
+
+
 def _strip_html(raw: str) -> str:
-    text = re.sub(r"<br\s*/?>|</p>|</div>", "\n", raw, flags=re.IGNORECASE)
+    text = _LINE_BREAK_TAG_RE.sub("\n", raw)
     stripper = _HTMLStripper()
     stripper.feed(_html.unescape(text))
     return stripper.get_text()
@@ -473,10 +485,15 @@ def _make_jinja_env() -> Environment:
     )
 
 
+#: Characters dropped from a slug, and whitespace runs turned into ``-``.
+_SLUG_STRIP_RE = re.compile(r"[^\w\s-]")
+_SLUG_SPACE_RE = re.compile(r"\s+")
+
+
 def _slugify(name: str) -> str:
     slug = name.lower().strip()
-    slug = re.sub(r"[^\w\s-]", "", slug)
-    slug = re.sub(r"\s+", "-", slug)
+    slug = _SLUG_STRIP_RE.sub("", slug)
+    slug = _SLUG_SPACE_RE.sub("-", slug)
     return slug or "gear"
 
 
@@ -5,10 +5,21 @@ Credentials are supplied as explicit arguments (sourced from environment
 variables / CLI options by the caller).
 """
 
-from urllib.parse import urlparse
-
+from __future__ import annotations
+
+import hashlib
+import hmac
+import itertools
+import time
+import weakref
+from collections.abc import Iterator, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+import httpx
 import odoolib
 from loguru import logger
+from odoolib.tools import JsonRPCException
 
 # ---------------------------------------------------------------------------
 # Config helpers
@@ -20,28 +31,98 @@ def _hostname_from_url(raw: str) -> str:
 
     ``https://reverb2odoo.odoo.com/odoo`` → ``reverb2odoo.odoo.com``
     ``localhost`` → ``localhost``
+
+    Plain slicing rather than ``urlparse``: only the authority between
+    ``://`` and the next ``/``, ``?`` or ``#`` is needed, minus any
+    ``user@`` prefix and ``:port`` suffix.  Bracketed IPv6 hosts
+    (``http://[::1]:8069``) contain colons of their own, so they go through
+    ``urlsplit``.
     """
-    if "://" in raw:
-        return urlparse(raw).hostname or raw
-    return raw.split("/")[0]
+    i = raw.find("://")
+    if i < 0:
+        return raw.split("/", 1)[0]
+    start = i + 3
+    end = len(raw)
+    for sep in "/?#":
+        j = raw.find(sep, start)
+        if 0 <= j < end:
+            end = j
+    authority = raw[start:end].rpartition("@")[2]
+    if authority.startswith("["):
+        return urlsplit(raw).hostname or raw
+    host = authority.partition(":")[0]
+    return host.lower() or raw
 
 
 # ---------------------------------------------------------------------------
 # Connection
 # ---------------------------------------------------------------------------
 
+#: Upper bound on pooled keep-alive connections to the Odoo server.  Sized
+#: above the default ``search_read_all`` worker count so threads never queue.
+HTTP_POOL_SIZE = 16
+
+
+class _PooledJsonRPCConnector(odoolib.main.JsonRPCConnector):
+    """JSON-RPC connector that sends every call through one keep-alive client.
+
+    Stock ``odoolib`` posts each call with a module-level ``httpx.post``,
+    which opens (and TLS-handshakes) a fresh connection per RPC.  This
+    connector reuses a pooled ``httpx.Client`` instead; the client is
+    thread-safe, so concurrent ``search_read_all`` pages share the pool.
+    """
+
+    def __init__(self, url: str, client: httpx.Client) -> None:
+        self.url = url
+        self.client = client
+        self._ids = itertools.count(1)
+
+    def send(self, service_name: str, method: str, *args):
+        payload = {
+            "jsonrpc": "2.0",
+            "method": "call",
+            "params": {"service": service_name, "method": method, "args": args},
+            "id": next(self._ids),
+        }
+        body = self.client.post(self.url, json=payload).json()
+        if body.get("error"):
+            raise JsonRPCException(body["error"])
+        return body.get("result", False)
+
+
+#: Seconds a connection is reused by :func:`get_connection` before a fresh
+#: one (and a fresh login) is made.
+CONNECTION_TTL_SECONDS = 1800
+
+_CONN_CACHE: dict[tuple[str, int, str, str], tuple[float, str, odoolib.main.Connection]] = {}
+
 
 def get_connection(
     hostname: str,
     database: str,
     login: str,
     password: str,
+    *,
+    refresh: bool = False,
 ) -> odoolib.main.Connection:
     """Return an authenticated ``odoolib`` connection.
 
     *hostname* may be a full URL (``https://mydb.odoo.com/odoo``) or a
     bare host (``localhost``).  Protocol and port are inferred from the
     URL scheme.
+
+    All RPCs on the returned connection share one keep-alive HTTP pool
+    (see :class:`_PooledJsonRPCConnector`).  Connections are cached per
+    ``(host, port, database, login)`` for :data:`CONNECTION_TTL_SECONDS`,
+    so repeated calls in one process reuse the resolved uid instead of
+    logging in again.  The password is not part of the key; a SHA-256
+    digest of it is stored alongside and must match for a cache hit.
+    Pass ``refresh=True`` to skip the cache and log in again (callers that
+    memoize the connection themselves, like the MCP server, do this), or
+    call ``get_connection.cache_clear()`` to drop every cached connection.
+    A dropped connection (expired, replaced or cleared) stays usable by
+    whoever still holds it; its HTTP pool is closed once the last reference
+    to it goes away.
     """
     clean_host = _hostname_from_url(hostname)
 
@@ -49,6 +130,14 @@ def get_connection(
     protocol = "jsonrpcs" if is_https else "jsonrpc"
     port = 443 if is_https else 8069
 
+    key = (clean_host, port, database, login)
+    digest = hashlib.sha256(password.encode()).hexdigest()
+    hit = _CONN_CACHE.get(key)
+    if hit is not None and not refresh:
+        fresh = time.monotonic() - hit[0] < CONNECTION_TTL_SECONDS
+        if fresh and hmac.compare_digest(hit[1], digest):
+            return hit[2]
+
     logger.info("Connecting to Odoo at {}:{} ({})…", clean_host, port, protocol)
 
     connection = odoolib.get_connection(
@@ -59,12 +148,203 @@ def get_connection(
         protocol=protocol,
         port=port,
     )
+    limits = httpx.Limits(max_connections=HTTP_POOL_SIZE, max_keepalive_connections=HTTP_POOL_SIZE)
+    client = httpx.Client(limits=limits)
+    connection.connector = _PooledJsonRPCConnector(connection.connector.url, client)
+    # Callers may still hold a connection after it leaves the cache, so its
+    # pool is released when the connection itself is collected, not on eviction.
+    weakref.finalize(connection, client.close)
+    _CONN_CACHE[key] = (time.monotonic(), digest, connection)
     return connection
 
 
+def _clear_connection_cache() -> None:
+    _CONN_CACHE.clear()
+
+
+get_connection.cache_clear = _clear_connection_cache  # type: ignore[attr-defined]
+
+
 # ---------------------------------------------------------------------------
 # Model helpers
 # ---------------------------------------------------------------------------
+
+
+def model_of(conn: odoolib.main.Connection, model_name: str) -> odoolib.main.Model:
+    """Return the ``odoolib`` model proxy for *model_name*, built once per connection.
+
+    ``conn.get_model()`` constructs a fresh proxy (plus a child logger) on
+    every call.  The proxies are stateless, so they are memoized in a dict
+    stored on the connection itself — it lives and dies with *conn*.
+    """
+    proxies: dict[str, odoolib.main.Model] = vars(conn).setdefault("_model_proxies", {})
+    model = proxies.get(model_name)
+    if model is None:
+        model = proxies[model_name] = conn.get_model(model_name)
+    return model
+
+
+def _warn_all_fields(caller: str, model_name: str) -> None:
+    logger.warning(
+        "{}({!r}) called without fields — every column will be read; pass an explicit field list",
+        caller,
+        model_name,
+    )
+
+
+def search_read_all(
+    conn: odoolib.main.Connection,
+    model_name: str,
+    domain: list | None = None,
+    fields: list[str] | None = None,
+    *,
+    batch_size: int = 1000,
+    max_workers: int = 8,
+) -> list[dict]:
+    """Fetch every record of *model_name* matching *domain*, page by page.
+
+    No ``search_count`` is issued (a ``COUNT(*)`` on a large table costs as
+    much as a page).  The first page is fetched alone; if it is full, the
+    following pages are requested in waves of *max_workers* concurrent
+    calls on a thread pool until a short page marks the end.  Each page is
+    an independent round trip, so wall time drops from ``pages × RTT`` to
+    roughly ``pages / max_workers × RTT``.  Records are returned in ``id``
+    order regardless of which page finishes first.
+
+    Pass the *fields* you need: ``None`` reads every column (including
+    computed and relational ones), which is the slow path server-side,
+    and logs a warning.
+    """
+    if fields is None:
+        _warn_all_fields("search_read_all", model_name)
+    model = model_of(conn, model_name)
+    domain = domain or []
+
+    def _page(offset: int) -> list[dict]:
+        return model.search_read(domain, fields or [], offset=offset, limit=batch_size, order="id")
+
+    records = _page(0)
+    if len(records) < batch_size:
+        return records
+
+    offset = batch_size
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        while True:
+            offsets = range(offset, offset + max_workers * batch_size, batch_size)
+            for batch in pool.map(_page, offsets):
+                records.extend(batch)
+                if len(batch) < batch_size:
+                    logger.debug("{}: fetched {} record(s)", model_name, len(records))
+                    return records
+            offset += max_workers * batch_size
+            logger.debug("{}: fetched {} record(s)…", model_name, len(records))
+
+
+def iter_search_read(
+    conn: odoolib.main.Connection,
+    model_name: str,
+    domain: list | None = None,
+    fields: list[str] | None = None,
+    *,
+    batch_size: int = 10000,
+) -> Iterator[dict]:
+    """Yield records of *model_name* matching *domain* one page at a time.
+
+    Streaming counterpart of :func:`search_read_all`: only one page of
+    *batch_size* records is held in memory, so peak memory is
+    ``O(batch_size)`` instead of ``O(total)``.  No ``search_count`` is
+    issued — iteration stops at the first short (or empty) page.  As with
+    :func:`search_read_all`, ``fields=None`` logs a warning.
+    """
+    if fields is None:
+        _warn_all_fields("iter_search_read", model_name)
+    model = model_of(conn, model_name)
+    domain = domain or []
+    offset = 0
+    while True:
+        batch = model.search_read(domain, fields or [], offset=offset, limit=batch_size, order="id")
+        yield from batch
+        if len(batch) < batch_size:
+            return
+        offset += batch_size
+
+
+def batch_rpc(
+    conn: odoolib.main.Connection,
+    calls: Sequence[tuple[str, str, Sequence, Mapping]],
+    *,
+    return_exceptions: bool = False,
+) -> list:
+    """Run independent ``execute_kw`` calls together and return their results.
+
+    *calls* is a sequence of ``(model, method, args, kwargs)`` tuples; the
+    results come back in the same order.  Odoo's ``/jsonrpc`` route accepts
+    one request object per POST (JSON-RPC array batches are rejected), so
+    the calls are dispatched concurrently over the connection's keep-alive
+    pool instead — total latency is about one round trip rather than one
+    per call.  With *return_exceptions*, a failing call yields its
+    exception in place of a result instead of raising.
+    """
+    if not calls:
+        return []
+    conn.check_login(False)
+    service = conn.get_service("object")
+
+    def _call(call: tuple[str, str, Sequence, Mapping]):
+        model_name, method, args, kwargs = call
+        return service.execute_kw(
+            conn.database, conn.user_id, conn.password, model_name, method, list(args), dict(kwargs)
+        )
+
+    with ThreadPoolExecutor(max_workers=min(len(calls), HTTP_POOL_SIZE)) as pool:
+        futures = [pool.submit(_call, call) for call in calls]
+    if return_exceptions:
+        return [f.exception() or f.result() for f in futures]
+    return [f.result() for f in futures]
+
+
+#: Seconds a ``fields_get`` result stays valid in :func:`get_model_fields`.
+FIELDS_CACHE_TTL_SECONDS = 3600
+
+# Bumped by ``get_model_fields.cache_clear()``; entries from an older
+# generation are stale on every connection.
+_FIELDS_GENERATION = 0
+
+
+def get_model_fields(conn: odoolib.main.Connection, model_name: str) -> dict[str, dict]:
+    """Return ``fields_get()`` metadata for *model_name*, cached per connection.
+
+    Schema metadata practically never changes during a CLI run, so the RPC
+    result is kept for :data:`FIELDS_CACHE_TTL_SECONDS`.  Like
+    :func:`model_of`'s proxies, the cache is stored on the connection
+    itself, so it lives and dies with *conn*.  A shallow copy is returned
+    so callers can filter it without touching the cached dict.  Call
+    ``get_model_fields.cache_clear()`` to force a refetch.
+    """
+    cache: dict[str, tuple[int, float, dict[str, dict]]] = vars(conn).setdefault(
+        "_fields_cache", {}
+    )
+    hit = cache.get(model_name)
+    if (
+        hit is not None
+        and hit[0] == _FIELDS_GENERATION
+        and time.monotonic() - hit[1] < FIELDS_CACHE_TTL_SECONDS
+    ):
+        return dict(hit[2])
+
+    fields = model_of(conn, model_name).fields_get()
+    cache[model_name] = (_FIELDS_GENERATION, time.monotonic(), fields)
+    return dict(fields)
+
+
+def _clear_model_fields_cache() -> None:
+    global _FIELDS_GENERATION
+    _FIELDS_GENERATION += 1
+
+
+get_model_fields.cache_clear = _clear_model_fields_cache  # type: ignore[attr-defined]
+
+
 #
 # Field lists for x_gear, x_listing and x_models now live on the pydantic
 # classes in ``models.py`` — see ``GearRecord.odoo_fields()``,
@@ -79,8 +359,9 @@ def get_connection(
 # x_guitar lookups (legacy — kept during transition from x_guitar to x_gear)
 # ---------------------------------------------------------------------------
 
-#: Fields typically needed when looking up a guitar entry.
-GUITAR_FIELDS: list[str] = [
+#: Fields typically needed when looking up a guitar entry.  A tuple, so the
+#: shared default can be handed to callers without a defensive copy.
+GUITAR_FIELDS: tuple[str, ...] = (
     "x_name",
     "x_studio_url",
     "x_studio_models",
@@ -100,13 +381,13 @@ GUITAR_FIELDS: list[str] = [
     "x_studio_target_price_ht",
     "x_studio_target_price_ttc",
     "x_studio_published_at",
-]
+)
 
 
 def find_guitar_by_url(
     conn: odoolib.main.Connection,
     url: str,
-    fields: list[str] | None = None,
+    fields: Sequence[str] | None = None,
 ) -> dict | None:
     """Look up a single ``x_guitar`` record by its Reverb / listing URL.
 
@@ -117,6 +398,15 @@ def find_guitar_by_url(
        (e.g. ``94370297`` from
        ``https://reverb.com/item/94370297-godin-stadium-…``).
 
+    Thin wrapper around :func:`find_guitars_by_urls` for a single URL: both
+    conditions go out as one OR-domain ``search_read`` and the exact hit is
+    preferred client-side, so a miss on the exact URL costs no second round
+    trip.  Hits are memoized per connection (see
+    :data:`GUITAR_URL_CACHE_SIZE`), so looking the same listing up again
+    costs no round trip; each call returns its own copy of the record.
+    Misses are not remembered, so a record created later is found on the
+    next call.
+
     Parameters
     ----------
     conn:
@@ -131,32 +421,146 @@ def find_guitar_by_url(
     dict | None
         The matching record, or ``None`` if nothing was found.
     """
-    if fields is None:
-        fields = GUITAR_FIELDS
+    # Stored on the connection like model_of's proxies, so the memo lives
+    # and dies with *conn* and never mixes results from two databases.
+    hits: dict[tuple, dict] = vars(conn).setdefault("_guitar_url_hits", {})
+    key = (url, None if fields is None else tuple(fields))
+    record = hits.get(key)
+    if record is None:
+        record = find_guitars_by_urls(conn, [url], fields)[url]
+        if record is None:
+            return None
+        if len(hits) >= GUITAR_URL_CACHE_SIZE:
+            del hits[next(iter(hits))]
+        hits[key] = record
+    return dict(record)
+
+
+#: Most URL hits remembered per connection by :func:`find_guitar_by_url`;
+#: the oldest entry is dropped first.
+GUITAR_URL_CACHE_SIZE = 4096
+
+#: Rows read per looked-up URL by the OR-domain URL lookups: room for the
+#: exact hit and one partial match, so a common item ID cannot pull the table.
+URL_LOOKUP_ROWS_PER_URL = 2
+
+
+def _url_lookup_domain(field: str, urls: list[str], item_ids: Sequence[str]) -> list:
+    """OR together an exact match on *urls* and a partial match per item ID.
+
+    The partial leaf looks for ``/item/<id>`` rather than the bare ID, so
+    it cannot match unrelated URLs that merely contain the same digits.
+    """
+    leaves: list = [(field, "in", urls)]
+    leaves += [(field, "ilike", f"/item/{item_id}") for item_id in dict.fromkeys(item_ids)]
+    return ["|"] * (len(leaves) - 1) + leaves
 
-    model = conn.get_model("x_guitar")
 
-    # 1. Exact match ----------------------------------------------------------
-    results = model.search_read([("x_studio_url", "=", url)], fields, limit=1)
-    if results:
-        logger.success("Exact URL match → id={}", results[0]["id"])
-        return results[0]
+def _index_url_rows(rows: list[dict], field: str) -> tuple[dict[str, dict], dict[str, dict]]:
+    """Index *rows* (ordered by ``id``) by URL and by Reverb item ID.
 
-    # 2. Partial match on Reverb item ID --------------------------------------
-    item_id = _extract_reverb_item_id(url)
-    if item_id:
-        logger.debug("Trying partial match with Reverb item ID '{}'…", item_id)
-        results = model.search_read(
-            [("x_studio_url", "ilike", item_id)],
-            fields,
-            limit=1,
-        )
-        if results:
-            logger.success("Partial URL match (item {}) → id={}", item_id, results[0]["id"])
-            return results[0]
+    The first row wins each key, so among several matches the oldest
+    record is picked.
+    """
+    by_url: dict[str, dict] = {}
+    by_item: dict[str, dict] = {}
+    for row in rows:
+        url = row.get(field) or ""
+        by_url.setdefault(url, row)
+        item_id = _extract_reverb_item_id(url)
+        if item_id:
+            by_item.setdefault(item_id, row)
+    return by_url, by_item
+
+
+def find_guitars_by_urls(
+    conn: odoolib.main.Connection,
+    urls: list[str],
+    fields: Sequence[str] | None = None,
+) -> dict[str, dict | None]:
+    """Look up ``x_guitar`` records for many listing URLs in bulk.
 
-    logger.warning("No x_guitar record found for URL: {}", url)
-    return None
+    Same matching rules as :func:`find_guitar_by_url`, but all URLs are
+    resolved with a **single** ``search_read`` whose domain ORs together:
+
+    - ``x_studio_url in urls`` (exact matches), and
+    - one ``x_studio_url ilike /item/<id>`` per Reverb URL (partial matches).
+
+    Exact hits are preferred client-side; the partial match is only used
+    for URLs that have no exact hit.  Rows are ordered by ``id``, so the
+    oldest record wins among several matches, and capped at
+    :data:`URL_LOOKUP_ROWS_PER_URL` per URL.
+
+    Parameters
+    ----------
+    conn:
+        An authenticated ``odoolib`` connection.
+    urls:
+        Listing URLs to search for.  Duplicates are looked up once.
+    fields:
+        Fields to return.  Defaults to :data:`GUITAR_FIELDS`.
+        ``x_studio_url`` is always fetched since results are matched on it.
+
+    Returns
+    -------
+    dict[str, dict | None]
+        Maps every input URL to its matching record, or ``None``.
+    """
+    if fields is None:
+        fields = GUITAR_FIELDS
+    if "x_studio_url" not in fields:
+        fields = [*fields, "x_studio_url"]
+
+    found: dict[str, dict | None] = dict.fromkeys(urls)
+    if not found:
+        return found
+
+    item_ids: dict[str, str] = {}
+    for url in found:
+        item_id = _extract_reverb_item_id(url)
+        if item_id:
+            item_ids[url] = item_id
+
+    limit = URL_LOOKUP_ROWS_PER_URL * len(found)
+    rows = model_of(conn, "x_guitar").search_read(
+        _url_lookup_domain("x_studio_url", list(found), list(item_ids.values())),
+        fields,
+        limit=limit,
+        order="id",
+    )
+    if len(rows) == limit:
+        logger.warning("URL lookup hit its {}-row cap; some URLs may be reported missing", limit)
+    by_url, by_item = _index_url_rows(rows, "x_studio_url")
+
+    # Per-URL outcomes are only worth a visible line for single lookups;
+    # bulk callers get them at DEBUG (dropped by loguru before formatting)
+    # plus one summary line below.
+    bulk = len(found) > 1
+    hit_level = "DEBUG" if bulk else "SUCCESS"
+    miss_level = "DEBUG" if bulk else "WARNING"
+
+    for url in found:
+        # 1. Exact match ------------------------------------------------------
+        if url in by_url:
+            found[url] = by_url[url]
+            logger.log(hit_level, "Exact URL match → id={}", by_url[url]["id"])
+            continue
+
+        # 2. Partial match on Reverb item ID ----------------------------------
+        item_id = item_ids.get(url)
+        if item_id in by_item:
+            found[url] = by_item[item_id]
+            logger.log(hit_level, "Partial URL match (item {}) → id={}", item_id, found[url]["id"])
+
+        if found[url] is None:
+            logger.log(miss_level, "No x_guitar record found for URL: {}", url)
+
+    if bulk:
+        misses = sum(record is None for record in found.values())
+        logger.success("Matched {}/{} URL(s) to x_guitar records", len(found) - misses, len(found))
+        if misses:
+            logger.warning("No x_guitar record found for {} URL(s)", misses)
+    return found
 
 
 def find_listing_by_url(
@@ -171,6 +575,10 @@ def find_listing_by_url(
     1. **Exact match** on ``x_url``.
     2. **Partial match** using the Reverb item ID extracted from the URL.
 
+    Both conditions are sent as one OR-domain ``search_read`` ordered by
+    ``id`` and limited to :data:`URL_LOOKUP_ROWS_PER_URL` rows; the exact
+    match is preferred client-side, so a miss costs one round trip, not two.
+
     Parameters
     ----------
     conn:
@@ -189,25 +597,25 @@ def find_listing_by_url(
         from models import ListingRecord
 
         fields = ListingRecord.odoo_fields()
+    if "x_url" not in fields:
+        fields = [*fields, "x_url"]
 
-    model = conn.get_model("x_listing")
+    item_id = _extract_reverb_item_id(url)
+    rows = model_of(conn, "x_listing").search_read(
+        _url_lookup_domain("x_url", [url], [item_id] if item_id else []),
+        fields,
+        limit=URL_LOOKUP_ROWS_PER_URL,
+        order="id",
+    )
+    by_url, by_item = _index_url_rows(rows, "x_url")
 
-    results = model.search_read([("x_url", "=", url)], fields, limit=1)
-    if results:
-        logger.success("Exact URL match → id={}", results[0]["id"])
-        return results[0]
+    if url in by_url:
+        logger.success("Exact URL match → id={}", by_url[url]["id"])
+        return by_url[url]
 
-    item_id = _extract_reverb_item_id(url)
-    if item_id:
-        logger.debug("Trying partial match with Reverb item ID '{}'…", item_id)
-        results = model.search_read(
-            [("x_url", "ilike", item_id)],
-            fields,
-            limit=1,
-        )
-        if results:
-            logger.success("Partial URL match (item {}) → id={}", item_id, results[0]["id"])
-            return results[0]
+    if item_id in by_item:
+        logger.success("Partial URL match (item {}) → id={}", item_id, by_item[item_id]["id"])
+        return by_item[item_id]
 
     logger.warning("No x_listing record found for URL: {}", url)
     return None
@@ -219,14 +627,13 @@ def _extract_reverb_item_id(url: str) -> str | None:
     ``https://reverb.com/item/94370297-godin-…`` → ``"94370297"``
 
     Returns ``None`` when the URL does not look like a Reverb item link.
+    String methods rather than a regex: the id is whatever follows the
+    first ``/item/`` up to a ``-``, ``/``, ``?`` or ``#``, and must be all
+    digits.
     """
-    # Path looks like /item/94370297-slug-text
-    parsed = urlparse(url)
-    parts = parsed.path.strip("/").split("/")
-    if len(parts) >= 2 and parts[-2] == "item":
-        slug = parts[-1]
-        # The item ID is the leading digits before the first hyphen
-        segment = slug.split("-", 1)[0]
-        if segment.isdigit():
-            return segment
-    return None
+    _, found, head = url.partition("/item/")
+    if not found:
+        return None
+    for stop in "-/?#":
+        head = head.partition(stop)[0]
+    return head if head.isdecimal() else None
@@ -112,11 +112,13 @@ def clear_all() -> str:
     brand_cache._cache = []
     brand_cache._fetched_at = None
 
+    from odoo_connector import get_connection
     from odoo_mcp import config
 
     conn_was_cached = config._conn_cache is not None
     config._conn_cache = None
     config._conn_fetched_at = None
+    get_connection.cache_clear()
 
     logger.info(
         "Cache cleared — result entries: {}, brand_cache: {}, connection: {}",
@@ -55,6 +55,8 @@ def get_connection_from_env() -> odoolib.main.Connection:
         logger.debug("Connection cache expired — re-authenticating")
 
     cfg = get_odoo_config()
-    _conn_cache = get_connection(cfg.hostname, cfg.database, cfg.login, cfg.password)
+    # This module owns the connection's lifetime, so skip get_connection's
+    # own cache: an expired memo or `clear_cache` really logs in again.
+    _conn_cache = get_connection(cfg.hostname, cfg.database, cfg.login, cfg.password, refresh=True)
     _conn_fetched_at = now
     return _conn_cache
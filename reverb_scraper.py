@@ -7,23 +7,154 @@ or call :meth:`aclose` when done.
 """
 
 import asyncio
+import importlib.util
+import itertools
+import json
+import random
 import re
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator
 from datetime import UTC, datetime
+from functools import cache, lru_cache
+from operator import itemgetter
+from pathlib import Path
 from typing import Any
+from urllib.parse import quote
 
 import httpx
-import uritemplate
 from loguru import logger
 
 # Region codes used by Reverb for Canada
 CANADA_REGION_CODES = ("CA", "CA_CON")
 
+# Catch-all region codes, in fallback priority order
+INTERNATIONAL_REGION_CODES = ("XX", "EVERYWHERE_ELSE")
+
+# Extra codes tried after an exact match, per target region
+_REGION_VARIANTS = {"CA": CANADA_REGION_CODES}
+
+# Precompiled pattern for HTML tag stripping
+_TAG_RE = re.compile(r"<[^>]+>")
+
+# Reverb timestamps look like ``2025-12-28T18:30:00-05:00`` (or ``…Z``).
+# Days 29-31 are left out so the fast path never has to know month lengths:
+# those dates (and impossible ones like 02-30) go through fromisoformat.
+_ISO_DATETIME_RE = re.compile(
+    r"(\d{4}-(?:0[1-9]|1[0-2])-(?:0[1-9]|1\d|2[0-8]))"
+    r"T([01]\d|2[0-3]):([0-5]\d):[0-5]\d(?:\.\d+)?"
+    r"(Z|[+-](?:[01]\d|2[0-3]):[0-5]\d)"
+)
+# Offsets that are already UTC: the date prefix needs no shifting at all
+_UTC_SUFFIXES = frozenset({"Z", "+00:00", "-00:00"})
+
+# orjson parses the large search/listing bodies several times faster than the
+# stdlib; it is an optional speed-up, not a dependency.
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+# HTTP/2 lets concurrent requests share one TLS connection; httpx needs the
+# optional ``h2`` package for it (``httpx[http2]``), so fall back to HTTP/1.1
+# keep-alive when it is not installed.
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# The category tree changes over days or weeks, so fetch_categories keeps it
+# in memory and in CATEGORIES_CACHE_DIR/categories-<currency>.json for this long.
+CATEGORIES_CACHE_TTL_SECONDS = 24 * 3600
+CATEGORIES_CACHE_DIR = Path.home() / ".cache" / "reverb2odoo"
+
+# Listings rarely change within one sync run, so extract_data keeps the raw
+# JSON of recent fetches: (currency, slug) → (expires-at monotonic, body),
+# least recently used first.  Scrapers in several threads (validate_model runs
+# one event loop per worker) share it, so every access holds the lock.
+LISTING_CACHE_TTL_SECONDS = 300
+LISTING_CACHE_MAX_SIZE = 1024
+_LISTING_CACHE: OrderedDict[tuple[str, str], tuple[float, dict[str, Any]]] = OrderedDict()
+_LISTING_CACHE_LOCK = threading.Lock()
+
+# A 429 from the listings endpoint is retried this many times, waiting for
+# Retry-After when the API sends it, else an exponential backoff with jitter.
+# No single wait exceeds RATE_LIMIT_MAX_DELAY_SECONDS, whatever Retry-After says.
+RATE_LIMIT_MAX_RETRIES = 3
+RATE_LIMIT_BACKOFF_SECONDS = 1.0
+RATE_LIMIT_MAX_DELAY_SECONDS = 30.0
+
+# Keys kept from each /categories/flat entry; missing ones default to ""
+_CATEGORY_KEYS = ("full_name", "name", "slug", "root_slug", "uuid")
+_category_values = itemgetter(*_CATEGORY_KEYS)
+
+# (API base, currency) → (fetched-at epoch seconds, categories)
+_CATEGORIES_CACHE: dict[tuple[str, str], tuple[float, list[dict[str, Any]]]] = {}
+
+
+def _categories_cache_path(key: tuple[str, str]) -> Path:
+    """Disk cache file for *key*: one per currency, so currencies never mix."""
+    return CATEGORIES_CACHE_DIR / f"categories-{key[1]}.json"
+
+
+def _load_cached_categories(key: tuple[str, str]) -> list[dict[str, Any]] | None:
+    """Return unexpired categories from memory, then disk, or ``None``.
+
+    The disk file records the key it was fetched for and is ignored when
+    that does not match (e.g. another API base).
+    """
+    now = time.time()
+    hit = _CATEGORIES_CACHE.get(key)
+    if hit is not None and now - hit[0] < CATEGORIES_CACHE_TTL_SECONDS:
+        return list(hit[1])
+
+    path = _categories_cache_path(key)
+    try:
+        fetched_at = path.stat().st_mtime
+        if now - fetched_at >= CATEGORIES_CACHE_TTL_SECONDS:
+            return None
+        payload = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(payload, dict) or payload.get("key") != list(key):
+        return None
+    categories = payload["categories"]
+    _CATEGORIES_CACHE[key] = (fetched_at, categories)
+    return list(categories)
+
+
+def _store_cached_categories(key: tuple[str, str], categories: list[dict[str, Any]]) -> None:
+    """Remember *categories* in memory and (best effort) on disk."""
+    _CATEGORIES_CACHE[key] = (time.time(), categories)
+    path = _categories_cache_path(key)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps({"key": list(key), "categories": categories}))
+        tmp.replace(path)
+    except OSError as e:
+        logger.debug("Could not write category cache {}: {}", path, e)
+
+
+@cache
+def _region_chain(target_region: str) -> tuple[str, ...]:
+    """Return the region codes to try for *target_region*, best first.
+
+    Exact match, then the region's variants (e.g. ``CA_CON`` for ``CA``),
+    then the international catch-alls.  Duplicates keep their first slot.
+    """
+    chain = (target_region, *_REGION_VARIANTS.get(target_region, ()), *INTERNATIONAL_REGION_CODES)
+    return tuple(dict.fromkeys(chain))
+
+
+@cache
+def _region_ranks(target_region: str) -> dict[str, int]:
+    """Map each code of :func:`_region_chain` to its position (0 = best)."""
+    return {code: rank for rank, code in enumerate(_region_chain(target_region))}
+
 
 class ReverbScraper:
     """Extract listing information from the Reverb.com public API."""
 
     API_BASE = "https://api.reverb.com/api"
-    LISTING_URL = uritemplate.URITemplate(API_BASE + "/listings/{slug}")
     LISTINGS_URL = API_BASE + "/listings"
     CATEGORIES_URL = API_BASE + "/categories/flat"
 
@@ -32,10 +163,29 @@ class ReverbScraper:
         currency: str = "CAD",
         shipping_region: str = "CA",
         default_shipping: str = "250.00",
+        client: httpx.AsyncClient | None = None,
     ):
+        """Create a scraper.
+
+        Pass *client* (another scraper's ``client``, same currency) to share
+        its connection pool; the scraper then leaves closing it to the owner.
+        """
         self.currency = currency
         self.shipping_region = shipping_region
         self.default_shipping = default_shipping
+        # Result for listings with no usable rate; _resolve_shipping copies
+        # it and adds the per-listing ``shipping_regions``.
+        self._default_shipping_result = {
+            "shipping_price": default_shipping,
+            "shipping_display": f"C${default_shipping}",
+            "shipping_region": "",
+            "ships_to_canada": False,
+        }
+        self._categories_lock = asyncio.Lock()
+        self._owns_client = client is None
+        if client is not None:
+            self.client = client
+            return
         self.client = httpx.AsyncClient(
             headers={
                 "Accept": "application/hal+json",
@@ -44,6 +194,12 @@ class ReverbScraper:
                 "X-Display-Currency": self.currency,
             },
             timeout=15.0,
+            http2=_HTTP2_AVAILABLE,
+            limits=httpx.Limits(
+                max_connections=20,
+                max_keepalive_connections=20,
+                keepalive_expiry=30.0,
+            ),
         )
 
     async def __aenter__(self):
@@ -53,24 +209,39 @@ class ReverbScraper:
         await self.aclose()
 
     async def aclose(self):
-        """Close the underlying HTTP client."""
-        await self.client.aclose()
+        """Close the underlying HTTP client, unless it was passed in."""
+        if self._owns_client:
+            await self.client.aclose()
 
     def _extract_listing_slug(self, url: str) -> str:
         """Extract the listing slug from a Reverb URL.
 
         URL format:
             https://reverb.com/item/<id>-<slug>
+
+        Anything after the slug — a trailing ``/``, a query string or a
+        fragment — is dropped.
         """
-        match = re.search(r"/item/(.+)$", url.rstrip("/"))
-        if not match:
+        _, sep, slug = url.partition("/item/")
+        for stop in "/?#":
+            slug = slug.partition(stop)[0]
+        if not sep or not slug:
             raise ValueError(f"Invalid Reverb URL: {url}")
-        return match.group(1)
+        return slug
 
     async def extract_data(self, url: str) -> dict[str, Any]:
         """
         Extract listing information from a Reverb.com page via the API.
 
+        The listing slug is percent-encoded as a single path segment
+        (``/`` included) when building ``/api/listings/<slug>``.  Successful
+        responses are cached per ``(currency, slug)`` for
+        ``LISTING_CACHE_TTL_SECONDS``; errors are never cached.
+
+        HTTP 429 responses are retried with backoff.  HTTP status failures
+        come back as ``{"url", "error", "status_code"}`` so a missing listing
+        (404) can be told apart from a rate limit (429).
+
         Args:
             url: Reverb.com listing URL
 
@@ -79,17 +250,61 @@ class ReverbScraper:
         """
         try:
             listing_slug = self._extract_listing_slug(url)
-            api_url = self.LISTING_URL.expand(slug=listing_slug)
-            response = await self.client.get(api_url)
-            response.raise_for_status()
-            raw = response.json()
+            raw = await self._fetch_listing_raw(listing_slug)
             return self._parse_api_response(raw, url)
 
+        except httpx.HTTPStatusError as e:
+            return self._http_error_result(url, e.response.status_code, str(e))
         except httpx.HTTPError as e:
             return {"url": url, "error": f"API error: {e}"}
         except Exception as e:
             return {"url": url, "error": f"Error: {e}"}
 
+    @staticmethod
+    def _http_error_result(url: str, status_code: int, detail: str) -> dict[str, Any]:
+        """Build the error dict for an HTTP status failure.
+
+        ``status_code`` lets callers tell a vanished listing (404) from a
+        rate limit (429) without parsing the message.
+        """
+        if status_code == 404:
+            detail = "listing not found"
+        return {"url": url, "error": f"API error: {detail}", "status_code": status_code}
+
+    async def _fetch_listing_raw(self, listing_slug: str) -> dict[str, Any]:
+        """GET one listing's JSON, served from the in-process cache when fresh."""
+        key = (self.currency, listing_slug)
+        with _LISTING_CACHE_LOCK:
+            hit = _LISTING_CACHE.get(key)
+            if hit is not None and time.monotonic() < hit[0]:
+                _LISTING_CACHE.move_to_end(key)
+                return hit[1]
+
+        api_url = f"{self.LISTINGS_URL}/{quote(listing_slug, safe='')}"
+        for attempt in range(RATE_LIMIT_MAX_RETRIES + 1):
+            response = await self.client.get(api_url)
+            if response.status_code != 429 or attempt == RATE_LIMIT_MAX_RETRIES:
+                break
+            await asyncio.sleep(self._retry_delay(response, attempt))
+        response.raise_for_status()
+        raw = _json_loads(response.content)
+
+        with _LISTING_CACHE_LOCK:
+            _LISTING_CACHE[key] = (time.monotonic() + LISTING_CACHE_TTL_SECONDS, raw)
+            _LISTING_CACHE.move_to_end(key)
+            while len(_LISTING_CACHE) > LISTING_CACHE_MAX_SIZE:
+                _LISTING_CACHE.popitem(last=False)
+        return raw
+
+    @staticmethod
+    def _retry_delay(response: httpx.Response, attempt: int) -> float:
+        """Seconds to wait before retrying a rate-limited request."""
+        retry_after = response.headers.get("Retry-After", "")
+        if retry_after.isdigit():
+            return min(float(retry_after), RATE_LIMIT_MAX_DELAY_SECONDS)
+        backoff = RATE_LIMIT_BACKOFF_SECONDS * 2**attempt
+        return min(backoff + random.uniform(0, backoff), RATE_LIMIT_MAX_DELAY_SECONDS)
+
     async def extract_many(
         self,
         urls: list[str],
@@ -102,16 +317,57 @@ class ReverbScraper:
             urls: Reverb.com listing URLs.
             max_concurrent: Maximum number of requests in flight at once.
 
+        URLs that resolve to the same listing slug (e.g. with and without a
+        trailing slash, or repeated) are fetched once; each position still
+        gets its own result dict with ``url`` set to the URL given at that
+        position.
+
+        If a listing is still rate limited (HTTP 429) after
+        ``RATE_LIMIT_MAX_RETRIES`` retries, listings not yet fetched are
+        reported as rate limited without another request.
+
         Returns:
             List of result dicts in the same order as *urls*.
         """
         semaphore = asyncio.Semaphore(max_concurrent)
+        rate_limited = False
 
         async def _limited(url: str) -> dict[str, Any]:
+            nonlocal rate_limited
             async with semaphore:
-                return await self.extract_data(url)
-
-        return list(await asyncio.gather(*[_limited(u) for u in urls]))
+                # Once the API has kept rejecting us past the retries, fail the
+                # queued listings fast instead of hitting it again for each one.
+                if rate_limited:
+                    return self._http_error_result(url, 429, "rate limited")
+                data = await self.extract_data(url)
+                if data.get("status_code") == 429:
+                    rate_limited = True
+                return data
+
+        # slug (or the raw URL when it has none) → first URL seen for it
+        first_url: dict[str, str] = {}
+        keys: list[str] = []
+        for url in urls:
+            try:
+                key = self._extract_listing_slug(url)
+            except ValueError:
+                key = url
+            first_url.setdefault(key, url)
+            keys.append(key)
+
+        fetched = await asyncio.gather(*[_limited(u) for u in first_url.values()])
+        by_key = dict(zip(first_url, fetched, strict=True))
+
+        results: list[dict[str, Any]] = []
+        taken: set[str] = set()
+        for url, key in zip(urls, keys, strict=True):
+            # The first position for a key takes the fetched dict; any later
+            # one gets a copy, so results never alias each other.
+            data = dict(by_key[key]) if key in taken else by_key[key]
+            taken.add(key)
+            data["url"] = url
+            results.append(data)
+        return results
 
     # ── Search ────────────────────────────────────────────────────────────
 
@@ -130,11 +386,131 @@ class ReverbScraper:
                 params={**params, "page": page},
             )
             response.raise_for_status()
-            return response.json()
+            return _json_loads(response.content)
         except httpx.HTTPError as e:
             logger.error("API error on page {}: {}", page, e)
             return None
 
+    @staticmethod
+    def _search_params(
+        query: str,
+        *,
+        category: str | None,
+        ships_to: str | None,
+        state: str,
+        per_page: int,
+    ) -> dict[str, Any]:
+        """Build the ``/listings`` query parameters shared by every page."""
+        params: dict[str, Any] = {
+            "query": query,
+            "per_page": min(per_page, 50),
+        }
+        if state and state != "all":
+            params["state"] = state
+        if ships_to:
+            params["ships_to"] = ships_to
+        if category:
+            params["product_type"] = category
+        return params
+
+    async def _iter_search_pages(
+        self,
+        query: str,
+        params: dict[str, Any],
+        max_pages: int | None,
+        max_concurrent: int,
+    ) -> AsyncIterator[tuple[int, dict[str, Any] | None]]:
+        """Yield ``(page, body)`` pairs, page 1 first, the rest as they arrive.
+
+        Page 1 is fetched alone to discover ``total_pages``; the remaining
+        pages are then requested concurrently and yielded in completion
+        order.  At most *max_concurrent* pages are in flight or fetched but
+        not yet consumed: a new request only starts once the caller has
+        taken a page, so a slow consumer holds a bounded number of bodies.
+        *body* is ``None`` for a page that failed.  Pages still in flight
+        are cancelled if the caller stops iterating early.
+        """
+        first_body = await self._fetch_search_page(params, 1)
+        if first_body is None:
+            yield 1, None
+            return
+
+        total_pages = first_body.get("total_pages", 1)
+        logger.info(
+            'Search "{}" — {} result(s), {} page(s)',
+            query,
+            first_body.get("total", 0),
+            total_pages,
+        )
+
+        # Determine remaining pages to fetch
+        effective_max = total_pages
+        if max_pages is not None:
+            effective_max = min(total_pages, max_pages)
+
+        async def _numbered(page: int) -> tuple[int, dict[str, Any] | None]:
+            return page, await self._fetch_search_page(params, page)
+
+        todo = iter(range(2, effective_max + 1))
+        window: set[asyncio.Task[tuple[int, dict[str, Any] | None]]] = set()
+
+        def _top_up() -> None:
+            for page in itertools.islice(todo, max_concurrent - len(window)):
+                window.add(asyncio.create_task(_numbered(page)))
+
+        # Start the remaining pages before handing page 1 to the caller.
+        _top_up()
+        try:
+            yield 1, first_body
+            while window:
+                done, _ = await asyncio.wait(window, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    yield task.result()
+                    window.discard(task)
+                    _top_up()
+        finally:
+            for task in window:
+                task.cancel()
+
+    def _parse_search_body(self, body: dict[str, Any]) -> list[dict[str, Any]]:
+        """Normalise every listing of one search results page."""
+        return [
+            self._parse_api_response(raw, raw.get("_links", {}).get("web", {}).get("href", ""))
+            for raw in body.get("listings", [])
+        ]
+
+    async def search_iter(
+        self,
+        query: str,
+        *,
+        category: str | None = None,
+        ships_to: str | None = None,
+        state: str = "live",
+        per_page: int = 50,
+        max_pages: int | None = None,
+        max_concurrent: int = 10,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Search Reverb listings, yielding normalised results as pages arrive.
+
+        Streaming counterpart of :meth:`search` (same arguments): listings
+        from page 1 are yielded first, then those of the remaining pages in
+        the order their responses complete — not in page order.  At most
+        *max_concurrent* pages are requested ahead of the caller, so only
+        those are held in memory however slowly results are consumed.  A
+        failed first page yields a single ``{"error": ...}`` dict; failed
+        later pages are skipped.
+        """
+        params = self._search_params(
+            query, category=category, ships_to=ships_to, state=state, per_page=per_page
+        )
+        async for page, body in self._iter_search_pages(query, params, max_pages, max_concurrent):
+            if body is None:
+                if page == 1:
+                    yield {"error": "API error on page 1"}
+                continue
+            for listing in self._parse_search_body(body):
+                yield listing
+
     async def search(
         self,
         query: str,
@@ -144,11 +520,14 @@ class ReverbScraper:
         state: str = "live",
         per_page: int = 50,
         max_pages: int | None = None,
+        max_concurrent: int = 10,
     ) -> list[dict[str, Any]]:
         """Search Reverb listings and return normalised results.
 
         After fetching the first page (to discover ``total_pages``), all
-        remaining pages are fetched **concurrently** for speed.
+        remaining pages are fetched **concurrently** for speed.  Results
+        are returned in page order; use :meth:`search_iter` to consume
+        them as they arrive instead.
 
         Args:
             query: Free-text search string (e.g. "Godin Stadium HT").
@@ -166,64 +545,28 @@ class ReverbScraper:
             per_page: Number of results per API page (max 50).
             max_pages: Maximum number of pages to fetch.  ``None`` means
                        fetch all pages.
+            max_concurrent: Maximum number of page requests in flight at
+                            once (page 1 is always fetched alone first).
 
         Returns:
             List of normalised listing dicts (same shape as extract_data).
         """
-
-        params: dict[str, Any] = {
-            "query": query,
-            "per_page": min(per_page, 50),
-        }
-        if state and state != "all":
-            params["state"] = state
-        if ships_to:
-            params["ships_to"] = ships_to
-        if category:
-            params["product_type"] = category
-
-        # Fetch first page to discover total_pages
-        first_body = await self._fetch_search_page(params, 1)
-        if first_body is None:
-            return [{"error": "API error on page 1"}]
-
-        listings = first_body.get("listings", [])
-        total_pages = first_body.get("total_pages", 1)
-        total = first_body.get("total", 0)
-
-        logger.info(
-            'Search "{}" — {} result(s), {} page(s)',
-            query,
-            total,
-            total_pages,
+        params = self._search_params(
+            query, category=category, ships_to=ships_to, state=state, per_page=per_page
         )
+        pages: dict[int, list[dict[str, Any]]] = {}
+        async for page, body in self._iter_search_pages(query, params, max_pages, max_concurrent):
+            if body is None:
+                if page == 1:
+                    return [{"error": "API error on page 1"}]
+                continue
+            pages[page] = self._parse_search_body(body)
 
-        all_results: list[dict[str, Any]] = []
-        for raw in listings:
-            web_url = raw.get("_links", {}).get("web", {}).get("href", "")
-            all_results.append(self._parse_api_response(raw, web_url))
-
-        # Determine remaining pages to fetch
-        effective_max = total_pages
-        if max_pages is not None:
-            effective_max = min(total_pages, max_pages)
-
-        if effective_max > 1:
-            remaining = await asyncio.gather(
-                *[self._fetch_search_page(params, p) for p in range(2, effective_max + 1)]
-            )
-            for body in remaining:
-                if body is None:
-                    continue
-                for raw in body.get("listings", []):
-                    web_url = raw.get("_links", {}).get("web", {}).get("href", "")
-                    all_results.append(self._parse_api_response(raw, web_url))
-
-        return all_results
+        return [listing for page in sorted(pages) for listing in pages[page]]
 
     # ── Categories ─────────────────────────────────────────────────────────
 
-    async def fetch_categories(self) -> list[dict[str, Any]]:
+    async def fetch_categories(self, *, refresh: bool = False) -> list[dict[str, Any]]:
         """Fetch the flat list of all Reverb categories.
 
         Each returned dict contains:
@@ -235,13 +578,34 @@ class ReverbScraper:
         - ``root_slug`` – slug of the root (top-level) category.
         - ``uuid`` – Reverb's unique identifier for this category.
 
+        Results are cached for ``CATEGORIES_CACHE_TTL_SECONDS`` in memory
+        and on disk under ``CATEGORIES_CACHE_DIR``; failed fetches are not
+        cached.
+
+        Args:
+            refresh: Skip both caches and download the tree again.
+
         Returns:
             List of category dicts, one per (sub)category.
         """
+        key = (self.API_BASE, self.currency)
+        async with self._categories_lock:
+            if not refresh:
+                cached = _load_cached_categories(key)
+                if cached is not None:
+                    logger.debug("Using cached Reverb categories ({})", len(cached))
+                    return cached
+            categories = await self._download_categories()
+            if categories:
+                _store_cached_categories(key, categories)
+            return list(categories)
+
+    async def _download_categories(self) -> list[dict[str, Any]]:
+        """GET the flat category tree; ``[]`` on error."""
         try:
             response = await self.client.get(self.CATEGORIES_URL)
             response.raise_for_status()
-            body = response.json()
+            body = _json_loads(response.content)
         except httpx.HTTPError as e:
             logger.error("Failed to fetch categories: {}", e)
             return []
@@ -249,16 +613,14 @@ class ReverbScraper:
         raw_categories = body.get("categories", [])
         logger.info("Fetched {} categories from Reverb", len(raw_categories))
 
-        return [
-            {
-                "full_name": cat.get("full_name", ""),
-                "name": cat.get("name", ""),
-                "slug": cat.get("slug", ""),
-                "root_slug": cat.get("root_slug", ""),
-                "uuid": cat.get("uuid", ""),
-            }
-            for cat in raw_categories
-        ]
+        categories: list[dict[str, Any]] = []
+        for cat in raw_categories:
+            try:
+                values = _category_values(cat)
+            except KeyError:
+                values = tuple(cat.get(key, "") for key in _CATEGORY_KEYS)
+            categories.append(dict(zip(_CATEGORY_KEYS, values, strict=True)))
+        return categories
 
     # ── Shipping helpers ──────────────────────────────────────────────────
 
@@ -266,29 +628,28 @@ class ReverbScraper:
     #: ``self.default_shipping`` set in ``__init__``.
     DEFAULT_SHIPPING = "250.00"
 
-    def _find_shipping_rate(self, rates: list[dict], target_region: str) -> dict | None:
+    def _find_shipping_rate(
+        self,
+        rates: list[dict],
+        target_region: str,
+    ) -> dict | None:
         """Find the shipping rate for a given region.
 
         Looks for an exact region code match first (e.g. CA), then
-        Canadian variants (CA_CON, etc.), then a global/international rate (XX).
+        Canadian variants (CA_CON, etc.), then a global/international rate
+        (XX).  One pass keeps the best-ranked rate (see
+        :func:`_region_ranks`); the first rate listed wins among equals.
         """
-        # 1. Exact match
+        ranks = _region_ranks(target_region)
+        best = None
+        best_rank = len(ranks)
         for rate in rates:
-            if rate.get("region_code") == target_region:
-                return rate
-
-        # 2. Canadian variants
-        if target_region == "CA":
-            for rate in rates:
-                if rate.get("region_code") in CANADA_REGION_CODES:
-                    return rate
-
-        # 3. International / global rate
-        for rate in rates:
-            if rate.get("region_code") in ("XX", "EVERYWHERE_ELSE"):
-                return rate
-
-        return None
+            rank = ranks.get(rate.get("region_code", ""), best_rank)
+            if rank < best_rank:
+                best, best_rank = rate, rank
+                if rank == 0:
+                    break
+        return best
 
     def _resolve_shipping(
         self,
@@ -312,19 +673,21 @@ class ReverbScraper:
         ``shipping_region``, ``ships_to_canada``, and ``shipping_regions``.
         """
         shipping = raw.get("shipping", {})
-        rates = shipping.get("rates", [])
-        ca_rate = self._find_shipping_rate(rates, self.shipping_region)
+        rates = shipping.get("rates", ())
         fallback = self.default_shipping
 
+        codes = [rate.get("region_code", "") for rate in rates]
+
         if sale_ended:
             return {
                 "shipping_price": None,
                 "shipping_display": None,
                 "shipping_region": None,
                 "ships_to_canada": None,
-                "shipping_regions": [r.get("region_code", "") for r in rates],
+                "shipping_regions": codes,
             }
 
+        ca_rate = self._find_shipping_rate(rates, self.shipping_region)
         if ca_rate:
             rate_info = ca_rate.get("rate", {})
             return {
@@ -332,94 +695,83 @@ class ReverbScraper:
                 "shipping_display": rate_info.get("display", ""),
                 "shipping_region": ca_rate.get("region_code", ""),
                 "ships_to_canada": True,
-                "shipping_regions": [r.get("region_code", "") for r in rates],
+                "shipping_regions": codes,
             }
 
-        return {
-            "shipping_price": fallback,
-            "shipping_display": f"C${fallback}",
-            "shipping_region": "",
-            "ships_to_canada": False,
-            "shipping_regions": [r.get("region_code", "") for r in rates],
-        }
+        out = self._default_shipping_result.copy()
+        out["shipping_regions"] = codes
+        return out
 
     def _parse_api_response(self, raw: dict[str, Any], url: str) -> dict[str, Any]:
         """Transform the API response into a normalised structure."""
-        data: dict[str, Any] = {}
-
-        # URL
-        data["url"] = url
-
-        # Name
-        data["name"] = raw.get("title", "")
-
-        # Make / Model
-        data["make"] = raw.get("make", "")
-        data["model"] = raw.get("model", "")
-
-        # Finish / Year
-        data["finish"] = raw.get("finish", "")
-        data["year"] = raw.get("year", "")
-
-        # Price (in CAD thanks to the X-Display-Currency header)
-        price_info = raw.get("price", {})
-        data["price"] = price_info.get("amount", "")
-        data["currency"] = price_info.get("currency", self.currency)
-        data["price_display"] = price_info.get("display", "")
-
-        # Condition
-        cond = raw.get("condition", {})
-        data["condition"] = cond.get("display_name", "")
-
-        # Sale status (resolved early — shipping logic depends on it)
-        state = raw.get("state", {})
+        # Nested objects are pulled once up front; ``or {}`` also covers
+        # explicit ``null`` values in the payload.
+        price_info = raw.get("price") or {}
+        state = raw.get("state") or {}
+        stats = raw.get("stats") or {}
+        photo_link = (raw.get("_links") or {}).get("photo") or {}
+
+        # Sale status is resolved early — shipping logic depends on it
         state_slug = state.get("slug", "")
-        data["status"] = state.get("description", state_slug)
-        data["sale_ended"] = state_slug in ("sold", "ended", "suspended")
+        sale_ended = state_slug in ("sold", "ended", "suspended")
 
-        # Shipping to Canada
-        data.update(self._resolve_shipping(raw, sale_ended=data["sale_ended"]))
-
-        # Offers
-        data["offers_enabled"] = raw.get("offers_enabled", False)
-
-        # Dates
-        data["created_at"] = self._format_date(raw.get("created_at", ""))
-        data["published_at"] = self._format_date(raw.get("published_at", ""))
-
-        # Useful extras
-        data["seller"] = raw.get("shop_name", "")
-        location = raw.get("location", {})
-        data["location"] = location.get("display_location", "")
-        data["description"] = raw.get("description", "")
-
-        stats = raw.get("stats", {})
-        data["views"] = stats.get("views", 0)
-        data["watchers"] = stats.get("watches", 0)
-
-        # Categories
-        raw_cats = raw.get("categories", [])
-        data["categories"] = [c.get("full_name", "") for c in raw_cats]
-
-        # Main photo
-        links = raw.get("_links", {})
-        photo_link = links.get("photo", {})
-        data["photo_url"] = photo_link.get("href", "")
-
-        return data
+        # Built as a single literal so CPython can pre-size the dict.
+        return {
+            "url": url,
+            "name": raw.get("title", ""),
+            "make": raw.get("make", ""),
+            "model": raw.get("model", ""),
+            "finish": raw.get("finish", ""),
+            "year": raw.get("year", ""),
+            # Price (in CAD thanks to the X-Display-Currency header)
+            "price": price_info.get("amount", ""),
+            "currency": price_info.get("currency", self.currency),
+            "price_display": price_info.get("display", ""),
+            "condition": (raw.get("condition") or {}).get("display_name", ""),
+            "status": state.get("description", state_slug),
+            "sale_ended": sale_ended,
+            # Shipping to Canada
+            **self._resolve_shipping(raw, sale_ended=sale_ended),
+            "offers_enabled": raw.get("offers_enabled", False),
+            "created_at": self._format_date(raw.get("created_at", "")),
+            "published_at": self._format_date(raw.get("published_at", "")),
+            "seller": raw.get("shop_name", ""),
+            "location": (raw.get("location") or {}).get("display_location", ""),
+            "description": raw.get("description", ""),
+            "views": stats.get("views", 0),
+            "watchers": stats.get("watches", 0),
+            "categories": [c.get("full_name", "") for c in raw.get("categories", [])],
+            # Main photo
+            "photo_url": photo_link.get("href", ""),
+        }
 
     @staticmethod
+    @lru_cache(maxsize=4096)
     def _format_date(date_str: str) -> str:
         """Format an ISO date string to YYYY-MM-DD (normalised to UTC).
 
         Normalising to UTC ensures the date component is stable regardless
         of which timezone offset the API returns for the same instant.
+        Memoized: overlapping searches return the same listings, and so the
+        same timestamps, many times per run.
         """
         if not date_str:
             return ""
+        # Fast path: when shifting to UTC stays on the same day, the answer
+        # is the date prefix — no datetime object needed.
+        match = _ISO_DATETIME_RE.fullmatch(date_str)
+        if match:
+            date, hour, minute, tz = match.groups()
+            if tz in _UTC_SUFFIXES:
+                return date
+            offset = int(tz[1:3]) * 60 + int(tz[4:6])
+            if tz[0] == "-":
+                offset = -offset
+            if 0 <= int(hour) * 60 + int(minute) - offset < 24 * 60:
+                return date
         try:
             dt = datetime.fromisoformat(date_str)
-            if dt.tzinfo is not None:
+            if dt.utcoffset():
                 dt = dt.astimezone(UTC)
             return dt.strftime("%Y-%m-%d")
         except (ValueError, TypeError):
@@ -430,6 +782,6 @@ class ReverbScraper:
         """Strip basic HTML tags from a string."""
         if not html:
             return ""
-        clean = re.sub(r"<[^>]+>", "", html)
-        clean = re.sub(r"\s+", " ", clean).strip()
-        return clean
+        if "<" in html:
+            html = _TAG_RE.sub("", html)
+        return " ".join(html.split())
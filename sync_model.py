@@ -8,7 +8,7 @@ The Reverb category filter is resolved automatically from the model's
 ``--no-category`` to search across all categories.
 
 Use ``--all`` to sync every model in the database at once, with
-multi-threaded Reverb searching.
+concurrent Reverb searching.
 """
 
 from __future__ import annotations
@@ -17,13 +17,17 @@ import asyncio
 import base64
 import re
 import sys
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import Counter
+from collections.abc import Callable, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from typing import Any
 from urllib.parse import urlparse
 
 import click
 import httpx
 from loguru import logger
+from odoolib.tools import JsonRPCException
 from rich import box
 from rich.console import Console
 from rich.markup import escape
@@ -37,6 +41,7 @@ from rich.progress import (
 )
 
 from models import ListingRecord
+from odoo_connector import iter_search_read
 from reverb_scraper import ReverbScraper
 
 _console = Console()
@@ -48,9 +53,21 @@ DEFAULT_SHIPPING = 250.0
 #: 5 % filters CAD/USD conversion noise (~1-3 %) while catching real seller drops.
 REWATCH_PRICE_DROP_THRESHOLD = 0.05
 
-#: Default number of worker threads for ``--all`` mode.
+#: Default number of models searched concurrently in ``--all`` mode.
 DEFAULT_WORKERS = 4
 
+#: Page size used when reading ``x_models`` in :func:`_fetch_all_models`.
+MODELS_PAGE_SIZE = 5000
+
+#: ``x_models`` fields read by :func:`_find_model` / :func:`_fetch_all_models`.
+_MODEL_FIELDS = ("x_name", "x_studio_reverb_category_id")
+
+#: ``x_reverb_category`` fields giving a model's search slug and fallback shipping.
+_CATEGORY_FIELDS = ("x_studio_slug", "x_studio_shipping_default_price")
+
+#: ``x_listing`` fields mapped onto :class:`ListingRecord`.
+_LISTING_FIELDS = tuple(ListingRecord.odoo_fields())
+
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -59,7 +76,7 @@ DEFAULT_WORKERS = 4
 
 def _clean_url(url: str) -> str:
     """Strip query-string from a URL for comparison purposes."""
-    return url.split("?")[0]
+    return url.partition("?")[0]
 
 
 def _reverb_item_id(url: str) -> str | None:
@@ -128,10 +145,18 @@ def _find_entries_without_image(conn, entry_ids: list[int]) -> set[int]:
     return {r["id"] for r in no_img}
 
 
+def _m2o_id(ref: Any) -> int | None:
+    """Return the id of a many2one value (``[id, name]``, a bare id, or falsy)."""
+    if not ref:
+        return None
+    return ref[0] if isinstance(ref, (list, tuple)) else ref
+
+
 def _find_model(conn, model_name: str) -> dict[str, Any]:
     """Look up an ``x_models`` record by *model_name*.
 
-    Uses a case-insensitive search (``ilike``).  Also resolves the linked
+    Tries a case-insensitive exact match (``=ilike``) first, then falls
+    back to a substring search (``ilike``).  Also resolves the linked
     ``x_reverb_category`` slug so it can be used as the default Reverb
     search category.
 
@@ -147,33 +172,38 @@ def _find_model(conn, model_name: str) -> dict[str, Any]:
         If the model name is not found or matches more than one record.
     """
     models = conn.get_model("x_models")
-    fields = ["x_name", "x_studio_reverb_category_id"]
-    results = models.search_read([("x_name", "ilike", model_name)], fields)
-
-    if not results:
-        logger.error("No model found matching '{}'", model_name)
-        sys.exit(1)
-
-    # Prefer an exact (case-insensitive) match when several rows come back.
-    exact = [r for r in results if r["x_name"].lower() == model_name.lower()]
-    if len(exact) == 1:
-        record = exact[0]
-    elif len(results) == 1:
+    # The usual case is the full name: an equality lookup, stopped as soon
+    # as it is known to be unique.
+    results = models.search_read([("x_name", "=ilike", model_name)], _MODEL_FIELDS, limit=2)
+    if len(results) == 1:
         record = results[0]
     else:
-        names = ", ".join(f"{r['x_name']!r} (id={r['id']})" for r in results)
-        logger.error("Ambiguous model name '{}' — matches: {}", model_name, names)
-        sys.exit(1)
+        results = models.search_read([("x_name", "ilike", model_name)], _MODEL_FIELDS)
+
+        if not results:
+            logger.error("No model found matching '{}'", model_name)
+            sys.exit(1)
+
+        # Prefer an exact (case-insensitive) match when several rows come back.
+        exact = [r for r in results if r["x_name"].lower() == model_name.lower()]
+        if len(exact) == 1:
+            record = exact[0]
+        elif len(results) == 1:
+            record = results[0]
+        else:
+            names = ", ".join(f"{r['x_name']!r} (id={r['id']})" for r in results)
+            logger.error("Ambiguous model name '{}' — matches: {}", model_name, names)
+            sys.exit(1)
 
     # Resolve category slug & default shipping from the linked record.
     category_slug: str | None = None
     default_shipping: float = DEFAULT_SHIPPING
-    cat_ref = record.get("x_studio_reverb_category_id")
-    if cat_ref:
-        cat_id = cat_ref[0] if isinstance(cat_ref, (list, tuple)) else cat_ref
+    cat_id = _m2o_id(record.get("x_studio_reverb_category_id"))
+    if cat_id:
         cat_model = conn.get_model("x_reverb_category")
-        cat_fields = ["x_studio_slug", "x_studio_shipping_default_price"]
-        cat_records = cat_model.search_read([("id", "=", cat_id)], cat_fields)
+        # search_read, not read: a deleted category leaves a dangling id, and
+        # read() raises MissingError for it instead of returning nothing.
+        cat_records = cat_model.search_read([("id", "=", cat_id)], _CATEGORY_FIELDS, limit=1)
         if cat_records:
             category_slug = cat_records[0].get("x_studio_slug") or None
             cat_ship = cat_records[0].get("x_studio_shipping_default_price")
@@ -208,10 +238,61 @@ def _fetch_listings(
         ]
     else:
         domain = [("x_model_id", "=", model_id)]
-    rows = listing.search_read(domain, ListingRecord.odoo_fields())
+    rows = listing.search_read(domain, _LISTING_FIELDS)
+    return [ListingRecord.from_odoo(r) for r in rows]
+
+
+def _url_candidates(results: list[dict]) -> set[str]:
+    """Return every result URL, both as-is and without its query string."""
+    candidates: set[str] = set()
+    for r in results:
+        raw = r.get("url", "")
+        if not raw:
+            continue
+        candidates.add(raw)
+        candidates.add(_clean_url(raw))
+    return candidates
+
+
+def _fetch_listings_bulk(
+    conn,
+    model_ids: list[int],
+    extra_urls: list[str] | None = None,
+) -> list[ListingRecord]:
+    """Return ``x_listing`` records for all *model_ids* plus any rows whose
+    ``x_url`` matches *extra_urls*, in a single query.
+
+    Use :func:`_listings_for_model` to split the rows back per model; the
+    result per model is the same as :func:`_fetch_listings` would return.
+    Either argument may be empty; no query is sent when both are.
+    """
+    clauses: list = []
+    if model_ids:
+        clauses.append(("x_model_id", "in", list(model_ids)))
+    if extra_urls:
+        clauses.append(("x_url", "in", list(extra_urls)))
+    if not clauses:
+        return []
+    domain = ["|", *clauses] if len(clauses) == 2 else clauses
+    listing = conn.get_model("x_listing")
+    rows = listing.search_read(domain, _LISTING_FIELDS)
     return [ListingRecord.from_odoo(r) for r in rows]
 
 
+def _listings_for_model(
+    entries: list[ListingRecord],
+    model_id: int,
+    urls: set[str],
+) -> list[ListingRecord]:
+    """Select the rows of a :func:`_fetch_listings_bulk` result that
+    :func:`_fetch_listings` would return for *model_id* and *urls*."""
+    return [
+        e
+        for e in entries
+        if (e.x_model_id is not None and e.x_model_id[0] == model_id) or e.x_url in urls
+    ]
+
+
 def _fetch_all_models(conn, *, wanna_only: bool = False) -> list[dict[str, Any]]:
     """Fetch every ``x_models`` record and resolve category / shipping info.
 
@@ -232,51 +313,39 @@ def _fetch_all_models(conn, *, wanna_only: bool = False) -> list[dict[str, Any]]
     - ``category_slug`` – Reverb category slug (or ``None``)
     - ``default_shipping`` – fallback shipping cost
     """
-    models = conn.get_model("x_models")
-    fields = ["x_name", "x_studio_reverb_category_id"]
     domain: list = [("x_studio_wanna", "=", True)] if wanna_only else []
-    records = models.search_read(domain, fields)
+    # Records are read page by page and reduced to (id, name, category id)
+    # as they arrive, so only one page of raw dicts is held at a time.
+    rows = [
+        (rec["id"], rec.get("x_name", ""), _m2o_id(rec.get("x_studio_reverb_category_id")))
+        for rec in iter_search_read(
+            conn, "x_models", domain, _MODEL_FIELDS, batch_size=MODELS_PAGE_SIZE
+        )
+    ]
 
-    if not records:
+    if not rows:
         logger.warning("No models found in Odoo.")
         return []
 
-    # Collect all referenced category IDs for a single bulk fetch.
-    cat_ids: set[int] = set()
-    for rec in records:
-        cat_ref = rec.get("x_studio_reverb_category_id")
-        if cat_ref:
-            cat_ids.add(cat_ref[0] if isinstance(cat_ref, (list, tuple)) else cat_ref)
+    # Categories are fetched in bulk once every id is known.
+    cat_ids = {cat_id for _, _, cat_id in rows if cat_id}
 
     cat_map: dict[int, dict] = {}
     if cat_ids:
         cat_model = conn.get_model("x_reverb_category")
-        cat_fields = ["x_studio_slug", "x_studio_shipping_default_price"]
-        cat_records = cat_model.search_read([("id", "in", list(cat_ids))], cat_fields)
-        for c in cat_records:
-            cat_map[c["id"]] = c
+        cat_records = cat_model.search_read([("id", "in", list(cat_ids))], _CATEGORY_FIELDS)
+        cat_map = {c["id"]: c for c in cat_records}
 
     result: list[dict[str, Any]] = []
-    for rec in records:
-        category_slug: str | None = None
-        default_shipping: float = DEFAULT_SHIPPING
-
-        cat_ref = rec.get("x_studio_reverb_category_id")
-        if cat_ref:
-            cat_id = cat_ref[0] if isinstance(cat_ref, (list, tuple)) else cat_ref
-            cat_rec = cat_map.get(cat_id)
-            if cat_rec:
-                category_slug = cat_rec.get("x_studio_slug") or None
-                cat_ship = cat_rec.get("x_studio_shipping_default_price")
-                if cat_ship:
-                    default_shipping = float(cat_ship)
-
+    for model_id, name, cat_id in rows:
+        cat_rec = cat_map.get(cat_id, {})
+        cat_ship = cat_rec.get("x_studio_shipping_default_price")
         result.append(
             {
-                "id": rec["id"],
-                "name": rec.get("x_name", ""),
-                "category_slug": category_slug,
-                "default_shipping": default_shipping,
+                "id": model_id,
+                "name": name,
+                "category_slug": cat_rec.get("x_studio_slug") or None,
+                "default_shipping": float(cat_ship) if cat_ship else DEFAULT_SHIPPING,
             }
         )
 
@@ -307,26 +376,38 @@ def _search_reverb(
         include_sold: When *True*, searches ``state='all'`` to capture both
                       live and sold listings.  Defaults to live-only.
     """
-    shipping_str = f"{default_shipping:.2f}"
-    state = "all" if include_sold else "live"
 
     async def _fetch() -> list[dict]:
         async with ReverbScraper(
             currency="CAD",
             shipping_region="CA",
-            default_shipping=shipping_str,
+            default_shipping=f"{default_shipping:.2f}",
         ) as scraper:
-            return await scraper.search(query, category=category, state=state)
+            return await _search_reverb_async(
+                scraper, query, category=category, include_sold=include_sold
+            )
 
-    raw = asyncio.run(_fetch())
+    return asyncio.run(_fetch())
 
-    seen: set[str] = set()
-    unique: list[dict] = []
-    for r in raw:
-        url = r.get("url", "")
-        if url and url not in seen:
-            seen.add(url)
-            unique.append(r)
+
+async def _search_reverb_async(
+    scraper: ReverbScraper,
+    query: str,
+    *,
+    category: str | None = None,
+    include_sold: bool = False,
+) -> list[dict]:
+    """Coroutine behind :func:`_search_reverb`, run on the caller's *scraper*.
+
+    Lets ``--all`` mode search every model on one event loop and one
+    connection pool instead of one ``asyncio.run`` per model.
+    """
+    state = "all" if include_sold else "live"
+    raw = await scraper.search(query, category=category, state=state)
+
+    # One pass keyed on URL: order of first appearance, a listing repeated
+    # across pages (shifted while paging) keeps its latest copy.
+    unique = list({r["url"]: r for r in raw if r.get("url")}.values())
 
     for r in unique:
         r["_platform"] = "reverb"
@@ -395,6 +476,14 @@ def _search_ebay(
 # ---------------------------------------------------------------------------
 
 
+#: ``(x_listing field, scrape key)`` pairs that :func:`_compute_changes`
+#: overwrites whenever the scrape has a different, non-empty value.
+_TEXT_FIELDS = (
+    ("x_name", "name"),
+    ("x_studio_notes", "description"),
+)
+
+
 def _compute_changes(entry: ListingRecord, reverb: dict) -> dict[str, Any]:
     """Compare a single Odoo x_listing entry against scraped Reverb data.
 
@@ -408,10 +497,11 @@ def _compute_changes(entry: ListingRecord, reverb: dict) -> dict[str, Any]:
     offers = reverb.get("offers_enabled", False)
     published_at = reverb.get("published_at", "")
 
-    # Name
-    reverb_name = reverb.get("name", "")
-    if reverb_name and reverb_name != (entry.x_name or ""):
-        changes["x_name"] = reverb_name
+    # Text fields: overwrite whenever the scrape has a different, non-empty value
+    for field_name, key in _TEXT_FIELDS:
+        value = reverb.get(key, "")
+        if value and value != (getattr(entry, field_name) or ""):
+            changes[field_name] = value
 
     # Price — compare rounded to absorb CAD/USD conversion noise
     if price > 0 and _round_price(price) != _round_price(entry.x_price or 0):
@@ -437,12 +527,6 @@ def _compute_changes(entry: ListingRecord, reverb: dict) -> dict[str, Any]:
     if published_at and not entry.x_published_at:
         changes["x_published_at"] = published_at + " 00:00:00"
 
-    # Notes (description from Reverb)
-    description = reverb.get("description", "")
-    existing_notes = entry.x_studio_notes or ""
-    if description and description != existing_notes:
-        changes["x_studio_notes"] = description
-
     # Availability
     if sale_ended and entry.x_is_available is True:
         changes["x_is_available"] = False
@@ -505,6 +589,26 @@ def _is_brand_new(reverb: dict) -> bool:
     return reverb.get("condition", "").lower() == "brand new"
 
 
+@dataclass(slots=True)
+class ReportItem:
+    """One row of the sync report built by :func:`_build_report`."""
+
+    #: The scraped Reverb / eBay dict.
+    reverb: dict[str, Any] = field(default_factory=dict)
+    #: The matching ``ListingRecord``, or ``None`` for a new listing.
+    entry: ListingRecord | None = None
+    #: Field updates for ``"update"``.
+    changes: dict[str, Any] = field(default_factory=dict)
+    #: Full values dict for ``"create"``.
+    create_vals: dict[str, Any] = field(default_factory=dict)
+    #: Informational strings shown next to the row.
+    warnings: list[str] = field(default_factory=list)
+    #: ``"create"`` | ``"update"`` | ``"ok"`` | ``"skip"``
+    action: str = "skip"
+    #: Model id of a matched entry that belongs to a different model.
+    other_model_id: int | None = None
+
+
 def _build_report(
     reverb_results: list[dict],
     odoo_entries: list[ListingRecord],
@@ -512,17 +616,11 @@ def _build_report(
     default_shipping: float = DEFAULT_SHIPPING,
     *,
     include_brand_new: bool = False,
-) -> list[dict]:
+) -> list[ReportItem]:
     """Cross-reference Reverb search results against existing Odoo entries.
 
-    Each item in the returned list has:
-
-    - ``action``:  ``"create"`` | ``"update"`` | ``"ok"`` | ``"skip"``
-    - ``reverb``:  the scraped Reverb dict
-    - ``entry``:   the matching ``ListingRecord`` (or ``None`` for new)
-    - ``changes``: field updates for ``"update"``
-    - ``create_vals``: full values dict for ``"create"``
-    - ``warnings``: list of informational strings
+    Returns one :class:`ReportItem` per search result, whose ``action`` is
+    ``"create"``, ``"update"``, ``"ok"`` or ``"skip"``.
 
     Brand-new listings that do not already exist in Odoo are skipped by
     default.  Pass ``include_brand_new=True`` to create them as well.
@@ -530,8 +628,10 @@ def _build_report(
     odoo_by_url: dict[str, ListingRecord] = {}
     odoo_by_item_id: dict[str, ListingRecord] = {}
     odoo_by_ebay_id: dict[str, ListingRecord] = {}
+    # Query strings are stripped inline (same as _clean_url) — this loop and
+    # the one below run once per entry / result on every sync.
     for e in odoo_entries:
-        clean = _clean_url(e.x_url or "")
+        clean = (e.x_url or "").partition("?")[0]
         existing_url_match = odoo_by_url.get(clean)
         if existing_url_match is not None and existing_url_match.id != e.id:
             logger.warning(
@@ -549,26 +649,17 @@ def _build_report(
         if ebay_id and ebay_id not in odoo_by_ebay_id:
             odoo_by_ebay_id[ebay_id] = e
 
-    report: list[dict] = []
+    report: list[ReportItem] = []
 
     for r in reverb_results:
-        url = r.get("url", "")
-        item: dict[str, Any] = {
-            "reverb": r,
-            "entry": None,
-            "changes": {},
-            "create_vals": {},
-            "warnings": [],
-            "action": "skip",
-            "other_model_id": None,
-        }
-
         if "error" in r:
-            item["warnings"].append(f"Reverb API error: {r['error']}")
-            report.append(item)
+            report.append(ReportItem(reverb=r, warnings=[f"Reverb API error: {r['error']}"]))
             continue
 
-        existing = odoo_by_url.get(_clean_url(url))
+        url = r.get("url", "")
+        item = ReportItem(reverb=r)
+
+        existing = odoo_by_url.get(url.partition("?")[0])
         if not existing:
             item_id = _reverb_item_id(url)
             if item_id:
@@ -579,32 +670,32 @@ def _build_report(
                 existing = odoo_by_ebay_id.get(ebay_id)
 
         if existing:
-            item["entry"] = existing
-            item["changes"] = _compute_changes(existing, r)
-            item["action"] = "update" if item["changes"] else "ok"
+            item.entry = existing
+            item.changes = _compute_changes(existing, r)
+            item.action = "update" if item.changes else "ok"
             entry_model = existing.x_model_id
             entry_model_id = entry_model[0] if entry_model else None
             if entry_model_id is not None and entry_model_id != model_id:
-                item["other_model_id"] = entry_model_id
+                item.other_model_id = entry_model_id
                 logger.info(
                     "Cross-model match: listing id={} belongs to model id={}, updating in place",
                     existing.id,
                     entry_model_id,
                 )
         elif _is_brand_new(r) and not include_brand_new:
-            item["action"] = "skip"
-            item["warnings"].append("skipped: brand new")
+            item.action = "skip"
+            item.warnings.append("skipped: brand new")
         else:
-            item["create_vals"] = _listing_vals_from_scrape(
+            item.create_vals = _listing_vals_from_scrape(
                 r, model_id, default_shipping, platform=r.get("_platform", "reverb")
             )
-            item["action"] = "create"
+            item.action = "create"
 
         # Informational warnings
         if r.get("sale_ended"):
-            item["warnings"].append(f"status: {r.get('status', 'ended/sold')}")
+            item.warnings.append(f"status: {r.get('status', 'ended/sold')}")
         if r.get("ships_to_canada") is False and not r.get("sale_ended"):
-            item["warnings"].append("does NOT ship to Canada")
+            item.warnings.append("does NOT ship to Canada")
 
         report.append(item)
 
@@ -616,10 +707,24 @@ def _build_report(
 # ---------------------------------------------------------------------------
 
 
-def _print_report(report: list[dict]) -> tuple[int, int]:
-    """Print a rich sync report table.  Returns (update_count, create_count)."""
+def _count_actions(report: list[ReportItem]) -> Counter[str]:
+    """Tally the report items per ``action`` in a single pass."""
+    return Counter(item.action for item in report)
+
+
+def _print_report(
+    report: list[ReportItem], counts: Mapping[str, int] | None = None
+) -> tuple[int, int]:
+    """Print a rich sync report table.  Returns (update_count, create_count).
+
+    *counts* is the per-action tally of *report* (see :func:`_count_actions`);
+    it is computed here when the caller does not already have it.
+    """
     from rich.table import Table
 
+    if counts is None:
+        counts = _count_actions(report)
+
     table = Table(box=box.SIMPLE_HEAD, show_header=True, header_style="bold", highlight=False)
     table.add_column("#", style="dim", width=4, justify="right")
     table.add_column("Action", width=9)
@@ -627,52 +732,48 @@ def _print_report(report: list[dict]) -> tuple[int, int]:
     table.add_column("Name")
     table.add_column("Info", style="dim")
 
-    update_count = 0
-    create_count = 0
-
     for i, item in enumerate(report, 1):
-        r = item["reverb"]
+        r = item.reverb
         name = escape(r.get("name", "")[:54])
         price = escape(r.get("price_display", "") or "")
-        warnings = item["warnings"]
+        warnings = item.warnings
         warn_str = escape("; ".join(warnings)) if warnings else ""
 
-        if item["action"] == "create":
-            create_count += 1
+        if item.action == "create":
             table.add_row(str(i), "[bold green]+ NEW[/bold green]", price, name, warn_str)
-        elif item["action"] == "update":
-            update_count += 1
-            entry: ListingRecord = item["entry"]
+        elif item.action == "update":
+            entry: ListingRecord = item.entry
             eid = entry.id
-            other_model_id = item.get("other_model_id")
+            other_model_id = item.other_model_id
             cross = ""
             if other_model_id:
                 other_model_name = entry.x_model_id[1] if entry.x_model_id else ""
                 cross = f"  → model: {other_model_name} ({other_model_id})"
             info = escape(f"id={eid}{cross}  {warn_str}".strip())
             table.add_row(str(i), "[bold yellow]~ UPD[/bold yellow]", price, name, info)
-            for field, new_val in item["changes"].items():
-                old_val = getattr(entry, field, "—")
+            for field_name, new_val in item.changes.items():
+                old_val = getattr(entry, field_name, "—")
                 diff = (
-                    f"  [dim]{escape(field)}:[/dim]"
+                    f"  [dim]{escape(field_name)}:[/dim]"
                     f" {escape(str(old_val))} [dim]→[/dim] [bold]{escape(str(new_val))}[/bold]"
                 )
                 table.add_row("", "", "", diff, "")
-        elif item["action"] == "ok":
+        elif item.action == "ok":
             pass  # counted in summary; not shown to reduce noise
         else:
             table.add_row(str(i), "[dim]⚠ SKIP[/dim]", price, name, warn_str)
 
-    _console.print()
-    _console.print(table)
-    skip_count = sum(1 for item in report if item["action"] == "skip")
-    ok_count = len(report) - update_count - create_count - skip_count
-    _console.print(
+    update_count = counts["update"]
+    create_count = counts["create"]
+    ok_count = len(report) - update_count - create_count - counts["skip"]
+    summary = (
         f"  Total: [bold]{len(report)}[/bold]"
         f"  Up to date: [green]{ok_count}[/green]"
         f"  Update: [yellow]{update_count}[/yellow]"
         f"  New: [bold green]{create_count}[/bold green]"
     )
+    # One print call → one render and one write for the whole report
+    _console.print("", table, summary, sep="\n")
     return update_count, create_count
 
 
@@ -681,7 +782,7 @@ def _print_report(report: list[dict]) -> tuple[int, int]:
 # ---------------------------------------------------------------------------
 
 
-def _apply_updates(conn, report: list[dict]) -> tuple[int, int]:
+def _apply_updates(conn, report: list[ReportItem]) -> tuple[int, int]:
     """Write changes (updates + creates) to Odoo.
 
     For **creates**, an ``x_listing`` record is created with all marketplace
@@ -691,25 +792,35 @@ def _apply_updates(conn, report: list[dict]) -> tuple[int, int]:
     For **updates**, the ``x_listing`` record is updated directly.  The image
     is only downloaded when the existing record has no image yet.
 
+    Updates carrying identical changes are sent as one multi-id ``write``
+    and all creates as one multi-record ``create``.  If a batched call
+    fails, its records are retried one by one so a single bad row does not
+    sink the rest; rows that still fail are logged and, once every other
+    row has been written, the first of their errors is re-raised.  A batched
+    ``create`` is only retried when Odoo rejected it with a JSON-RPC error:
+    after a transport error or timeout the batch may already be committed,
+    so the error propagates rather than risk duplicate listings.
+
     Returns (updated, created).
     """
     listing_model = conn.get_model("x_listing")
 
     # Pre-check: which listing entries being updated lack an image?
-    update_ids = [item["entry"].id for item in report if item["action"] == "update"]
+    update_ids = [item.entry.id for item in report if item.action == "update"]
     ids_without_image = _find_entries_without_image(conn, update_ids)
 
-    updated = 0
-    created = 0
+    # changes (as a hashable key) → ids sharing exactly those changes
+    write_groups: dict[tuple, list[int]] = {}
+    create_vals: list[dict[str, Any]] = []
 
     for item in report:
-        if item["action"] == "update":
-            eid = item["entry"].id
-            changes = dict(item["changes"])
+        if item.action == "update":
+            eid = item.entry.id
+            changes = dict(item.changes)
 
             # Download image if the listing has no image yet
             if eid in ids_without_image:
-                photo_url = item.get("reverb", {}).get("photo_url", "")
+                photo_url = item.reverb.get("photo_url", "")
                 image_b64 = _download_image_base64(photo_url)
                 if image_b64:
                     changes["x_studio_image"] = image_b64
@@ -718,26 +829,71 @@ def _apply_updates(conn, report: list[dict]) -> tuple[int, int]:
             # Log changes without the (potentially huge) image blob
             log_changes = {k: v for k, v in changes.items() if k != "x_studio_image"}
             logger.info("Updating listing id={}: {}", eid, log_changes)
-            listing_model.write(eid, changes)
-            updated += 1
+            write_groups.setdefault(tuple(sorted(changes.items())), []).append(eid)
 
-        elif item["action"] == "create":
-            listing_vals = dict(item["create_vals"])
+        elif item.action == "create":
+            listing_vals = dict(item.create_vals)
 
             # Download image
-            photo_url = item.get("reverb", {}).get("photo_url", "")
+            photo_url = item.reverb.get("photo_url", "")
             image_b64 = _download_image_base64(photo_url)
             if image_b64:
                 listing_vals["x_studio_image"] = image_b64
+            create_vals.append(listing_vals)
 
-            listing_id = listing_model.create(listing_vals)
-            if image_b64:
+    failures: list[Exception] = []
+    updated = 0
+    for key, ids in write_groups.items():
+        changes = dict(key)
+        try:
+            listing_model.write(ids, changes)
+            updated += len(ids)
+        except Exception as e:  # noqa: BLE001 — retry row by row below
+            logger.warning("Batched write of {} listing(s) failed ({}); retrying", len(ids), e)
+            for eid in ids:
+                try:
+                    listing_model.write([eid], changes)
+                    updated += 1
+                except Exception as row_error:  # noqa: BLE001 — keep the other rows going
+                    logger.error("Failed to update listing id={}: {}", eid, row_error)
+                    failures.append(row_error)
+
+    created = 0
+    if create_vals:
+        try:
+            new_ids = listing_model.create(create_vals)
+            created_pairs = list(zip(new_ids, create_vals, strict=True))
+        except JsonRPCException as e:
+            logger.warning(
+                "Batched create of {} listing(s) failed ({}); retrying", len(create_vals), e
+            )
+            created_pairs = []
+            for listing_vals in create_vals:
+                try:
+                    created_pairs.append((listing_model.create([listing_vals])[0], listing_vals))
+                except Exception as row_error:  # noqa: BLE001 — keep the other rows going
+                    logger.error(
+                        "Failed to create listing {}: {}",
+                        listing_vals.get("x_name", "")[:50],
+                        row_error,
+                    )
+                    failures.append(row_error)
+        for listing_id, listing_vals in created_pairs:
+            if "x_studio_image" in listing_vals:
                 logger.info("  ↳ downloaded image for listing id={}", listing_id)
             logger.success(
                 "Created listing id={}: {}", listing_id, listing_vals.get("x_name", "")[:50]
             )
-            created += 1
-
+        created = len(created_pairs)
+
+    if failures:
+        logger.error(
+            "{} listing write(s) failed ({} updated, {} created)",
+            len(failures),
+            updated,
+            created,
+        )
+        raise failures[0]
     return updated, created
 
 
@@ -786,47 +942,86 @@ def _collect_sync_data(
     - ``odoo_entries`` – existing Odoo guitar records
     - ``report`` – cross-reference report list
     - ``update_count``, ``create_count`` – action tallies
+    - ``action_counts`` – full per-action tally (:func:`_count_actions`)
     """
     query = search_query or model_name
     enabled = platforms if platforms is not None else list(PLATFORMS.keys())
 
     logger.debug("[{}] Searching {} for '{}'…", model_name, "/".join(enabled), query)
-    all_results: list[dict] = []
+    search_fns = []
     for platform_name in enabled:
         fn = PLATFORMS.get(platform_name)
         if fn is None:
             logger.warning("Unknown platform '{}', skipping", platform_name)
             continue
-        results = fn(
-            query,
-            category=category_slug,
-            default_shipping=default_shipping,
-            include_sold=include_sold,
-        )
-        all_results.extend(results)
+        search_fns.append(fn)
+
+    # Each platform search runs its own event loop and HTTP client, so they
+    # can overlap in threads; results keep the platform order.
+    kwargs = {
+        "category": category_slug,
+        "default_shipping": default_shipping,
+        "include_sold": include_sold,
+    }
+    all_results: list[dict] = []
+    if len(search_fns) > 1:
+        with ThreadPoolExecutor(max_workers=len(search_fns)) as pool:
+            futures = [pool.submit(fn, query, **kwargs) for fn in search_fns]
+            for future in futures:
+                all_results.extend(future.result())
+    else:
+        for fn in search_fns:
+            all_results.extend(fn(query, **kwargs))
 
     if not all_results:
         logger.warning("[{}] No results for '{}'", model_name, query)
-        return {
-            "model_id": model_id,
-            "model_name": model_name,
-            "default_shipping": default_shipping,
-            "reverb_results": [],
-            "odoo_entries": [],
-            "report": [],
-            "update_count": 0,
-            "create_count": 0,
-        }
-
-    logger.debug("[{}] Fetching existing Odoo listing records…", model_name)
-    url_candidates: set[str] = set()
-    for r in all_results:
-        raw = r.get("url", "")
-        if not raw:
-            continue
-        url_candidates.add(raw)
-        url_candidates.add(_clean_url(raw))
-    odoo_entries = _fetch_listings(conn, model_id, extra_urls=list(url_candidates))
+        return _empty_sync_data(model_id, model_name, default_shipping)
+
+    return _build_sync_data(
+        conn,
+        all_results,
+        model_id=model_id,
+        model_name=model_name,
+        default_shipping=default_shipping,
+        include_brand_new=include_brand_new,
+    )
+
+
+def _empty_sync_data(model_id: int, model_name: str, default_shipping: float) -> dict[str, Any]:
+    """Return the :func:`_collect_sync_data` result for a model with no results."""
+    return {
+        "model_id": model_id,
+        "model_name": model_name,
+        "default_shipping": default_shipping,
+        "reverb_results": [],
+        "odoo_entries": [],
+        "report": [],
+        "update_count": 0,
+        "create_count": 0,
+        "action_counts": Counter(),
+    }
+
+
+def _build_sync_data(
+    conn,
+    all_results: list[dict],
+    *,
+    model_id: int,
+    model_name: str,
+    default_shipping: float,
+    include_brand_new: bool = False,
+    odoo_entries: list[ListingRecord] | None = None,
+) -> dict[str, Any]:
+    """Fetch the Odoo entries matching *all_results* and build the report.
+
+    This is the Odoo half of :func:`_collect_sync_data`, once the
+    marketplace searches are done.  Pass *odoo_entries* when they were
+    already fetched (see :func:`_fetch_listings_bulk`) to skip the query.
+    """
+    if odoo_entries is None:
+        logger.debug("[{}] Fetching existing Odoo listing records…", model_name)
+        url_candidates = _url_candidates(all_results)
+        odoo_entries = _fetch_listings(conn, model_id, extra_urls=list(url_candidates))
     logger.debug("[{}] Found {} existing listing records", model_name, len(odoo_entries))
 
     report = _build_report(
@@ -836,8 +1031,7 @@ def _collect_sync_data(
         default_shipping,
         include_brand_new=include_brand_new,
     )
-    update_count = sum(1 for item in report if item["action"] == "update")
-    create_count = sum(1 for item in report if item["action"] == "create")
+    counts = _count_actions(report)
 
     return {
         "model_id": model_id,
@@ -846,11 +1040,159 @@ def _collect_sync_data(
         "reverb_results": all_results,
         "odoo_entries": odoo_entries,
         "report": report,
-        "update_count": update_count,
-        "create_count": create_count,
+        "update_count": counts["update"],
+        "create_count": counts["create"],
+        "action_counts": counts,
     }
 
 
+#: ``(query, category slug, default shipping)`` — the inputs of one
+#: marketplace search in :func:`_collect_all_async`.
+_SearchKey = tuple[str, str | None, float]
+
+
+def _print_collect_error(model_info: dict[str, Any]) -> None:
+    """Report that collecting *model_info*'s sync data failed."""
+    _console.print(
+        f"  [bold red]✗[/bold red] [red]Error collecting data for"
+        f" '{escape(model_info['name'])}' (id={model_info['id']})[/red]"
+    )
+
+
+async def _collect_all_async(
+    conn,
+    all_model_info: list[dict[str, Any]],
+    *,
+    workers: int,
+    search_query: str | None = None,
+    include_brand_new: bool = False,
+    include_sold: bool = False,
+    platforms: list[str] | None = None,
+    on_done: Callable[[], None] | None = None,
+) -> list[dict[str, Any]]:
+    """Collect sync data for every model in *all_model_info* on one event loop.
+
+    All Reverb searches share a single HTTP connection pool, with at most
+    *workers* searches in flight at once.  Other platforms run in threads
+    via :func:`asyncio.to_thread` so they overlap with Reverb I/O.  Once
+    the searches are done, the existing ``x_listing`` rows are read in one
+    query (:func:`_fetch_listings_bulk`) — only for models that got
+    results, plus cross-model rows matched by URL.
+
+    Models with the same search inputs (query, category and default
+    shipping — e.g. every model when *search_query* is given) share a
+    single search.
+
+    A model whose search, ``x_listing`` read or report build raises gets
+    an empty result instead of aborting the batch.  *on_done* is called
+    once per model.
+
+    Returns one :func:`_collect_sync_data`-shaped dict per model, in the
+    order of *all_model_info*.
+    """
+    enabled = platforms if platforms is not None else list(PLATFORMS.keys())
+    semaphore = asyncio.Semaphore(workers)
+
+    keys: list[_SearchKey] = [
+        (search_query or mi["name"], mi["category_slug"], mi["default_shipping"])
+        for mi in all_model_info
+    ]
+    models_by_key: dict[_SearchKey, list[dict[str, Any]]] = {}
+    for key, mi in zip(keys, all_model_info, strict=True):
+        models_by_key.setdefault(key, []).append(mi)
+
+    async with ReverbScraper(currency="CAD", shipping_region="CA") as shared:
+
+        async def _search(key: _SearchKey, models: list[dict[str, Any]]) -> list[dict] | None:
+            query, category, default_shipping = key
+            try:
+                async with semaphore:
+                    legs = []
+                    for platform_name in enabled:
+                        if platform_name == "reverb":
+                            scraper = ReverbScraper(
+                                currency="CAD",
+                                shipping_region="CA",
+                                default_shipping=f"{default_shipping:.2f}",
+                                client=shared.client,
+                            )
+                            legs.append(
+                                _search_reverb_async(
+                                    scraper, query, category=category, include_sold=include_sold
+                                )
+                            )
+                        elif platform_name in PLATFORMS:
+                            legs.append(
+                                asyncio.to_thread(
+                                    PLATFORMS[platform_name],
+                                    query,
+                                    category=category,
+                                    default_shipping=default_shipping,
+                                    include_sold=include_sold,
+                                )
+                            )
+                        else:
+                            logger.warning("Unknown platform '{}', skipping", platform_name)
+                    all_results = [r for results in await asyncio.gather(*legs) for r in results]
+                    if not all_results:
+                        for mi in models:
+                            logger.warning("[{}] No results for '{}'", mi["name"], query)
+                    return all_results
+            # catch all to avoid crashing the whole batch
+            # It is hard to predict what might go wrong in the scraping phase,
+            # and we want to continue processing other models even if one fails.
+            except Exception:  # noqa
+                for mi in models:
+                    _print_collect_error(mi)
+                return None
+            finally:
+                if on_done is not None:
+                    for _ in models:
+                        on_done()
+
+        # A task group rather than gather: if anything escapes _search's own
+        # error handling (e.g. Ctrl-C), the remaining searches are cancelled
+        # before the shared client is closed instead of being left running.
+        async with asyncio.TaskGroup() as tg:
+            tasks = {k: tg.create_task(_search(k, ms)) for k, ms in models_by_key.items()}
+    searched = [tasks[key].result() for key in keys]
+
+    # Models without results never look at their rows, so leave them out.
+    active_ids = [mi["id"] for mi, results in zip(all_model_info, searched, strict=True) if results]
+    urls_by_model = [_url_candidates(results or []) for results in searched]
+    # Same isolation as the searches: a failed read costs the models that
+    # needed it their data, not the whole run.
+    try:
+        entries = await asyncio.to_thread(
+            _fetch_listings_bulk, conn, active_ids, list(set().union(*urls_by_model))
+        )
+    except Exception:  # noqa
+        for mi, results in zip(all_model_info, searched, strict=True):
+            if results:
+                _print_collect_error(mi)
+        searched = [None] * len(searched)
+        entries = []
+
+    collected: list[dict[str, Any]] = []
+    for mi, results, urls in zip(all_model_info, searched, urls_by_model, strict=True):
+        data = None
+        if results:
+            try:
+                data = _build_sync_data(
+                    conn,
+                    results,
+                    model_id=mi["id"],
+                    model_name=mi["name"],
+                    default_shipping=mi["default_shipping"],
+                    include_brand_new=include_brand_new,
+                    odoo_entries=_listings_for_model(entries, mi["id"], urls),
+                )
+            except Exception:  # noqa
+                _print_collect_error(mi)
+        collected.append(data or _empty_sync_data(mi["id"], mi["name"], mi["default_shipping"]))
+    return collected
+
+
 @click.command("sync")
 @click.argument("model_name", required=False, default=None)
 @click.option("--all", "all_models", is_flag=True, help="Sync every model in the database.")
@@ -890,7 +1232,7 @@ def _collect_sync_data(
     type=int,
     default=DEFAULT_WORKERS,
     show_default=True,
-    help="Number of worker threads for --all mode.",
+    help="Number of models searched concurrently in --all mode.",
 )
 @click.option(
     "--platform",
@@ -951,7 +1293,7 @@ def cli(
 
     conn = ctx.obj["conn"]
 
-    # --all: sync every model in the database (multi-threaded) -----------------
+    # --all: sync every model in the database (concurrently) ------------------
     if all_models:
         all_model_info = _fetch_all_models(conn, wanna_only=wanna)
         if not all_model_info:
@@ -960,13 +1302,12 @@ def cli(
 
         n_workers = min(workers, len(all_model_info))
         logger.info(
-            "Syncing {} model(s) with {} worker thread(s)…",
+            "Syncing {} model(s), {} at a time…",
             len(all_model_info),
             n_workers,
         )
 
-        # Phase 1 — collect data in parallel (I/O-heavy) ----------------------
-        collected: list[dict[str, Any]] = [{}] * len(all_model_info)
+        # Phase 1 — collect data concurrently (I/O-heavy) ---------------------
         with Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
@@ -979,46 +1320,18 @@ def cli(
                 f"[cyan]Fetching Reverb data[/cyan] ({n_workers} workers)…",
                 total=len(all_model_info),
             )
-            with ThreadPoolExecutor(max_workers=n_workers) as pool:
-                future_to_idx = {
-                    pool.submit(
-                        _collect_sync_data,
-                        conn,
-                        model_id=mi["id"],
-                        model_name=mi["name"],
-                        category_slug=mi["category_slug"],
-                        default_shipping=mi["default_shipping"],
-                        search_query=search_query,
-                        include_brand_new=include_brand_new,
-                        include_sold=include_sold,
-                        platforms=selected_platforms,
-                    ): idx
-                    for idx, mi in enumerate(all_model_info)
-                }
-                for future in as_completed(future_to_idx):
-                    idx = future_to_idx[future]
-                    try:
-                        collected[idx] = future.result()
-                    # catch all to avoid crashing the whole batch
-                    # It is hard to predict what might go wrong in the scraping phase,
-                    # and we want to continue processing other models even if one fails.
-                    except Exception:  # noqa
-                        mi = all_model_info[idx]
-                        _console.print(
-                            f"  [bold red]✗[/bold red] [red]Error collecting data for"
-                            f" '{escape(mi['name'])}' (id={mi['id']})[/red]"
-                        )
-                        collected[idx] = {
-                            "model_id": mi["id"],
-                            "model_name": mi["name"],
-                            "default_shipping": mi["default_shipping"],
-                            "reverb_results": [],
-                            "odoo_entries": [],
-                            "report": [],
-                            "update_count": 0,
-                            "create_count": 0,
-                        }
-                    progress.advance(task)
+            collected = asyncio.run(
+                _collect_all_async(
+                    conn,
+                    all_model_info,
+                    workers=n_workers,
+                    search_query=search_query,
+                    include_brand_new=include_brand_new,
+                    include_sold=include_sold,
+                    platforms=selected_platforms,
+                    on_done=lambda: progress.advance(task),
+                )
+            )
 
         # Phase 2 — print reports & apply updates sequentially -----------------
         total_updated = 0
@@ -1031,7 +1344,7 @@ def cli(
                 if not data["report"]:
                     note = "[dim]no Reverb results[/dim]"
                 else:
-                    ok_count = sum(1 for item in data["report"] if item["action"] == "ok")
+                    ok_count = data["action_counts"]["ok"]
                     note = f"[dim]{ok_count} listing(s) up to date[/dim]"
                 _console.print(
                     f"  [dim][{i}/{len(collected)}][/dim]  {escape(data['model_name'])}"
@@ -1045,7 +1358,7 @@ def cli(
                 f"  [dim](id={data['model_id']})[/dim]"
             )
 
-            update_count, create_count = _print_report(data["report"])
+            update_count, create_count = _print_report(data["report"], data["action_counts"])
             total_actions = update_count + create_count
 
             if dry_run:
@@ -1111,7 +1424,7 @@ def cli(
         return
 
     # 4. Compare ----------------------------------------------------------------
-    update_count, create_count = _print_report(data["report"])
+    update_count, create_count = _print_report(data["report"], data["action_counts"])
 
     total_actions = update_count + create_count
     if total_actions == 0:
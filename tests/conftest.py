@@ -4,6 +4,7 @@ from pathlib import Path
 
 import pytest
 
+import reverb_scraper
 from reverb_scraper import ReverbScraper
 
 CASSETTE_DIR = Path(__file__).parent / "cassettes"
@@ -27,3 +28,11 @@ def vcr_config():
 def scraper() -> ReverbScraper:
     """Return a ReverbScraper configured for CAD / Canada."""
     return ReverbScraper(currency="CAD", shipping_region="CA")
+
+
+@pytest.fixture(autouse=True)
+def _clear_listing_cache():
+    """Keep ReverbScraper's in-process listing cache from leaking between tests."""
+    reverb_scraper._LISTING_CACHE.clear()
+    yield
+    reverb_scraper._LISTING_CACHE.clear()
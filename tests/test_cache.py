@@ -151,6 +151,14 @@ def test_clear_all_drops_connection_cache() -> None:
     assert config._conn_fetched_at is None
 
 
+def test_clear_all_drops_pooled_connections() -> None:
+    from odoo_connector import get_connection
+
+    with patch.object(get_connection, "cache_clear") as cache_clear:
+        clear_all()
+    cache_clear.assert_called_once_with()
+
+
 def test_clear_all_returns_summary_string() -> None:
     result = clear_all()
     assert isinstance(result, str)
@@ -0,0 +1,24 @@
+"""Tests for the unified reverb2odoo CLI group."""
+
+import pytest
+
+from cli import SUBCOMMANDS, main
+
+
+def test_lists_every_subcommand():
+    assert main.list_commands(None) == sorted(SUBCOMMANDS)
+
+
+@pytest.mark.parametrize(
+    "name, module",
+    [pytest.param(name, path.split(":")[0], id=name) for name, path in SUBCOMMANDS.items()],
+)
+def test_subcommand_resolves_lazily(name: str, module: str):
+    command = main.get_command(None, name)
+
+    assert command.name == name
+    assert command.callback.__module__ == module
+
+
+def test_unknown_subcommand():
+    assert main.get_command(None, "nope") is None
@@ -1,16 +1,30 @@
 """Tests for odoo_connector helper functions."""
 
-from unittest.mock import MagicMock
+import gc
+import json
+import time
+from unittest.mock import MagicMock, patch
 
+import httpx
 import pytest
+from odoolib.tools import JsonRPCException
 
 from models import ListingRecord
 from odoo_connector import (
+    CONNECTION_TTL_SECONDS,
     GUITAR_FIELDS,
     _extract_reverb_item_id,
     _hostname_from_url,
+    _PooledJsonRPCConnector,
+    batch_rpc,
     find_guitar_by_url,
+    find_guitars_by_urls,
     find_listing_by_url,
+    get_connection,
+    get_model_fields,
+    iter_search_read,
+    model_of,
+    search_read_all,
 )
 
 # ── _hostname_from_url ────────────────────────────────────────────────────
@@ -32,12 +46,141 @@ from odoo_connector import (
             id="bare-hostname-with-path",
         ),
         pytest.param("10.0.0.1", "10.0.0.1", id="bare-ip"),
+        pytest.param("https://MyDB.Odoo.com?db=x", "mydb.odoo.com", id="query-no-path"),
+        pytest.param("https://user:pw@mydb.odoo.com:443/odoo", "mydb.odoo.com", id="userinfo"),
+        pytest.param("http://[::1]:8069/odoo", "::1", id="ipv6-with-port"),
+        pytest.param("https://[2001:DB8::1]", "2001:db8::1", id="ipv6-no-port"),
     ],
 )
 def test_hostname_from_url(raw: str, expected: str):
     assert _hostname_from_url(raw) == expected
 
 
+# ── get_connection / pooled connector ─────────────────────────────────────
+
+
+class TestGetConnectionCache:
+    """Unit tests for get_connection and its per-process connection cache."""
+
+    @pytest.fixture(autouse=True)
+    def _clear_cache(self):
+        get_connection.cache_clear()
+        yield
+        get_connection.cache_clear()
+
+    @pytest.mark.parametrize(
+        "hostname, expected_url",
+        [
+            pytest.param(
+                "https://mydb.odoo.com/odoo", "https://mydb.odoo.com:443/jsonrpc", id="https"
+            ),
+            pytest.param("localhost", "http://localhost:8069/jsonrpc", id="bare-host"),
+        ],
+    )
+    def test_uses_pooled_connector(self, hostname: str, expected_url: str):
+        conn = get_connection(hostname, "db", "user", "pw")
+
+        assert isinstance(conn.connector, _PooledJsonRPCConnector)
+        assert conn.connector.url == expected_url
+
+    def test_same_credentials_reuse_connection(self):
+        first = get_connection("https://mydb.odoo.com", "db", "user", "pw")
+
+        assert get_connection("https://mydb.odoo.com/odoo", "db", "user", "pw") is first
+
+    @pytest.mark.parametrize(
+        "hostname, database, login, password",
+        [
+            pytest.param("http://mydb.odoo.com", "db", "user", "pw", id="other-protocol"),
+            pytest.param("https://mydb.odoo.com", "other", "user", "pw", id="other-database"),
+            pytest.param("https://mydb.odoo.com", "db", "other", "pw", id="other-login"),
+            pytest.param("https://mydb.odoo.com", "db", "user", "new-pw", id="other-password"),
+        ],
+    )
+    def test_changed_credentials_reconnect(
+        self, hostname: str, database: str, login: str, password: str
+    ):
+        first = get_connection("https://mydb.odoo.com", "db", "user", "pw")
+
+        assert get_connection(hostname, database, login, password) is not first
+
+    def test_expired_entry_reconnects(self, monkeypatch: pytest.MonkeyPatch):
+        first = get_connection("https://mydb.odoo.com", "db", "user", "pw")
+        later = time.monotonic() + CONNECTION_TTL_SECONDS + 1
+        monkeypatch.setattr("odoo_connector.time.monotonic", lambda: later)
+
+        assert get_connection("https://mydb.odoo.com", "db", "user", "pw") is not first
+
+    def test_refresh_bypasses_cache(self):
+        first = get_connection("https://mydb.odoo.com", "db", "user", "pw")
+
+        second = get_connection("https://mydb.odoo.com", "db", "user", "pw", refresh=True)
+
+        assert second is not first
+        assert get_connection("https://mydb.odoo.com", "db", "user", "pw") is second
+
+    def test_replaced_entry_keeps_pool_open_while_held(self, monkeypatch: pytest.MonkeyPatch):
+        first = get_connection("https://mydb.odoo.com", "db", "user", "pw")
+        later = time.monotonic() + CONNECTION_TTL_SECONDS + 1
+        monkeypatch.setattr("odoo_connector.time.monotonic", lambda: later)
+
+        get_connection("https://mydb.odoo.com", "db", "user", "pw")
+
+        assert not first.connector.client.is_closed
+
+    def test_cache_clear_closes_pool_once_released(self):
+        conn = get_connection("https://mydb.odoo.com", "db", "user", "pw")
+        client = conn.connector.client
+
+        get_connection.cache_clear()
+
+        assert not client.is_closed
+        assert get_connection("https://mydb.odoo.com", "db", "user", "pw") is not conn
+        del conn
+        gc.collect()
+        assert client.is_closed
+
+
+class TestPooledJsonRPCConnector:
+    """Unit tests for the keep-alive JSON-RPC connector."""
+
+    @staticmethod
+    def _connector(body: dict, seen: list[dict]) -> _PooledJsonRPCConnector:
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(json.loads(request.content))
+            return httpx.Response(200, json=body)
+
+        client = httpx.Client(transport=httpx.MockTransport(handler))
+        return _PooledJsonRPCConnector("http://odoo.test/jsonrpc", client)
+
+    def test_send_returns_result(self):
+        seen: list[dict] = []
+        connector = self._connector({"jsonrpc": "2.0", "id": 1, "result": 7}, seen)
+
+        assert connector.send("common", "login", "db", "user", "pw") == 7
+        assert seen[0]["method"] == "call"
+        assert seen[0]["params"] == {
+            "service": "common",
+            "method": "login",
+            "args": ["db", "user", "pw"],
+        }
+
+    def test_send_raises_on_error(self):
+        connector = self._connector({"jsonrpc": "2.0", "id": 1, "error": {"code": 200}}, [])
+
+        with pytest.raises(JsonRPCException):
+            connector.send("object", "execute_kw")
+
+    def test_requests_share_one_client(self):
+        seen: list[dict] = []
+        connector = self._connector({"jsonrpc": "2.0", "id": 1, "result": True}, seen)
+
+        connector.send("common", "version")
+        connector.send("common", "version")
+
+        assert [req["id"] for req in seen] == [1, 2]
+
+
 # ── _extract_reverb_item_id ───────────────────────────────────────────────
 
 
@@ -64,6 +207,16 @@ def test_hostname_from_url(raw: str, expected: str):
             "94370297",
             id="trailing-backtick",
         ),
+        pytest.param(
+            "https://reverb.com/item/94370297",
+            "94370297",
+            id="id-without-slug",
+        ),
+        pytest.param(
+            "https://reverb.com/item/94370297?show_sold=true",
+            "94370297",
+            id="id-with-query-string",
+        ),
         pytest.param(
             "https://www.kijiji.ca/v-guitar/city-of-toronto/something/123456",
             None,
@@ -84,6 +237,31 @@ def test_hostname_from_url(raw: str, expected: str):
             None,
             id="bare-hostname",
         ),
+        pytest.param(
+            "https://reverb.com/ca/item/94370297-godin",
+            "94370297",
+            id="localized-reverb-url",
+        ),
+        pytest.param(
+            "https://reverb.com/item/94370297/",
+            "94370297",
+            id="trailing-slash",
+        ),
+        pytest.param(
+            "https://reverb.com/item/94370297#photos",
+            "94370297",
+            id="id-with-fragment",
+        ),
+        pytest.param(
+            "https://reverb.com/item/94370297abc",
+            None,
+            id="digits-run-into-letters",
+        ),
+        pytest.param(
+            "https://reverb.com/item/",
+            None,
+            id="empty-item-segment",
+        ),
     ],
 )
 def test_extract_reverb_item_id(url: str, expected: str | None):
@@ -93,37 +271,110 @@ def test_extract_reverb_item_id(url: str, expected: str | None):
 # ── find_guitar_by_url ────────────────────────────────────────────────────
 
 
-def _make_mock_conn(search_read_side_effect):
-    """Build a mock ``odoolib`` connection whose model responds to search_read."""
-    conn = MagicMock()
-    model = MagicMock()
-    model.search_read.side_effect = search_read_side_effect
-    conn.get_model.return_value = model
-    return conn, model
+class _FakeModel:
+    """Stand-in for an ``odoolib`` model proxy over an in-memory table.
+
+    Plain attributes instead of ``MagicMock`` — these lookups are called
+    many times per test.  ``search_read`` understands the ``=``, ``in`` and
+    ``ilike`` leaves the lookups send, prefix ``"|"`` operators, plus
+    ``order="id"`` and ``limit``.
+    """
+
+    def __init__(self, records: list[dict]):
+        self.records = records
+        self.search_read_calls: list[tuple[tuple, dict]] = []
+
+    @staticmethod
+    def _matches(record: dict, leaf: tuple) -> bool:
+        name, op, value = leaf
+        field_value = record.get(name)
+        if op == "=":
+            return field_value == value
+        if op == "in":
+            return field_value in value
+        assert op == "ilike"
+        return value.lower() in (field_value or "").lower()
+
+    @classmethod
+    def _eval(cls, record: dict, domain: list) -> tuple[bool, list]:
+        """Evaluate the first term of prefix-notation *domain*; return the rest."""
+        head, *rest = domain
+        if head == "|":
+            left, rest = cls._eval(record, rest)
+            right, rest = cls._eval(record, rest)
+            return left or right, rest
+        return cls._matches(record, head), rest
+
+    @classmethod
+    def _filter(cls, record: dict, domain: list) -> bool:
+        while domain:
+            matched, domain = cls._eval(record, domain)
+            if not matched:
+                return False
+        return True
+
+    def search_read(self, domain, fields, *, limit=None, order=None):
+        self.search_read_calls.append(((domain, fields), {"limit": limit, "order": order}))
+        rows = [r for r in self.records if self._filter(r, domain)]
+        if order == "id":
+            rows.sort(key=lambda r: r["id"])
+        return rows[:limit] if limit else rows
+
+
+class _FakeConn:
+    """Stand-in for an ``odoolib`` connection serving one :class:`_FakeModel`.
+
+    Also answers the ``object`` service that :func:`batch_rpc` goes through.
+    """
+
+    database, user_id, password = "db", 2, "pw"
+
+    def __init__(self, model: _FakeModel):
+        self._model = model
+        self.get_model_calls: list[str] = []
+
+    def get_model(self, name: str) -> _FakeModel:
+        self.get_model_calls.append(name)
+        return self._model
+
+    def check_login(self, force: bool) -> None:
+        pass
+
+    def get_service(self, name: str) -> "_FakeConn":
+        return self
+
+    def execute_kw(self, db, uid, password, model_name, method, args, kwargs):
+        return getattr(self._model, method)(*args, **kwargs)
+
+
+def _make_mock_conn(records: list[dict]):
+    """Build a fake ``odoolib`` connection whose model holds *records*."""
+    model = _FakeModel(records)
+    return _FakeConn(model), model
 
 
 class TestFindGuitarByUrl:
     """Unit tests for find_guitar_by_url (no real Odoo connection)."""
 
     def test_exact_match(self):
-        record = {"id": 1884, "x_name": "Godin Stadium HT"}
-        conn, model = _make_mock_conn(lambda *a, **kw: [record])
+        url = "https://reverb.com/item/94370297-godin"
+        record = {"id": 1884, "x_name": "Godin Stadium HT", "x_studio_url": url}
+        conn, model = _make_mock_conn([record])
 
-        result = find_guitar_by_url(conn, "https://reverb.com/item/94370297-godin")
+        result = find_guitar_by_url(conn, url)
 
         assert result == record
-        conn.get_model.assert_called_once_with("x_guitar")
+        assert conn.get_model_calls == ["x_guitar"]
         # Only one call needed (exact match found on first try)
-        assert model.search_read.call_count == 1
+        assert len(model.search_read_calls) == 1
 
     def test_fallback_to_partial_match(self):
-        record = {"id": 42, "x_name": "Some Guitar"}
-        # First call (exact) returns nothing; second call (partial) returns hit
-        conn, model = _make_mock_conn(
-            lambda domain, *a, **kw: [record] if ("ilike",) and domain[0][2] == "94370297" else [],
-        )
-        # Override to distinguish the two calls
-        model.search_read.side_effect = [[], [record]]
+        record = {
+            "id": 42,
+            "x_name": "Some Guitar",
+            "x_studio_url": "https://reverb.com/item/94370297-godin-stadium-ht-2022",
+        }
+        conn, model = _make_mock_conn([record])
 
         result = find_guitar_by_url(
             conn,
@@ -131,10 +382,33 @@ class TestFindGuitarByUrl:
         )
 
         assert result == record
-        assert model.search_read.call_count == 2
+        assert len(model.search_read_calls) == 1
+        (domain, _), kwargs = model.search_read_calls[-1]
+        assert domain == [
+            "|",
+            ("x_studio_url", "in", ["https://reverb.com/item/94370297-godin-stadium-ht"]),
+            ("x_studio_url", "ilike", "/item/94370297"),
+        ]
+        assert kwargs == {"limit": 2, "order": "id"}
+
+    def test_exact_match_preferred_over_partial(self):
+        url = "https://reverb.com/item/94370297-godin"
+        partial = {"id": 1, "x_studio_url": "https://reverb.com/item/94370297-old-slug"}
+        exact = {"id": 2, "x_studio_url": url}
+        conn, model = _make_mock_conn([partial, exact])
+
+        assert find_guitar_by_url(conn, url) == exact
+        assert len(model.search_read_calls) == 1
+
+    def test_oldest_partial_match_wins(self):
+        newer = {"id": 9, "x_studio_url": "https://reverb.com/item/94370297-b"}
+        older = {"id": 3, "x_studio_url": "https://reverb.com/item/94370297-a"}
+        conn, _ = _make_mock_conn([newer, older])
+
+        assert find_guitar_by_url(conn, "https://reverb.com/item/94370297-c") == older
 
     def test_no_match_returns_none(self):
-        conn, model = _make_mock_conn(lambda *a, **kw: [])
+        conn, model = _make_mock_conn([])
 
         result = find_guitar_by_url(
             conn,
@@ -142,9 +416,10 @@ class TestFindGuitarByUrl:
         )
 
         assert result is None
+        assert len(model.search_read_calls) == 1
 
     def test_non_reverb_url_skips_partial(self):
-        conn, model = _make_mock_conn(lambda *a, **kw: [])
+        conn, model = _make_mock_conn([])
 
         result = find_guitar_by_url(
             conn,
@@ -153,26 +428,176 @@ class TestFindGuitarByUrl:
 
         assert result is None
         # Only exact match attempted (no Reverb item ID to extract)
-        assert model.search_read.call_count == 1
+        assert len(model.search_read_calls) == 1
+        assert model.search_read_calls[-1][0][0] == [
+            (
+                "x_studio_url",
+                "in",
+                ["https://www.kijiji.ca/v-guitar/city-of-toronto/cool-guitar/123"],
+            )
+        ]
 
     def test_custom_fields(self):
-        record = {"id": 10, "x_name": "Test"}
-        conn, model = _make_mock_conn(lambda *a, **kw: [record])
+        conn, model = _make_mock_conn([])
         custom = ["x_name", "x_studio_url"]
 
         find_guitar_by_url(conn, "https://reverb.com/item/1-test", fields=custom)
 
-        call_args = model.search_read.call_args
-        assert call_args[0][1] == custom
+        assert [call[0][1] for call in model.search_read_calls] == [custom]
 
     def test_default_fields(self):
-        record = {"id": 10, "x_name": "Test"}
-        conn, model = _make_mock_conn(lambda *a, **kw: [record])
+        url = "https://reverb.com/item/1-test"
+        conn, model = _make_mock_conn([{"id": 10, "x_studio_url": url}])
+
+        find_guitar_by_url(conn, url)
+
+        assert model.search_read_calls[-1][0][1] == GUITAR_FIELDS
+
+    def test_repeat_hit_is_memoized(self):
+        url = "https://reverb.com/item/1-a"
+        conn, model = _make_mock_conn([{"id": 1, "x_studio_url": url}])
+
+        first = find_guitar_by_url(conn, url)
+        second = find_guitar_by_url(conn, url)
+
+        assert first == second
+        assert len(model.search_read_calls) == 1
+
+    def test_miss_is_not_memoized(self):
+        url = "https://example.com/guitar"
+        records: list[dict] = []
+        conn, model = _make_mock_conn(records)
+
+        assert find_guitar_by_url(conn, url) is None
+        records.append({"id": 1, "x_studio_url": url})
+
+        assert find_guitar_by_url(conn, url) == {"id": 1, "x_studio_url": url}
+        assert len(model.search_read_calls) == 2
+
+    def test_memo_keyed_on_fields(self):
+        url = "https://reverb.com/item/1-a"
+        conn, model = _make_mock_conn([{"id": 1, "x_studio_url": url}])
+
+        find_guitar_by_url(conn, url)
+        find_guitar_by_url(conn, url, fields=["x_name"])
+        find_guitar_by_url(conn, url, fields=("x_name",))
+
+        assert len(model.search_read_calls) == 2
+
+    def test_memo_is_per_connection(self):
+        url = "https://reverb.com/item/1-a"
+        conn_a, model_a = _make_mock_conn([{"id": 1, "x_studio_url": url}])
+        conn_b, model_b = _make_mock_conn([{"id": 2, "x_studio_url": url}])
+
+        assert find_guitar_by_url(conn_a, url)["id"] == 1
+        assert find_guitar_by_url(conn_b, url)["id"] == 2
+
+    def test_memoized_record_is_copied(self):
+        url = "https://reverb.com/item/1-a"
+        conn, _ = _make_mock_conn([{"id": 1, "x_studio_url": url}])
+
+        find_guitar_by_url(conn, url)["x_name"] = "mutated"
+
+        assert "x_name" not in find_guitar_by_url(conn, url)
+
+
+class TestFindGuitarsByUrls:
+    """Unit tests for the batched find_guitars_by_urls lookup."""
+
+    def test_exact_matches_share_one_rpc(self):
+        url_a = "https://reverb.com/item/1-a"
+        url_b = "https://reverb.com/item/2-b"
+        rec_a = {"id": 1, "x_studio_url": url_a}
+        rec_b = {"id": 2, "x_studio_url": url_b}
+        conn, model = _make_mock_conn([rec_a, rec_b])
+
+        result = find_guitars_by_urls(conn, [url_a, url_b])
+
+        assert result == {url_a: rec_a, url_b: rec_b}
+        assert len(model.search_read_calls) == 1
+
+    def test_exact_and_partial_share_one_bounded_rpc(self):
+        url_a = "https://reverb.com/item/111-a"
+        url_b = "https://reverb.com/item/222-b"
+        rec_b = {"id": 2, "x_studio_url": "https://reverb.com/item/222-b-renamed"}
+        conn, model = _make_mock_conn([rec_b])
+
+        result = find_guitars_by_urls(conn, [url_a, url_b])
+
+        assert result == {url_a: None, url_b: rec_b}
+        assert model.search_read_calls == [
+            (
+                (
+                    [
+                        "|",
+                        "|",
+                        ("x_studio_url", "in", [url_a, url_b]),
+                        ("x_studio_url", "ilike", "/item/111"),
+                        ("x_studio_url", "ilike", "/item/222"),
+                    ],
+                    GUITAR_FIELDS,
+                ),
+                {"limit": 4, "order": "id"},
+            )
+        ]
+
+    def test_partial_match_needs_the_same_item_id(self):
+        url = "https://reverb.com/item/111-a"
+        longer = {"id": 1, "x_studio_url": "https://reverb.com/item/1112-other"}
+        conn, _ = _make_mock_conn([longer])
+
+        assert find_guitars_by_urls(conn, [url]) == {url: None}
+
+    def test_row_cap_is_logged(self):
+        urls = [f"https://reverb.com/item/{i}-x" for i in (1, 2)]
+        records = [{"id": i, "x_studio_url": f"https://reverb.com/item/1-{i}"} for i in range(5)]
+        conn, _ = _make_mock_conn(records)
+
+        with patch("odoo_connector.logger") as log:
+            find_guitars_by_urls(conn, urls)
+
+        log.warning.assert_any_call(
+            "URL lookup hit its {}-row cap; some URLs may be reported missing", 4
+        )
+
+    def test_duplicate_urls_looked_up_once(self):
+        url = "https://reverb.com/item/1-a"
+        record = {"id": 1, "x_studio_url": url}
+        conn, model = _make_mock_conn([record])
+
+        result = find_guitars_by_urls(conn, [url, url])
 
-        find_guitar_by_url(conn, "https://reverb.com/item/1-test")
+        assert result == {url: record}
+        assert model.search_read_calls[-1][0][0] == [
+            "|",
+            ("x_studio_url", "in", [url]),
+            ("x_studio_url", "ilike", "/item/1"),
+        ]
 
-        call_args = model.search_read.call_args
-        assert call_args[0][1] == GUITAR_FIELDS
+    def test_empty_urls_skips_rpc(self):
+        conn, model = _make_mock_conn([])
+
+        assert find_guitars_by_urls(conn, []) == {}
+        assert model.search_read_calls == []
+
+    def test_bulk_logs_one_summary(self):
+        url_a = "https://reverb.com/item/1-a"
+        url_b = "https://reverb.com/item/2-b"
+        conn, _ = _make_mock_conn([{"id": 1, "x_studio_url": url_a}])
+
+        with patch("odoo_connector.logger") as log:
+            find_guitars_by_urls(conn, [url_a, url_b])
+
+        log.success.assert_called_once_with("Matched {}/{} URL(s) to x_guitar records", 1, 2)
+        log.warning.assert_called_once_with("No x_guitar record found for {} URL(s)", 1)
+        assert {c.args[0] for c in log.log.call_args_list} == {"DEBUG"}
+
+    def test_url_field_always_fetched(self):
+        conn, model = _make_mock_conn([])
+
+        find_guitars_by_urls(conn, ["https://example.com/x"], fields=["x_name"])
+
+        assert model.search_read_calls[-1][0][1] == ["x_name", "x_studio_url"]
 
 
 # ── find_listing_by_url ───────────────────────────────────────────────────
@@ -182,37 +607,325 @@ class TestFindListingByUrl:
     """Unit tests for find_listing_by_url (no real Odoo connection)."""
 
     def test_exact_match(self):
-        record = {"id": 500, "x_name": "Godin Stadium HT"}
-        conn, model = _make_mock_conn(lambda *a, **kw: [record])
+        url = "https://reverb.com/item/94370297-godin"
+        record = {"id": 500, "x_name": "Godin Stadium HT", "x_url": url}
+        conn, model = _make_mock_conn([record])
 
-        result = find_listing_by_url(conn, "https://reverb.com/item/94370297-godin")
+        result = find_listing_by_url(conn, url)
 
         assert result == record
-        conn.get_model.assert_called_once_with("x_listing")
-        assert model.search_read.call_count == 1
+        assert conn.get_model_calls == ["x_listing"]
+        assert model.search_read_calls == [
+            (
+                (
+                    ["|", ("x_url", "in", [url]), ("x_url", "ilike", "/item/94370297")],
+                    ListingRecord.odoo_fields(),
+                ),
+                {"limit": 2, "order": "id"},
+            )
+        ]
 
     def test_fallback_to_partial_match(self):
-        record = {"id": 42, "x_name": "Some Guitar"}
-        conn, model = _make_mock_conn(lambda *a, **kw: [])
-        model.search_read.side_effect = [[], [record]]
+        record = {"id": 42, "x_name": "Some Guitar", "x_url": "https://reverb.com/item/94370297"}
+        conn, model = _make_mock_conn([record])
 
         result = find_listing_by_url(conn, "https://reverb.com/item/94370297-godin-stadium-ht")
 
         assert result == record
-        assert model.search_read.call_count == 2
+        assert len(model.search_read_calls) == 1
+
+    def test_exact_match_preferred_over_partial(self):
+        url = "https://reverb.com/item/94370297-godin"
+        partial = {"id": 1, "x_url": "https://reverb.com/item/94370297-old-slug"}
+        exact = {"id": 2, "x_url": url}
+        conn, model = _make_mock_conn([partial, exact])
+
+        assert find_listing_by_url(conn, url) == exact
+        assert len(model.search_read_calls) == 1
+
+    def test_non_reverb_url_sends_exact_match_only(self):
+        url = "https://www.kijiji.ca/v-guitar/city-of-toronto/cool-guitar/123"
+        conn, model = _make_mock_conn([])
+
+        assert find_listing_by_url(conn, url) is None
+        assert model.search_read_calls[-1][0][0] == [("x_url", "in", [url])]
 
     def test_no_match_returns_none(self):
-        conn, model = _make_mock_conn(lambda *a, **kw: [])
+        conn, model = _make_mock_conn([])
 
         result = find_listing_by_url(conn, "https://reverb.com/item/99999999-nonexistent")
 
         assert result is None
 
     def test_default_fields(self):
-        record = {"id": 10, "x_name": "Test"}
-        conn, model = _make_mock_conn(lambda *a, **kw: [record])
+        url = "https://reverb.com/item/1-test"
+        conn, model = _make_mock_conn([{"id": 10, "x_url": url}])
+
+        find_listing_by_url(conn, url)
+
+        assert model.search_read_calls[-1][0][1] == ListingRecord.odoo_fields()
+
+
+# ── model_of ──────────────────────────────────────────────────────────────
+
+
+class TestModelOf:
+    """Unit tests for the per-connection model proxy memo."""
+
+    def test_proxy_built_once_per_model(self):
+        conn = MagicMock()
+
+        first = model_of(conn, "x_guitar")
+        second = model_of(conn, "x_guitar")
+
+        assert first is second
+        conn.get_model.assert_called_once_with("x_guitar")
+
+    def test_proxies_are_per_connection(self):
+        conn_a, conn_b = MagicMock(), MagicMock()
+
+        model_of(conn_a, "x_guitar")
+        model_of(conn_b, "x_guitar")
+
+        conn_a.get_model.assert_called_once_with("x_guitar")
+        conn_b.get_model.assert_called_once_with("x_guitar")
+
+    def test_repeated_lookups_reuse_proxy(self):
+        record = {"id": 1, "x_url": "https://reverb.com/item/1-a"}
+        conn, model = _make_mock_conn([record])
+
+        find_listing_by_url(conn, "https://reverb.com/item/1-a")
+        find_listing_by_url(conn, "https://reverb.com/item/1-a")
+
+        assert conn.get_model_calls == ["x_listing"]
+        assert len(model.search_read_calls) == 2
+
+
+# ── search_read_all ───────────────────────────────────────────────────────
+
+
+def _make_paged_conn(total: int):
+    """Build a mock connection whose model pages through *total* ``{"id": i}`` rows."""
+    rows = [{"id": i} for i in range(1, total + 1)]
+    conn = MagicMock()
+    model = MagicMock()
+    model.search_read.side_effect = lambda domain, fields, offset, limit, order: rows[
+        offset : offset + limit
+    ]
+    conn.get_model.return_value = model
+    return conn, model, rows
+
+
+class TestSearchReadAll:
+    """Unit tests for the paged, concurrent search_read_all."""
+
+    def test_returns_all_pages_in_order(self):
+        conn, model, rows = _make_paged_conn(25)
+
+        result = search_read_all(conn, "x_listing", [], ["id"], batch_size=10, max_workers=3)
+
+        assert result == rows
+        model.search_count.assert_not_called()
+        offsets = sorted(c.kwargs["offset"] for c in model.search_read.call_args_list)
+        # First page alone, then one wave of 3 — the short page at 20 ends it
+        assert offsets == [0, 10, 20, 30]
+
+    def test_spans_multiple_waves(self):
+        conn, _, rows = _make_paged_conn(95)
+
+        result = search_read_all(conn, "x_listing", batch_size=10, max_workers=2)
+
+        assert result == rows
+
+    def test_single_short_page_is_one_rpc(self):
+        conn, model, rows = _make_paged_conn(3)
+
+        assert search_read_all(conn, "x_listing", batch_size=10) == rows
+        assert model.search_read.call_count == 1
+
+    def test_empty_result(self):
+        conn, model, _ = _make_paged_conn(0)
+
+        assert search_read_all(conn, "x_listing") == []
+        assert model.search_read.call_count == 1
+
+    def test_none_fields_requests_all_fields(self):
+        conn, model, _ = _make_paged_conn(1)
+
+        search_read_all(conn, "x_listing", [("id", ">", 0)])
+
+        call = model.search_read.call_args
+        assert call.args == ([("id", ">", 0)], [])
+
+    @pytest.mark.parametrize(
+        "fields, warned",
+        [
+            pytest.param(None, True, id="all-fields"),
+            pytest.param(["id"], False, id="explicit-fields"),
+        ],
+    )
+    def test_warns_without_fields(self, fields: list[str] | None, warned: bool):
+        conn, _, _ = _make_paged_conn(1)
+
+        with patch("odoo_connector.logger") as log:
+            search_read_all(conn, "x_listing", [], fields)
+            list(iter_search_read(conn, "x_listing", [], fields))
+
+        assert log.warning.call_count == (2 if warned else 0)
+
+
+# ── iter_search_read ──────────────────────────────────────────────────────
+
+
+class TestIterSearchRead:
+    """Unit tests for the streaming iter_search_read generator."""
+
+    def test_yields_every_record_in_order(self):
+        conn, model, rows = _make_paged_conn(25)
+
+        assert list(iter_search_read(conn, "x_listing", batch_size=10)) == rows
+        assert model.search_read.call_count == 3
+        model.search_count.assert_not_called()
+
+    def test_exact_multiple_needs_one_empty_page(self):
+        conn, model, rows = _make_paged_conn(20)
+
+        assert list(iter_search_read(conn, "x_listing", batch_size=10)) == rows
+        assert model.search_read.call_count == 3
+
+    def test_is_lazy(self):
+        conn, model, _ = _make_paged_conn(25)
+
+        gen = iter_search_read(conn, "x_listing", batch_size=10)
+        next(gen)
+
+        assert model.search_read.call_count == 1
+
+
+# ── batch_rpc ─────────────────────────────────────────────────────────────
+
+
+class TestBatchRpc:
+    """Unit tests for batch_rpc."""
+
+    @staticmethod
+    def _conn(side_effect):
+        conn = MagicMock(database="db", user_id=2, password="pw")
+        conn.get_service.return_value.execute_kw.side_effect = side_effect
+        return conn
+
+    def test_results_in_call_order(self):
+        conn = self._conn(lambda db, uid, pw, model, method, args, kw: (model, method, args, kw))
+
+        results = batch_rpc(
+            conn,
+            [
+                ("x_gear", "fields_get", (), {}),
+                ("x_listing", "search_count", [[("x_gear_id", "=", 1)]], {}),
+            ],
+        )
+
+        assert results == [
+            ("x_gear", "fields_get", [], {}),
+            ("x_listing", "search_count", [[("x_gear_id", "=", 1)]], {}),
+        ]
+        conn.check_login.assert_called_once_with(False)
+
+    def test_empty_calls_skip_rpc(self):
+        conn = self._conn(None)
+
+        assert batch_rpc(conn, []) == []
+        conn.get_service.assert_not_called()
+
+    def test_error_raises(self):
+        conn = self._conn(JsonRPCException({"code": 200}))
+
+        with pytest.raises(JsonRPCException):
+            batch_rpc(conn, [("x_gear", "read", [[1]], {})])
+
+    def test_return_exceptions(self):
+        def execute_kw(db, uid, pw, model, method, args, kw):
+            if model == "x_bad":
+                raise JsonRPCException({"code": 200})
+            return [{"id": 1}]
+
+        conn = self._conn(execute_kw)
+
+        ok, bad = batch_rpc(
+            conn,
+            [("x_gear", "read", [[1]], {}), ("x_bad", "read", [[1]], {})],
+            return_exceptions=True,
+        )
+
+        assert ok == [{"id": 1}]
+        assert isinstance(bad, JsonRPCException)
+
+
+# ── get_model_fields ──────────────────────────────────────────────────────
+
+
+class TestGetModelFields:
+    """Unit tests for the TTL-cached fields_get wrapper."""
+
+    @pytest.fixture(autouse=True)
+    def _clear_cache(self):
+        get_model_fields.cache_clear()
+        yield
+        get_model_fields.cache_clear()
+
+    @staticmethod
+    def _fields_conn():
+        conn = MagicMock()
+        conn.get_model.return_value.fields_get.return_value = {"x_name": {"type": "char"}}
+        return conn
+
+    def test_second_call_hits_cache(self):
+        conn = self._fields_conn()
+
+        first = get_model_fields(conn, "x_gear")
+        second = get_model_fields(conn, "x_gear")
+
+        assert first == second == {"x_name": {"type": "char"}}
+        assert conn.get_model.return_value.fields_get.call_count == 1
+
+    def test_cache_is_per_model(self):
+        conn = self._fields_conn()
+
+        get_model_fields(conn, "x_gear")
+        get_model_fields(conn, "x_models")
+
+        assert conn.get_model.return_value.fields_get.call_count == 2
+
+    def test_expired_entry_is_refetched(self, monkeypatch):
+        conn = self._fields_conn()
+        get_model_fields(conn, "x_gear")
+
+        monkeypatch.setattr("odoo_connector.FIELDS_CACHE_TTL_SECONDS", 0)
+        get_model_fields(conn, "x_gear")
+
+        assert conn.get_model.return_value.fields_get.call_count == 2
+
+    def test_cache_is_per_connection(self):
+        conn_a, conn_b = self._fields_conn(), self._fields_conn()
+
+        get_model_fields(conn_a, "x_gear")
+        get_model_fields(conn_b, "x_gear")
+
+        assert conn_a.get_model.return_value.fields_get.call_count == 1
+        assert conn_b.get_model.return_value.fields_get.call_count == 1
+
+    def test_cache_clear_refetches(self):
+        conn = self._fields_conn()
+        get_model_fields(conn, "x_gear")
+
+        get_model_fields.cache_clear()
+        get_model_fields(conn, "x_gear")
+
+        assert conn.get_model.return_value.fields_get.call_count == 2
+
+    def test_caller_mutation_does_not_leak(self):
+        conn = self._fields_conn()
 
-        find_listing_by_url(conn, "https://reverb.com/item/1-test")
+        get_model_fields(conn, "x_gear").pop("x_name")
 
-        call_args = model.search_read.call_args
-        assert call_args[0][1] == ListingRecord.odoo_fields()
+        assert "x_name" in get_model_fields(conn, "x_gear")
@@ -1,4 +1,4 @@
-"""Tests for odoo_mcp/config.py — get_odoo_config()."""
+"""Tests for odoo_mcp/config.py — get_odoo_config(), get_connection_from_env()."""
 
 from __future__ import annotations
 
@@ -60,3 +60,20 @@ def test_get_odoo_config_raises_on_missing_var(monkeypatch, missing_var: str):
 
     with pytest.raises(KeyError):
         get_odoo_config()
+
+
+def test_get_connection_from_env_bypasses_connector_cache(monkeypatch):
+    """The MCP memo owns the connection TTL, so every login skips get_connection's cache."""
+    for key, value in _ALL_ENV_VARS.items():
+        monkeypatch.setenv(key, value)
+
+    from odoo_mcp import config
+
+    monkeypatch.setattr(config, "_conn_cache", None)
+    monkeypatch.setattr(config, "_conn_fetched_at", None)
+    with patch.object(config, "get_connection") as get_connection:
+        assert config.get_connection_from_env() is get_connection.return_value
+
+    get_connection.assert_called_once_with(
+        "odoo.example.com", "mydb", "admin", "secret", refresh=True
+    )
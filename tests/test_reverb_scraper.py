@@ -1,7 +1,15 @@
 """Tests for reverb_scraper — unit tests are pure-sync, integration tests hit the live API."""
 
+import asyncio
+import json
+import os
+import time
+from collections import OrderedDict
+
+import httpx
 import pytest
 
+import reverb_scraper
 from reverb_scraper import ReverbScraper
 
 # ── _extract_listing_slug ─────────────────────────────────────────────────
@@ -60,6 +68,26 @@ from reverb_scraper import ReverbScraper
             "93737551-frank-brothers-arcade-one-korina-natural",
             id="frank-brothers-arcade-one",
         ),
+        pytest.param(
+            "https://reverb.com/item/94365602-suhr-classic-t-trans-white/",
+            "94365602-suhr-classic-t-trans-white",
+            id="trailing-slash",
+        ),
+        pytest.param(
+            "https://reverb.com/item/94365602-suhr-classic-t-trans-white?show_sold=true",
+            "94365602-suhr-classic-t-trans-white",
+            id="query-string",
+        ),
+        pytest.param(
+            "https://reverb.com/item/94365602-suhr-classic-t-trans-white#photos",
+            "94365602-suhr-classic-t-trans-white",
+            id="fragment",
+        ),
+        pytest.param(
+            "https://reverb.com/ca/item/94365602-suhr-classic-t-trans-white",
+            "94365602-suhr-classic-t-trans-white",
+            id="localized",
+        ),
     ],
 )
 def test_extract_listing_slug(scraper: ReverbScraper, url: str, expected_slug: str):
@@ -73,6 +101,8 @@ def test_extract_listing_slug(scraper: ReverbScraper, url: str, expected_slug: s
         pytest.param("https://reverb.com/", id="root"),
         pytest.param("https://example.com/not-reverb", id="not-reverb"),
         pytest.param("", id="empty"),
+        pytest.param("https://reverb.com/item/", id="item-no-slug"),
+        pytest.param("https://reverb.com/item/?show_sold=true", id="item-query-only"),
     ],
 )
 def test_extract_listing_slug_invalid(scraper: ReverbScraper, url: str):
@@ -97,15 +127,35 @@ def test_extract_listing_slug_invalid(scraper: ReverbScraper, url: str):
         pytest.param("2025-03-28T10:00:00-07:00", "2025-03-28", id="pacific-tz"),
         pytest.param("2025-12-27T14:00:00-05:00", "2025-12-27", id="eastern-tz-dec"),
         pytest.param("2025-06-15T09:30:00Z", "2025-06-15", id="utc-z-june"),
+        pytest.param("2025-12-28T20:00:00-05:00", "2025-12-29", id="eastern-tz-next-utc-day"),
+        pytest.param("2025-06-01T03:00:00+05:30", "2025-05-31", id="half-hour-offset-prev-day"),
+        pytest.param("2025-06-01T12:00:00.123+02:00", "2025-06-01", id="fractional-seconds"),
+        pytest.param("2025-06-01T12:00:00", "2025-06-01", id="naive-datetime"),
+        pytest.param("2025-06-01T23:59:59-00:00", "2025-06-01", id="negative-zero-offset"),
+        pytest.param("2025-06-01T23:59+00:00", "2025-06-01", id="utc-no-seconds"),
+        pytest.param("2025-06-01T23:59-01:00", "2025-06-02", id="offset-no-seconds"),
         pytest.param("2025-01-01", "2025-01-01", id="date-only"),
         pytest.param("", "", id="empty-string"),
         pytest.param("not-a-date", "not-a-date", id="invalid-string"),
+        pytest.param("2025-02-30T10:00:00Z", "2025-02-30T10:00:00Z", id="impossible-day"),
+        pytest.param("2025-13-01T10:00:00Z", "2025-13-01T10:00:00Z", id="impossible-month"),
+        pytest.param("2024-02-29T10:00:00Z", "2024-02-29", id="leap-day"),
+        pytest.param("2025-01-31T10:00:00Z", "2025-01-31", id="month-end"),
     ],
 )
 def test_format_date(iso_input: str, expected: str):
     assert ReverbScraper._format_date(iso_input) == expected
 
 
+def test_format_date_is_memoized():
+    ReverbScraper._format_date.cache_clear()
+
+    ReverbScraper._format_date("2025-12-28T23:30:00-05:00")
+    ReverbScraper._format_date("2025-12-28T23:30:00-05:00")
+
+    assert ReverbScraper._format_date.cache_info().hits == 1
+
+
 # ── _clean_html ───────────────────────────────────────────────────────────
 
 
@@ -123,6 +173,8 @@ def test_format_date(iso_input: str, expected: str):
             id="html-entities-preserved",
         ),
         pytest.param("<br/>Line one<br/>Line two", "Line oneLine two", id="br-tags"),
+        pytest.param("a\t\n b\u00a0 c", "a b c", id="mixed-whitespace"),
+        pytest.param("<p>\n  </p>", "", id="whitespace-only-body"),
     ],
 )
 def test_clean_html(html_input: str, expected: str):
@@ -158,6 +210,33 @@ def test_find_shipping_rate(scraper: ReverbScraper, rates: list, target_region:
     assert result == expected
 
 
+@pytest.mark.parametrize(
+    "target_region, expected",
+    [
+        pytest.param("CA", ("CA", "CA_CON", "XX", "EVERYWHERE_ELSE"), id="CA-with-variants"),
+        pytest.param("DE", ("DE", "XX", "EVERYWHERE_ELSE"), id="no-variants"),
+        pytest.param("XX", ("XX", "EVERYWHERE_ELSE"), id="catch-all-not-repeated"),
+    ],
+)
+def test_region_chain(target_region: str, expected: tuple[str, ...]):
+    assert reverb_scraper._region_chain(target_region) == expected
+
+
+def test_region_ranks():
+    assert reverb_scraper._region_ranks("CA") == {
+        "CA": 0,
+        "CA_CON": 1,
+        "XX": 2,
+        "EVERYWHERE_ELSE": 3,
+    }
+
+
+def test_find_shipping_rate_first_of_equal_rank_wins(scraper: ReverbScraper):
+    first = {"region_code": "XX", "rate": {"amount": "10.00"}}
+    second = {"region_code": "XX", "rate": {"amount": "20.00"}}
+    assert scraper._find_shipping_rate([first, second], "CA") is first
+
+
 # ── _resolve_shipping ─────────────────────────────────────────────────────
 
 
@@ -172,13 +251,15 @@ _PAID_XX_RATE = {"region_code": "XX", "rate": {"amount": "300.00", "display": "$
 _PAID_CA_NO_AMOUNT = {"region_code": "CA", "rate": {"display": "C$???"}}
 
 # Expected keys every call must return
-_SHIPPING_KEYS = {
-    "shipping_price",
-    "shipping_display",
-    "shipping_region",
-    "ships_to_canada",
-    "shipping_regions",
-}
+_SHIPPING_KEYS = frozenset(
+    {
+        "shipping_price",
+        "shipping_display",
+        "shipping_region",
+        "ships_to_canada",
+        "shipping_regions",
+    }
+)
 
 
 class TestResolveShippingKeys:
@@ -195,8 +276,7 @@ class TestResolveShippingKeys:
     )
     def test_all_keys_present(self, scraper: ReverbScraper, raw: dict, sale_ended: bool):
         result = scraper._resolve_shipping(raw, sale_ended=sale_ended)
-        missing = _SHIPPING_KEYS - set(result.keys())
-        assert not missing, f"Missing keys: {missing}"
+        assert _SHIPPING_KEYS.issubset(result), f"Missing keys: {_SHIPPING_KEYS - result.keys()}"
 
 
 class TestResolveShippingLive:
@@ -279,6 +359,15 @@ class TestResolveShippingLive:
         assert result["shipping_display"] == "C$35.00"
         assert result["ships_to_canada"] is False
 
+    def test_default_results_are_independent(self, scraper: ReverbScraper):
+        """Each defaulted result is a fresh dict; mutating one leaks nowhere."""
+        first = scraper._resolve_shipping(_raw_with_rates([_US_RATE]), sale_ended=False)
+        first["shipping_price"] = "1.00"
+        second = scraper._resolve_shipping(_raw_with_rates([]), sale_ended=False)
+        assert second["shipping_price"] == "250.00"
+        assert first["shipping_regions"] == ["US_CON"]
+        assert second["shipping_regions"] == []
+
     def test_shipping_regions_listed(self, scraper: ReverbScraper):
         """shipping_regions contains all region codes from the rates list."""
         result = scraper._resolve_shipping(
@@ -287,6 +376,15 @@ class TestResolveShippingLive:
         )
         assert set(result["shipping_regions"]) == {"US_CON", "CA", "XX"}
 
+    def test_first_rate_wins_for_repeated_region(self, scraper: ReverbScraper):
+        """A region listed twice resolves to its first rate."""
+        result = scraper._resolve_shipping(
+            _raw_with_rates([_PAID_CA_RATE, _FREE_CA_RATE]),
+            sale_ended=False,
+        )
+        assert result["shipping_price"] == "175.50"
+        assert result["shipping_regions"] == ["CA", "CA"]
+
 
 class TestResolveShippingEnded:
     """Shipping resolution when the listing has ended (sold/ended/suspended)."""
@@ -330,6 +428,29 @@ class TestResolveShippingEnded:
         assert result["shipping_regions"] == []
 
 
+# ── _parse_api_response ──────────────────────────────────────────────────
+
+
+@pytest.mark.parametrize(
+    "key",
+    [
+        pytest.param("price", id="price"),
+        pytest.param("condition", id="condition"),
+        pytest.param("state", id="state"),
+        pytest.param("location", id="location"),
+        pytest.param("stats", id="stats"),
+        pytest.param("_links", id="links"),
+    ],
+)
+def test_parse_api_response_null_nested(scraper: ReverbScraper, key: str):
+    """An explicit ``null`` nested object falls back to defaults."""
+    data = scraper._parse_api_response({key: None}, "https://reverb.com/item/1-x")
+    assert data["url"] == "https://reverb.com/item/1-x"
+    assert data["currency"] == "CAD"
+    assert data["photo_url"] == ""
+    assert data["views"] == 0
+
+
 # ── extract_data — VCR-recorded API responses ────────────────────────────
 #
 # These tests replay recorded HTTP responses via VCR cassettes.
@@ -342,8 +463,41 @@ class TestResolveShippingEnded:
 # Volatile fields (price, views, watchers, status, shipping, offers_enabled)
 # are intentionally NOT checked because they can change at any time.
 
+# Every key extract_data returns for a listing
+_ALL_EXTRACT_KEYS = frozenset(
+    {
+        "url",
+        "name",
+        "make",
+        "model",
+        "finish",
+        "year",
+        "price",
+        "currency",
+        "price_display",
+        "condition",
+        "shipping_price",
+        "shipping_display",
+        "shipping_region",
+        "ships_to_canada",
+        "shipping_regions",
+        "status",
+        "sale_ended",
+        "offers_enabled",
+        "created_at",
+        "published_at",
+        "seller",
+        "location",
+        "description",
+        "views",
+        "watchers",
+        "categories",
+        "photo_url",
+    }
+)
+
 # Stable fields we verify on every listing
-_STABLE_FIELDS = [
+_STABLE_FIELDS = (
     "name",
     "make",
     "model",
@@ -355,7 +509,7 @@ _STABLE_FIELDS = [
     "location",
     "created_at",
     "published_at",
-]
+)
 
 _LISTINGS = [
     pytest.param(
@@ -540,50 +694,20 @@ async def test_extract_data_stable_fields(scraper: ReverbScraper, url: str, expe
     assert "error" not in result, f"API returned error: {result.get('error')}"
     assert result["url"] == url
 
-    for field in _STABLE_FIELDS:
-        assert result[field] == expected[field], (
-            f"Field '{field}': got {result[field]!r}, expected {expected[field]!r}"
-        )
+    actual = {field: result[field] for field in _STABLE_FIELDS}
+    assert actual == {field: expected[field] for field in _STABLE_FIELDS}
 
 
 @pytest.mark.vcr
 @pytest.mark.parametrize("url, expected", _LISTINGS)
 async def test_extract_data_has_all_keys(scraper: ReverbScraper, url: str, expected: dict):
     """Every result from extract_data must contain all expected output keys."""
-    all_keys = {
-        "url",
-        "name",
-        "make",
-        "model",
-        "finish",
-        "year",
-        "price",
-        "currency",
-        "price_display",
-        "condition",
-        "shipping_price",
-        "shipping_display",
-        "shipping_region",
-        "ships_to_canada",
-        "shipping_regions",
-        "status",
-        "sale_ended",
-        "offers_enabled",
-        "created_at",
-        "published_at",
-        "seller",
-        "location",
-        "description",
-        "views",
-        "watchers",
-        "categories",
-        "photo_url",
-    }
     result = await scraper.extract_data(url)
 
     assert "error" not in result, f"API returned error: {result.get('error')}"
-    missing = all_keys - set(result.keys())
-    assert not missing, f"Missing keys in output: {missing}"
+    assert _ALL_EXTRACT_KEYS.issubset(result), (
+        f"Missing keys in output: {_ALL_EXTRACT_KEYS - result.keys()}"
+    )
 
 
 @pytest.mark.vcr
@@ -620,35 +744,8 @@ async def test_extract_data_types(scraper: ReverbScraper, url: str, expected: di
 # structural properties; volatile fields (price, views, watchers, etc.)
 # are intentionally left unchecked.
 
-_ALL_SEARCH_KEYS = {
-    "url",
-    "name",
-    "make",
-    "model",
-    "finish",
-    "year",
-    "price",
-    "currency",
-    "price_display",
-    "condition",
-    "shipping_price",
-    "shipping_display",
-    "shipping_region",
-    "ships_to_canada",
-    "shipping_regions",
-    "status",
-    "sale_ended",
-    "offers_enabled",
-    "created_at",
-    "published_at",
-    "seller",
-    "location",
-    "description",
-    "views",
-    "watchers",
-    "categories",
-    "photo_url",
-}
+# search returns listings in the same shape as extract_data
+_ALL_SEARCH_KEYS = _ALL_EXTRACT_KEYS
 
 
 @pytest.mark.vcr
@@ -668,8 +765,7 @@ async def test_search_result_has_all_keys(scraper: ReverbScraper):
 
     assert len(results) > 0
     for r in results:
-        missing = _ALL_SEARCH_KEYS - set(r.keys())
-        assert not missing, f"Missing keys: {missing}"
+        assert _ALL_SEARCH_KEYS.issubset(r), f"Missing keys: {_ALL_SEARCH_KEYS - r.keys()}"
 
 
 @pytest.mark.vcr
@@ -769,8 +865,7 @@ async def test_search_paginates_across_multiple_pages(scraper: ReverbScraper):
     # Every result is a valid normalised dict (no errors, all keys present)
     for r in results:
         assert "error" not in r, f"Unexpected error: {r.get('error')}"
-        missing = _ALL_SEARCH_KEYS - set(r.keys())
-        assert not missing, f"Missing keys: {missing}"
+        assert _ALL_SEARCH_KEYS.issubset(r), f"Missing keys: {_ALL_SEARCH_KEYS - r.keys()}"
 
     # Unique URLs should span more than one page worth of results.
     # Note: the live API may return a small number of duplicates across
@@ -825,8 +920,8 @@ async def test_search_category_filter_narrows_results(scraper: ReverbScraper):
 
 
 @pytest.mark.vcr
-async def test_search_category_filter_results_have_all_keys(scraper: ReverbScraper):
-    """Category-filtered results contain all expected output keys."""
+async def test_search_category_filter_results_shape(scraper: ReverbScraper):
+    """Category-filtered results have every output key and non-empty categories."""
     results = await scraper.search(
         "Fender Stratocaster",
         category="electric-guitars",
@@ -835,24 +930,464 @@ async def test_search_category_filter_results_have_all_keys(scraper: ReverbScrap
 
     assert len(results) > 0
     for r in results:
-        missing = _ALL_SEARCH_KEYS - set(r.keys())
-        assert not missing, f"Missing keys: {missing}"
-
-
-@pytest.mark.vcr
-async def test_search_categories_field_populated(scraper: ReverbScraper):
-    """Each result includes a non-empty categories list of strings."""
-    results = await scraper.search(
-        "Fender Stratocaster",
-        category="electric-guitars",
-        max_pages=1,
-        per_page=5,
-    )
-
-    assert len(results) > 0
-    for r in results:
+        assert _ALL_SEARCH_KEYS.issubset(r), f"Missing keys: {_ALL_SEARCH_KEYS - r.keys()}"
         assert isinstance(r["categories"], list)
         assert len(r["categories"]) > 0
         for cat in r["categories"]:
             assert isinstance(cat, str)
             assert len(cat) > 0
+
+
+# ── search / search_iter — page ordering (mocked transport) ──────────────
+
+
+def _paged_transport(
+    total_pages: int, *, slow_page: int | None = None, fail_page: int | None = None
+):
+    """Serve *total_pages* pages of one listing each; *slow_page* answers last."""
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        page = int(request.url.params["page"])
+        if page == fail_page:
+            return httpx.Response(500)
+        if page == slow_page:
+            await asyncio.sleep(0.05)
+        listing = {"title": f"page {page}", "_links": {"web": {"href": f"https://r/{page}"}}}
+        return httpx.Response(200, json={"listings": [listing], "total_pages": total_pages})
+
+    return httpx.MockTransport(handler)
+
+
+async def test_search_iter_yields_pages_as_they_complete(scraper: ReverbScraper):
+    scraper.client = httpx.AsyncClient(transport=_paged_transport(3, slow_page=2))
+
+    names = [r["name"] async for r in scraper.search_iter("x")]
+
+    assert names == ["page 1", "page 3", "page 2"]
+
+
+async def test_search_keeps_page_order(scraper: ReverbScraper):
+    scraper.client = httpx.AsyncClient(transport=_paged_transport(3, slow_page=2))
+
+    results = await scraper.search("x")
+
+    assert [r["name"] for r in results] == ["page 1", "page 2", "page 3"]
+
+
+@pytest.mark.parametrize(
+    "fail_page, expected",
+    [
+        pytest.param(1, [{"error": "API error on page 1"}], id="first-page-error"),
+        pytest.param(2, ["page 1", "page 3"], id="later-page-skipped"),
+    ],
+)
+async def test_search_iter_page_errors(scraper: ReverbScraper, fail_page: int, expected: list):
+    scraper.client = httpx.AsyncClient(transport=_paged_transport(3, fail_page=fail_page))
+
+    results = [r async for r in scraper.search_iter("x")]
+
+    assert [r.get("name", r) for r in results] == expected
+
+
+async def test_search_caps_pages_in_flight(scraper: ReverbScraper):
+    in_flight = peak = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return httpx.Response(200, json={"listings": [], "total_pages": 8})
+
+    scraper.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    await scraper.search("x", max_concurrent=2)
+
+    assert peak == 2
+
+
+async def test_search_iter_waits_for_slow_consumer(scraper: ReverbScraper):
+    requested: list[int] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        requested.append(int(request.url.params["page"]))
+        return httpx.Response(200, json={"listings": [{"title": "x"}], "total_pages": 8})
+
+    scraper.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    results = scraper.search_iter("x", max_concurrent=2)
+
+    await anext(results)
+    await asyncio.sleep(0.05)  # every started page has long finished
+
+    # Page 1 plus a window of two; the rest wait for the caller.
+    assert sorted(requested) == [1, 2, 3]
+    assert len([r async for r in results]) == 7
+    assert sorted(requested) == list(range(1, 9))
+
+
+# ── fetch_categories — caching (mocked transport) ─────────────────────────
+
+
+class TestFetchCategoriesCache:
+    """fetch_categories is served from memory, then disk, before the API."""
+
+    @pytest.fixture(autouse=True)
+    def _isolated_cache(self, tmp_path, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(reverb_scraper, "CATEGORIES_CACHE_DIR", tmp_path)
+        monkeypatch.setattr(reverb_scraper, "_CATEGORIES_CACHE", {})
+        self.cache_file = tmp_path / "categories-CAD.json"
+
+    @staticmethod
+    def _scraper(calls: list[str], status: int = 200, currency: str = "CAD") -> ReverbScraper:
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(str(request.url))
+            return httpx.Response(status, json={"categories": [{"full_name": "A", "slug": "a"}]})
+
+        scraper = ReverbScraper(currency=currency)
+        scraper.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        return scraper
+
+    async def test_second_call_hits_memory(self):
+        calls: list[str] = []
+
+        first = await self._scraper(calls).fetch_categories()
+        second = await self._scraper(calls).fetch_categories()
+
+        assert first == second
+        assert first[0]["slug"] == "a"
+        assert len(calls) == 1
+
+    async def test_disk_cache_survives_memory_reset(self, monkeypatch: pytest.MonkeyPatch):
+        calls: list[str] = []
+        await self._scraper(calls).fetch_categories()
+        monkeypatch.setattr(reverb_scraper, "_CATEGORIES_CACHE", {})
+
+        result = await self._scraper(calls).fetch_categories()
+
+        assert result[0]["slug"] == "a"
+        assert len(calls) == 1
+
+    async def test_disk_cache_is_per_currency(self, monkeypatch: pytest.MonkeyPatch):
+        calls: list[str] = []
+        await self._scraper(calls).fetch_categories()
+        monkeypatch.setattr(reverb_scraper, "_CATEGORIES_CACHE", {})
+
+        await self._scraper(calls, currency="USD").fetch_categories()
+
+        assert len(calls) == 2
+        assert self.cache_file.with_name("categories-USD.json").exists()
+
+    async def test_disk_cache_for_other_key_ignored(self):
+        calls: list[str] = []
+        self.cache_file.write_text(json.dumps({"key": ["https://other", "CAD"], "categories": []}))
+
+        await self._scraper(calls).fetch_categories()
+
+        assert len(calls) == 1
+
+    async def test_expired_disk_cache_refetches(self, monkeypatch: pytest.MonkeyPatch):
+        calls: list[str] = []
+        await self._scraper(calls).fetch_categories()
+        monkeypatch.setattr(reverb_scraper, "_CATEGORIES_CACHE", {})
+        stale = time.time() - reverb_scraper.CATEGORIES_CACHE_TTL_SECONDS - 1
+        os.utime(self.cache_file, (stale, stale))
+
+        await self._scraper(calls).fetch_categories()
+
+        assert len(calls) == 2
+
+    async def test_refresh_bypasses_cache(self):
+        calls: list[str] = []
+        scraper = self._scraper(calls)
+
+        await scraper.fetch_categories()
+        await scraper.fetch_categories(refresh=True)
+
+        assert len(calls) == 2
+
+    async def test_errors_are_not_cached(self):
+        calls: list[str] = []
+
+        assert await self._scraper(calls, status=500).fetch_categories() == []
+        assert await self._scraper(calls).fetch_categories() != []
+        assert len(calls) == 2
+
+
+# ── extract_data — request URL (mocked transport) ─────────────────────────
+
+
+@pytest.mark.parametrize(
+    "url, expected_path",
+    [
+        pytest.param(
+            "https://reverb.com/item/123-godin-stadium",
+            "/api/listings/123-godin-stadium",
+            id="plain-slug",
+        ),
+        pytest.param(
+            "https://reverb.com/item/123-a/b?c",
+            "/api/listings/123-a",
+            id="path-and-query-dropped",
+        ),
+        pytest.param(
+            "https://reverb.com/item/123-a b&c;d",
+            "/api/listings/123-a%20b%26c%3Bd",
+            id="reserved-chars-encoded",
+        ),
+    ],
+)
+async def test_extract_data_builds_listing_url(
+    scraper: ReverbScraper, url: str, expected_path: str
+):
+    seen: list[httpx.URL] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.url)
+        return httpx.Response(200, json={})
+
+    scraper.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    await scraper.extract_data(url)
+
+    assert seen[0].raw_path.decode() == expected_path
+
+
+@pytest.mark.parametrize(
+    "raw, expected",
+    [
+        pytest.param(
+            {"full_name": "A / B", "name": "B", "slug": "b", "root_slug": "a", "uuid": "u", "x": 1},
+            {"full_name": "A / B", "name": "B", "slug": "b", "root_slug": "a", "uuid": "u"},
+            id="all-keys",
+        ),
+        pytest.param(
+            {"full_name": "A", "slug": "a"},
+            {"full_name": "A", "name": "", "slug": "a", "root_slug": "", "uuid": ""},
+            id="missing-keys-default-empty",
+        ),
+    ],
+)
+async def test_fetch_categories_normalises_entries(
+    tmp_path, monkeypatch: pytest.MonkeyPatch, raw: dict, expected: dict
+):
+    monkeypatch.setattr(reverb_scraper, "CATEGORIES_CACHE_DIR", tmp_path)
+    monkeypatch.setattr(reverb_scraper, "_CATEGORIES_CACHE", {})
+    scraper = ReverbScraper()
+    scraper.client = httpx.AsyncClient(
+        transport=httpx.MockTransport(lambda _: httpx.Response(200, json={"categories": [raw]}))
+    )
+
+    assert await scraper.fetch_categories() == [expected]
+
+
+async def test_extract_many_fetches_each_slug_once(scraper: ReverbScraper):
+    requested: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requested.append(request.url.path)
+        return httpx.Response(200, json={"title": request.url.path.rsplit("/", 1)[-1]})
+
+    scraper.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    urls = [
+        "https://reverb.com/item/1-a",
+        "https://reverb.com/item/2-b",
+        "https://reverb.com/item/1-a/",
+        "not-a-reverb-url",
+    ]
+
+    results = await scraper.extract_many(urls)
+
+    assert sorted(requested) == ["/api/listings/1-a", "/api/listings/2-b"]
+    assert [r["url"] for r in results] == urls
+    assert [r.get("name") for r in results] == ["1-a", "2-b", "1-a", None]
+    assert "error" in results[3]
+
+
+async def test_extract_many_repeated_url_gets_its_own_dict(scraper: ReverbScraper):
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"title": "Same"})
+
+    scraper.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    url = "https://reverb.com/item/1-a"
+
+    first, second = await scraper.extract_many([url, url])
+
+    assert first == second
+    assert first is not second
+
+
+class TestListingCache:
+    """extract_data reuses fresh listing bodies instead of re-fetching."""
+
+    @staticmethod
+    def _scraper(calls: list[str], status: int = 200) -> ReverbScraper:
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request.url.path)
+            return httpx.Response(status, json={"title": "Cached"})
+
+        scraper = ReverbScraper()
+        scraper.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        return scraper
+
+    async def test_cache_shared_across_instances(self):
+        calls: list[str] = []
+
+        first = await self._scraper(calls).extract_data("https://reverb.com/item/1-a")
+        second = await self._scraper(calls).extract_data("https://reverb.com/item/1-a/")
+
+        assert first["name"] == second["name"] == "Cached"
+        assert second["url"] == "https://reverb.com/item/1-a/"
+        assert len(calls) == 1
+
+    async def test_same_slug_hits_once(self):
+        calls: list[str] = []
+        scraper = self._scraper(calls)
+
+        await scraper.extract_data("https://reverb.com/item/1-a")
+        await scraper.extract_data("https://reverb.com/item/1-a/")
+
+        assert calls == ["/api/listings/1-a"]
+
+    async def test_expired_entry_refetches(self, monkeypatch: pytest.MonkeyPatch):
+        calls: list[str] = []
+        scraper = self._scraper(calls)
+        await scraper.extract_data("https://reverb.com/item/1-a")
+        later = time.monotonic() + reverb_scraper.LISTING_CACHE_TTL_SECONDS + 1
+        monkeypatch.setattr("reverb_scraper.time.monotonic", lambda: later)
+
+        await scraper.extract_data("https://reverb.com/item/1-a")
+
+        assert len(calls) == 2
+
+    async def test_errors_not_cached(self):
+        calls: list[str] = []
+
+        failed = await self._scraper(calls, status=500).extract_data("https://reverb.com/item/1-a")
+        await self._scraper(calls).extract_data("https://reverb.com/item/1-a")
+
+        assert "error" in failed
+        assert len(calls) == 2
+
+    async def test_lru_eviction(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(reverb_scraper, "LISTING_CACHE_MAX_SIZE", 2)
+        calls: list[str] = []
+        scraper = self._scraper(calls)
+
+        for slug in ("1-a", "2-b", "1-a", "3-c", "2-b"):
+            await scraper.extract_data(f"https://reverb.com/item/{slug}")
+
+        # 2-b was least recently used when 3-c arrived, so it is fetched again
+        assert calls == [
+            "/api/listings/1-a",
+            "/api/listings/2-b",
+            "/api/listings/3-c",
+            "/api/listings/2-b",
+        ]
+
+    async def test_every_access_holds_the_lock(self, monkeypatch: pytest.MonkeyPatch):
+        # validate_model runs one event loop per worker thread over this cache.
+        lock = reverb_scraper._LISTING_CACHE_LOCK
+
+        class _CheckedCache(OrderedDict):
+            def get(self, *args):
+                assert lock.locked()
+                return super().get(*args)
+
+            def __setitem__(self, *args):
+                assert lock.locked()
+                super().__setitem__(*args)
+
+            def move_to_end(self, *args, **kwargs):
+                assert lock.locked()
+                super().move_to_end(*args, **kwargs)
+
+            def popitem(self, *args, **kwargs):
+                assert lock.locked()
+                return super().popitem(*args, **kwargs)
+
+        monkeypatch.setattr(reverb_scraper, "_LISTING_CACHE", _CheckedCache())
+        monkeypatch.setattr(reverb_scraper, "LISTING_CACHE_MAX_SIZE", 1)
+        scraper = self._scraper([])
+
+        for slug in ("1-a", "1-a", "2-b"):
+            assert "error" not in await scraper.extract_data(f"https://reverb.com/item/{slug}")
+
+        assert [slug for _, slug in reverb_scraper._LISTING_CACHE] == ["2-b"]
+
+
+class TestHttpStatusErrors:
+    """extract_data / extract_many tell a missing listing from a rate limit."""
+
+    @staticmethod
+    def _scraper(statuses: list[int], calls: list[str]) -> ReverbScraper:
+        """Answer with *statuses* in order, then 200 for every later request."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request.url.path)
+            status = statuses.pop(0) if statuses else 200
+            return httpx.Response(status, headers={"Retry-After": "0"}, json={"title": "OK"})
+
+        scraper = ReverbScraper()
+        scraper.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        return scraper
+
+    async def test_not_found_is_not_retried(self):
+        calls: list[str] = []
+
+        result = await self._scraper([404], calls).extract_data("https://reverb.com/item/1-a")
+
+        assert result["status_code"] == 404
+        assert result["error"] == "API error: listing not found"
+        assert len(calls) == 1
+
+    async def test_rate_limit_retried_then_succeeds(self):
+        calls: list[str] = []
+
+        result = await self._scraper([429, 429], calls).extract_data("https://reverb.com/item/1-a")
+
+        assert result["name"] == "OK"
+        assert len(calls) == 3
+
+    async def test_rate_limit_gives_up_after_retries(self):
+        calls: list[str] = []
+        statuses = [429] * (reverb_scraper.RATE_LIMIT_MAX_RETRIES + 1)
+
+        result = await self._scraper(statuses, calls).extract_data("https://reverb.com/item/1-a")
+
+        assert result["status_code"] == 429
+        assert len(calls) == reverb_scraper.RATE_LIMIT_MAX_RETRIES + 1
+
+    async def test_extract_many_stops_after_rate_limit(self):
+        calls: list[str] = []
+        statuses = [429] * (reverb_scraper.RATE_LIMIT_MAX_RETRIES + 1)
+        urls = ["https://reverb.com/item/1-a", "https://reverb.com/item/2-b"]
+
+        results = await self._scraper(statuses, calls).extract_many(urls, max_concurrent=1)
+
+        assert [r["status_code"] for r in results] == [429, 429]
+        assert [r["url"] for r in results] == urls
+        assert len(calls) == reverb_scraper.RATE_LIMIT_MAX_RETRIES + 1
+
+    @pytest.mark.parametrize(
+        "headers, attempt, low, high",
+        [
+            pytest.param({"Retry-After": "7"}, 0, 7.0, 7.0, id="retry-after"),
+            pytest.param({"Retry-After": "3600"}, 0, 30.0, 30.0, id="retry-after-clamped"),
+            pytest.param({}, 0, 1.0, 2.0, id="first-backoff"),
+            pytest.param({}, 2, 4.0, 8.0, id="third-backoff"),
+            pytest.param({"Retry-After": "soon"}, 1, 2.0, 4.0, id="unparsable-header"),
+        ],
+    )
+    def test_retry_delay(self, headers: dict, attempt: int, low: float, high: float):
+        response = httpx.Response(429, headers=headers)
+        assert low <= ReverbScraper._retry_delay(response, attempt) <= high
+
+
+async def test_shared_client_left_open():
+    owner = ReverbScraper()
+    async with ReverbScraper(default_shipping="99.00", client=owner.client) as borrower:
+        assert borrower.client is owner.client
+    assert not owner.client.is_closed
+    await owner.aclose()
+    assert owner.client.is_closed
@@ -1,31 +1,41 @@
 """Tests for sync_model — Reverb API calls recorded via VCR cassettes."""
 
+import asyncio
 from unittest.mock import MagicMock, patch
 
+import httpx
 import pytest
 from click.testing import CliRunner
+from odoolib.tools import JsonRPCException
 
 from models import ListingRecord
 from sync_model import (
     DEFAULT_SHIPPING,
     REWATCH_PRICE_DROP_THRESHOLD,
+    ReportItem,
     _apply_updates,
     _build_report,
+    _build_sync_data,
     _clean_url,
+    _collect_all_async,
     _collect_sync_data,
     _compute_changes,
     _download_image_base64,
     _ebay_item_id,
     _fetch_all_models,
     _fetch_listings,
+    _fetch_listings_bulk,
     _find_entries_without_image,
     _find_model,
     _is_brand_new,
     _listing_vals_from_scrape,
+    _listings_for_model,
+    _m2o_id,
     _print_report,
     _reverb_item_id,
     _round_price,
     _search_reverb,
+    _search_reverb_async,
     cli,
 )
 
@@ -718,8 +728,8 @@ class TestBuildReport:
         report = _build_report(reverb_results, odoo_entries, model_id=42)
 
         assert len(report) == 1
-        assert report[0]["action"] == "create"
-        assert report[0]["create_vals"]["x_model_id"] == 42
+        assert report[0].action == "create"
+        assert report[0].create_vals["x_model_id"] == 42
 
     def test_brand_new_listing_skipped(self):
         reverb_results = [
@@ -730,9 +740,9 @@ class TestBuildReport:
         report = _build_report(reverb_results, odoo_entries, model_id=42)
 
         assert len(report) == 1
-        assert report[0]["action"] == "skip"
-        assert any("brand new" in w for w in report[0]["warnings"])
-        assert report[0]["create_vals"] == {}
+        assert report[0].action == "skip"
+        assert any("brand new" in w for w in report[0].warnings)
+        assert report[0].create_vals == {}
 
     def test_brand_new_existing_still_updated(self):
         """A brand-new listing that already exists in Odoo should still be updated."""
@@ -743,8 +753,8 @@ class TestBuildReport:
         report = _build_report(reverb_results, odoo_entries, model_id=42)
 
         assert len(report) == 1
-        assert report[0]["action"] == "update"
-        assert report[0]["changes"]["x_price"] == 4000.0
+        assert report[0].action == "update"
+        assert report[0].changes["x_price"] == 4000.0
 
     def test_existing_up_to_date(self):
         url = "https://reverb.com/item/1-g"
@@ -754,7 +764,7 @@ class TestBuildReport:
         report = _build_report(reverb_results, odoo_entries, model_id=42)
 
         assert len(report) == 1
-        assert report[0]["action"] == "ok"
+        assert report[0].action == "ok"
 
     def test_slug_changed_matches_by_item_id(self):
         """When Reverb renames a listing the URL slug changes but item ID stays the same.
@@ -767,8 +777,8 @@ class TestBuildReport:
         report = _build_report(reverb_results, odoo_entries, model_id=42)
 
         assert len(report) == 1
-        assert report[0]["action"] == "update"
-        assert report[0]["entry"] is not None
+        assert report[0].action == "update"
+        assert report[0].entry is not None
 
     def test_different_item_id_creates(self):
         """A genuinely new listing (different item ID) should still be created."""
@@ -780,7 +790,7 @@ class TestBuildReport:
         report = _build_report(reverb_results, odoo_entries, model_id=42)
 
         assert len(report) == 1
-        assert report[0]["action"] == "create"
+        assert report[0].action == "create"
 
     def test_existing_needs_update(self):
         url = "https://reverb.com/item/1-g"
@@ -790,8 +800,8 @@ class TestBuildReport:
         report = _build_report(reverb_results, odoo_entries, model_id=42)
 
         assert len(report) == 1
-        assert report[0]["action"] == "update"
-        assert report[0]["changes"]["x_price"] == 4000.0
+        assert report[0].action == "update"
+        assert report[0].changes["x_price"] == 4000.0
 
     def test_url_query_string_stripped_for_matching(self):
         reverb_results = [self._make_reverb(url="https://reverb.com/item/1-g")]
@@ -799,7 +809,7 @@ class TestBuildReport:
 
         report = _build_report(reverb_results, odoo_entries, model_id=42)
 
-        assert report[0]["action"] == "ok"
+        assert report[0].action == "ok"
 
     def test_error_result_skipped(self):
         reverb_results = [{"url": "https://reverb.com/item/1-g", "error": "timeout"}]
@@ -808,8 +818,8 @@ class TestBuildReport:
         report = _build_report(reverb_results, odoo_entries, model_id=42)
 
         assert len(report) == 1
-        assert report[0]["action"] == "skip"
-        assert "Reverb API error" in report[0]["warnings"][0]
+        assert report[0].action == "skip"
+        assert "Reverb API error" in report[0].warnings[0]
 
     def test_sold_listing_warns(self):
         url = "https://reverb.com/item/1-g"
@@ -825,7 +835,7 @@ class TestBuildReport:
 
         report = _build_report(reverb_results, odoo_entries, model_id=42)
 
-        assert any("status: Sold" in w for w in report[0]["warnings"])
+        assert any("status: Sold" in w for w in report[0].warnings)
 
     def test_no_ship_to_canada_warns(self):
         url = "https://reverb.com/item/1-g"
@@ -834,7 +844,7 @@ class TestBuildReport:
 
         report = _build_report(reverb_results, odoo_entries, model_id=42)
 
-        assert any("does NOT ship to Canada" in w for w in report[0]["warnings"])
+        assert any("does NOT ship to Canada" in w for w in report[0].warnings)
 
     def test_mixed_create_update_ok(self):
         reverb_results = [
@@ -849,7 +859,7 @@ class TestBuildReport:
 
         report = _build_report(reverb_results, odoo_entries, model_id=42)
 
-        actions = [r["action"] for r in report]
+        actions = [r.action for r in report]
         assert actions == ["ok", "update", "create"]
 
     def test_mixed_with_brand_new_skipped(self):
@@ -864,7 +874,7 @@ class TestBuildReport:
 
         report = _build_report(reverb_results, odoo_entries, model_id=42)
 
-        actions = [r["action"] for r in report]
+        actions = [r.action for r in report]
         assert actions == ["ok", "skip", "create"]
 
     def test_include_brand_new_creates_instead_of_skipping(self):
@@ -876,8 +886,8 @@ class TestBuildReport:
         report = _build_report(reverb_results, odoo_entries, model_id=42, include_brand_new=True)
 
         assert len(report) == 1
-        assert report[0]["action"] == "create"
-        assert report[0]["create_vals"]["x_model_id"] == 42
+        assert report[0].action == "create"
+        assert report[0].create_vals["x_model_id"] == 42
 
     def test_cross_model_match_flags_other_model_id(self):
         """When the matched entry belongs to a different model, the report
@@ -893,9 +903,9 @@ class TestBuildReport:
         report = _build_report(reverb_results, odoo_entries, model_id=42)
 
         assert len(report) == 1
-        assert report[0]["action"] == "update"
-        assert report[0]["other_model_id"] == 99
-        assert "x_model_id" not in report[0]["changes"]
+        assert report[0].action == "update"
+        assert report[0].other_model_id == 99
+        assert "x_model_id" not in report[0].changes
 
     def test_same_model_match_other_model_id_is_none(self):
         url = "https://reverb.com/item/1-g"
@@ -904,7 +914,7 @@ class TestBuildReport:
 
         report = _build_report(reverb_results, odoo_entries, model_id=42)
 
-        assert report[0]["other_model_id"] is None
+        assert report[0].other_model_id is None
 
     def test_new_listing_has_other_model_id_none(self):
         reverb_results = [
@@ -912,8 +922,8 @@ class TestBuildReport:
         ]
         report = _build_report(reverb_results, [], model_id=42)
 
-        assert report[0]["action"] == "create"
-        assert report[0]["other_model_id"] is None
+        assert report[0].action == "create"
+        assert report[0].other_model_id is None
 
     def test_cross_model_match_does_not_create(self):
         """If the URL already exists under another model, no create entry
@@ -924,7 +934,7 @@ class TestBuildReport:
 
         report = _build_report(reverb_results, odoo_entries, model_id=42)
 
-        actions = [r["action"] for r in report]
+        actions = [r.action for r in report]
         assert "create" not in actions
 
     def test_duplicate_url_first_wins_and_warns(self):
@@ -942,7 +952,7 @@ class TestBuildReport:
         with patch("sync_model.logger.warning") as warn:
             report = _build_report(reverb_results, [first, second], model_id=42)
 
-        assert report[0]["entry"].id == 100
+        assert report[0].entry.id == 100
         assert warn.called
         warn_args = " ".join(str(a) for call in warn.call_args_list for a in call.args)
         assert "100" in warn_args
@@ -971,8 +981,8 @@ class TestBuildReport:
         report = _build_report([scrape_result], [odoo_entry], model_id=42)
 
         assert len(report) == 1
-        assert report[0]["action"] in ("ok", "update")
-        assert report[0]["entry"].id == 77
+        assert report[0].action in ("ok", "update")
+        assert report[0].entry.id == 77
 
 
 # ── _print_report ─────────────────────────────────────────────────────────
@@ -983,36 +993,36 @@ class TestPrintReport:
 
     def test_counts(self, capsys):
         report = [
-            {
-                "action": "ok",
-                "reverb": {"name": "A", "price_display": "$1"},
-                "entry": ListingRecord.from_odoo({"id": 1}),
-                "changes": {},
-                "warnings": [],
-            },
-            {
-                "action": "update",
-                "reverb": {"name": "B", "price_display": "$2"},
-                "entry": ListingRecord.from_odoo({"id": 2, "x_price": 99}),
-                "changes": {"x_price": 99},
-                "warnings": [],
-            },
-            {
-                "action": "create",
-                "reverb": {"name": "C", "price_display": "$3"},
-                "entry": None,
-                "create_vals": {},
-                "changes": {},
-                "warnings": [],
-            },
-            {
-                "action": "create",
-                "reverb": {"name": "D", "price_display": "$4"},
-                "entry": None,
-                "create_vals": {},
-                "changes": {},
-                "warnings": [],
-            },
+            ReportItem(
+                action="ok",
+                reverb={"name": "A", "price_display": "$1"},
+                entry=ListingRecord.from_odoo({"id": 1}),
+                changes={},
+                warnings=[],
+            ),
+            ReportItem(
+                action="update",
+                reverb={"name": "B", "price_display": "$2"},
+                entry=ListingRecord.from_odoo({"id": 2, "x_price": 99}),
+                changes={"x_price": 99},
+                warnings=[],
+            ),
+            ReportItem(
+                action="create",
+                reverb={"name": "C", "price_display": "$3"},
+                entry=None,
+                create_vals={},
+                changes={},
+                warnings=[],
+            ),
+            ReportItem(
+                action="create",
+                reverb={"name": "D", "price_display": "$4"},
+                entry=None,
+                create_vals={},
+                changes={},
+                warnings=[],
+            ),
         ]
         upd, crt = _print_report(report)
         assert upd == 1
@@ -1020,30 +1030,43 @@ class TestPrintReport:
 
     def test_all_ok_returns_zeros(self, capsys):
         report = [
-            {
-                "action": "ok",
-                "reverb": {"name": "A", "price_display": "$1"},
-                "entry": ListingRecord.from_odoo({"id": 1}),
-                "changes": {},
-                "warnings": [],
-            },
+            ReportItem(
+                action="ok",
+                reverb={"name": "A", "price_display": "$1"},
+                entry=ListingRecord.from_odoo({"id": 1}),
+                changes={},
+                warnings=[],
+            ),
         ]
         upd, crt = _print_report(report)
         assert upd == 0
         assert crt == 0
 
+    def test_uses_precomputed_counts(self, capsys):
+        report = [
+            ReportItem(
+                action="ok",
+                reverb={"name": "A", "price_display": "$1"},
+                entry=ListingRecord.from_odoo({"id": 1}),
+                changes={},
+                warnings=[],
+            ),
+        ]
+        upd, crt = _print_report(report, {"update": 3, "create": 4, "skip": 0})
+        assert (upd, crt) == (3, 4)
+
     def test_cross_model_hint_shown_in_info_column(self, capsys):
         report = [
-            {
-                "action": "update",
-                "reverb": {"name": "G", "price_display": "$1"},
-                "entry": ListingRecord.from_odoo(
+            ReportItem(
+                action="update",
+                reverb={"name": "G", "price_display": "$1"},
+                entry=ListingRecord.from_odoo(
                     {"id": 200, "x_price": 99, "x_model_id": [1155, "Grez Mendocino Jr"]}
                 ),
-                "changes": {"x_price": 99},
-                "warnings": [],
-                "other_model_id": 1155,
-            },
+                changes={"x_price": 99},
+                warnings=[],
+                other_model_id=1155,
+            ),
         ]
         _print_report(report)
         out = capsys.readouterr().out
@@ -1057,14 +1080,14 @@ class TestPrintReport:
 
     def test_no_hint_when_same_model(self, capsys):
         report = [
-            {
-                "action": "update",
-                "reverb": {"name": "G", "price_display": "$1"},
-                "entry": ListingRecord.from_odoo({"id": 200, "x_price": 99}),
-                "changes": {"x_price": 99},
-                "warnings": [],
-                "other_model_id": None,
-            },
+            ReportItem(
+                action="update",
+                reverb={"name": "G", "price_display": "$1"},
+                entry=ListingRecord.from_odoo({"id": 200, "x_price": 99}),
+                changes={"x_price": 99},
+                warnings=[],
+                other_model_id=None,
+            ),
         ]
         _print_report(report)
         out = capsys.readouterr().out
@@ -1122,6 +1145,22 @@ class TestFindModel:
             "category_slug": "electric-guitars",
             "default_shipping": 250.0,
         }
+        conn.get_model("x_reverb_category").search_read.assert_called_once_with(
+            [("id", "=", 110)], ("x_studio_slug", "x_studio_shipping_default_price"), limit=1
+        )
+
+    def test_dangling_category_falls_back_to_defaults(self):
+        conn = self._mock_conn(
+            [
+                {
+                    "id": 234,
+                    "x_name": "Frank Brothers Arcane",
+                    "x_studio_reverb_category_id": [110, "Deleted"],
+                }
+            ],
+        )
+        result = _find_model(conn, "Frank Brothers Arcane")
+        assert result == {"id": 234, "category_slug": None, "default_shipping": DEFAULT_SHIPPING}
 
     def test_exact_match_no_category(self):
         conn = self._mock_conn(
@@ -1184,6 +1223,30 @@ class TestFindModel:
             "default_shipping": 35.0,
         }
 
+    def test_exact_lookup_skips_substring_search(self):
+        conn = self._mock_conn(
+            [{"id": 234, "x_name": "Frank Brothers Arcane", "x_studio_reverb_category_id": False}],
+        )
+        _find_model(conn, "frank brothers arcane")
+
+        models_mock = conn.get_model("x_models")
+        models_mock.search_read.assert_called_once()
+        domain = models_mock.search_read.call_args.args[0]
+        assert domain == [("x_name", "=ilike", "frank brothers arcane")]
+        assert models_mock.search_read.call_args.kwargs == {"limit": 2}
+
+    def test_no_exact_match_falls_back_to_ilike(self):
+        conn = self._mock_conn([])
+        models_mock = conn.get_model("x_models")
+        models_mock.search_read.side_effect = [
+            [],
+            [{"id": 10, "x_name": "Some Model", "x_studio_reverb_category_id": False}],
+        ]
+
+        assert _find_model(conn, "Some")["id"] == 10
+        domains = [c.args[0] for c in models_mock.search_read.call_args_list]
+        assert domains == [[("x_name", "=ilike", "Some")], [("x_name", "ilike", "Some")]]
+
 
 # ── _apply_updates (mocked Odoo) ─────────────────────────────────────────
 
@@ -1191,10 +1254,10 @@ class TestFindModel:
 class TestApplyUpdates:
     """Unit tests for _apply_updates with mocked Odoo connection."""
 
-    def _mock_conn(self, gear_create_return=777):
+    def _mock_conn(self, gear_create_return=(777,)):
         conn = MagicMock()
         gear_mock = MagicMock()
-        gear_mock.create.return_value = gear_create_return
+        gear_mock.create.return_value = list(gear_create_return)
         gear_mock.search_read.return_value = []  # no entries without image
 
         conn.get_model.return_value = gear_mock
@@ -1203,20 +1266,20 @@ class TestApplyUpdates:
     def test_writes_updates(self):
         conn, gear_mock = self._mock_conn()
         report = [
-            {
-                "action": "update",
-                "entry": ListingRecord.from_odoo({"id": 100}),
-                "changes": {"x_price": 4000.0},
-            },
-            {"action": "ok", "entry": ListingRecord.from_odoo({"id": 200}), "changes": {}},
+            ReportItem(
+                action="update",
+                entry=ListingRecord.from_odoo({"id": 100}),
+                changes={"x_price": 4000.0},
+            ),
+            ReportItem(action="ok", entry=ListingRecord.from_odoo({"id": 200}), changes={}),
         ]
         upd, crt = _apply_updates(conn, report)
         assert upd == 1
         assert crt == 0
-        gear_mock.write.assert_called_once_with(100, {"x_price": 4000.0})
+        gear_mock.write.assert_called_once_with([100], {"x_price": 4000.0})
 
     def test_creates_new_entries(self):
-        conn, gear_mock = self._mock_conn(gear_create_return=777)
+        conn, gear_mock = self._mock_conn(gear_create_return=(777,))
         listing_vals = {
             "x_name": "New Guitar",
             "x_model_id": 42,
@@ -1225,22 +1288,22 @@ class TestApplyUpdates:
             "x_platform": "reverb",
         }
         report = [
-            {
-                "action": "create",
-                "create_vals": listing_vals,
-                "reverb": {"photo_url": ""},
-            },
+            ReportItem(
+                action="create",
+                create_vals=listing_vals,
+                reverb={"photo_url": ""},
+            ),
         ]
         upd, crt = _apply_updates(conn, report)
         assert upd == 0
         assert crt == 1
-        gear_mock.create.assert_called_once_with(listing_vals)
+        gear_mock.create.assert_called_once_with([listing_vals])
 
     def test_skips_ok_entries(self):
         conn, gear_mock = self._mock_conn()
         report = [
-            {"action": "ok", "entry": ListingRecord.from_odoo({"id": 1}), "changes": {}},
-            {"action": "skip", "entry": None, "changes": {}},
+            ReportItem(action="ok", entry=ListingRecord.from_odoo({"id": 1}), changes={}),
+            ReportItem(action="skip", entry=None, changes={}),
         ]
         upd, crt = _apply_updates(conn, report)
         assert upd == 0
@@ -1248,7 +1311,7 @@ class TestApplyUpdates:
         gear_mock.create.assert_not_called()
 
     def test_mixed_updates_and_creates(self):
-        conn, gear_mock = self._mock_conn(gear_create_return=100)
+        conn, gear_mock = self._mock_conn(gear_create_return=(100, 101))
         gear_vals = {
             "x_name": "G",
             "x_model_id": 1,
@@ -1257,20 +1320,102 @@ class TestApplyUpdates:
             "x_platform": "reverb",
         }
         report = [
-            {
-                "action": "update",
-                "entry": ListingRecord.from_odoo({"id": 50}),
-                "changes": {"x_price": 1.0},
-            },
-            {"action": "create", "create_vals": gear_vals, "reverb": {"photo_url": ""}},
-            {"action": "ok", "entry": ListingRecord.from_odoo({"id": 200}), "changes": {}},
-            {"action": "create", "create_vals": gear_vals, "reverb": {"photo_url": ""}},
+            ReportItem(
+                action="update",
+                entry=ListingRecord.from_odoo({"id": 50}),
+                changes={"x_price": 1.0},
+            ),
+            ReportItem(action="create", create_vals=gear_vals, reverb={"photo_url": ""}),
+            ReportItem(action="ok", entry=ListingRecord.from_odoo({"id": 200}), changes={}),
+            ReportItem(action="create", create_vals=gear_vals, reverb={"photo_url": ""}),
         ]
         upd, crt = _apply_updates(conn, report)
         assert upd == 1
         assert crt == 2
         gear_mock.write.assert_called_once()
-        assert gear_mock.create.call_count == 2
+        gear_mock.create.assert_called_once_with([gear_vals, gear_vals])
+
+    def test_identical_changes_share_one_write(self):
+        conn, gear_mock = self._mock_conn()
+        report = [
+            ReportItem(
+                action="update",
+                entry=ListingRecord.from_odoo({"id": eid}),
+                changes=changes,
+            )
+            for eid, changes in [
+                (1, {"x_is_available": False}),
+                (2, {"x_price": 10.0}),
+                (3, {"x_is_available": False}),
+            ]
+        ]
+
+        upd, _ = _apply_updates(conn, report)
+
+        assert upd == 3
+        assert gear_mock.write.call_args_list == [
+            (([1, 3], {"x_is_available": False}),),
+            (([2], {"x_price": 10.0}),),
+        ]
+
+    def test_failed_batch_write_retries_per_row(self):
+        conn, gear_mock = self._mock_conn()
+
+        def _write(ids, changes):
+            if len(ids) > 1 or ids == [2]:
+                raise RuntimeError("bad row")
+
+        gear_mock.write.side_effect = _write
+        report = [
+            ReportItem(
+                action="update",
+                entry=ListingRecord.from_odoo({"id": eid}),
+                changes={"x_is_available": False},
+            )
+            for eid in (1, 2, 3)
+        ]
+
+        with pytest.raises(RuntimeError, match="bad row"):
+            _apply_updates(conn, report)
+
+        # Rows 1 and 3 were still written before the failure surfaced.
+        assert gear_mock.write.call_count == 4
+        gear_mock.write.assert_any_call([1], {"x_is_available": False})
+        gear_mock.write.assert_any_call([3], {"x_is_available": False})
+
+    def test_failed_batch_create_retries_per_row(self):
+        conn, gear_mock = self._mock_conn()
+        vals = [{"x_name": name} for name in ("A", "B", "C")]
+
+        def _create(vals_list):
+            if len(vals_list) > 1 or vals_list[0]["x_name"] == "B":
+                raise JsonRPCException({"message": "bad row"})
+            return [len(vals_list[0]["x_name"])]
+
+        gear_mock.create.side_effect = _create
+        report = [ReportItem(action="create", create_vals=v, reverb={}) for v in vals]
+
+        with pytest.raises(JsonRPCException):
+            _apply_updates(conn, report)
+
+        # A and C were still created before the failure surfaced.
+        assert gear_mock.create.call_count == 4
+        gear_mock.create.assert_any_call([{"x_name": "A"}])
+        gear_mock.create.assert_any_call([{"x_name": "C"}])
+
+    def test_batch_create_transport_error_is_not_retried(self):
+        # The server may have committed the batch before the read timed out.
+        conn, gear_mock = self._mock_conn()
+        gear_mock.create.side_effect = httpx.ReadTimeout("timed out")
+        report = [
+            ReportItem(action="create", create_vals={"x_name": name}, reverb={})
+            for name in ("A", "B")
+        ]
+
+        with pytest.raises(httpx.ReadTimeout):
+            _apply_updates(conn, report)
+
+        assert gear_mock.create.call_count == 1
 
 
 # ── _search_reverb (VCR cassette) ────────────────────────────────────────
@@ -1351,6 +1496,42 @@ def test_search_reverb_state_parameter(include_sold: bool, expected_state: str):
     assert captured_states == [expected_state]
 
 
+async def test_search_reverb_async_dedups_by_url():
+    scraper = MagicMock()
+
+    async def fake_search(query, **kwargs):
+        return [
+            {"url": "https://reverb.com/item/1-a", "price": "1"},
+            {"url": ""},
+            {"url": "https://reverb.com/item/2-b"},
+            {"url": "https://reverb.com/item/1-a", "price": "2"},
+        ]
+
+    scraper.search = fake_search
+
+    results = await _search_reverb_async(scraper, "q")
+
+    assert [(r["url"], r.get("price")) for r in results] == [
+        ("https://reverb.com/item/1-a", "2"),
+        ("https://reverb.com/item/2-b", None),
+    ]
+    assert {r["_platform"] for r in results} == {"reverb"}
+
+
+@pytest.mark.parametrize(
+    "ref, expected",
+    [
+        pytest.param([7, "Electric"], 7, id="list"),
+        pytest.param((7, "Electric"), 7, id="tuple"),
+        pytest.param(7, 7, id="bare-id"),
+        pytest.param(False, None, id="false"),
+        pytest.param(None, None, id="none"),
+    ],
+)
+def test_m2o_id(ref, expected):
+    assert _m2o_id(ref) == expected
+
+
 # ── _fetch_all_models (mocked Odoo) ──────────────────────────────────────
 
 
@@ -1502,6 +1683,24 @@ class TestFetchAllModels:
         call_domain = models_mock.search_read.call_args[0][0]
         assert call_domain == []
 
+    def test_reads_models_page_by_page(self):
+        """Models are read in limit/offset pages until a short page."""
+        records = [
+            {"id": i, "x_name": f"M{i}", "x_studio_reverb_category_id": False} for i in range(1, 4)
+        ]
+        conn = self._mock_conn([])
+        models_mock = conn.get_model("x_models")
+        models_mock.search_read.side_effect = lambda domain, fields, offset, limit, order: records[
+            offset : offset + limit
+        ]
+
+        with patch("sync_model.MODELS_PAGE_SIZE", 2):
+            result = _fetch_all_models(conn)
+
+        assert [m["id"] for m in result] == [1, 2, 3]
+        offsets = [c.kwargs["offset"] for c in models_mock.search_read.call_args_list]
+        assert offsets == [0, 2]
+
 
 # ── _collect_sync_data (mocked I/O) ──────────────────────────────────────
 
@@ -1577,6 +1776,30 @@ class TestCollectSyncData:
         assert len(result["report"]) == 1
         assert result["create_count"] == 1  # new listing → create
 
+    def test_action_counts_tally_the_report(self):
+        import sync_model
+
+        reverb_results = [
+            {"url": "https://reverb.com/item/1-a", "name": "A", "price": "100"},
+            {"url": "https://reverb.com/item/2-b", "name": "B", "price": "200"},
+        ]
+        with (
+            patch.object(sync_model, "PLATFORMS", self._fake_platforms(reverb_results)),
+            patch("sync_model._fetch_listings", return_value=[]),
+        ):
+            result = _collect_sync_data(
+                MagicMock(),
+                model_id=42,
+                model_name="Test",
+                category_slug=None,
+                default_shipping=250.0,
+                platforms=["reverb"],
+            )
+
+        assert result["action_counts"] == {"create": 2}
+        assert result["create_count"] == 2
+        assert result["update_count"] == 0
+
     def test_echoes_back_model_metadata(self):
         import sync_model
 
@@ -1811,6 +2034,281 @@ class TestCollectSyncData:
         assert "nonexistent" in warn_args
 
 
+# ── _fetch_listings_bulk / _listings_for_model ───────────────────────────
+
+
+class TestFetchListingsBulk:
+    """One x_listing query covers every model plus the cross-model URLs."""
+
+    @pytest.mark.parametrize(
+        "extra_urls, expected_domain",
+        [
+            pytest.param(None, [("x_model_id", "in", [1, 2])], id="models-only"),
+            pytest.param(
+                ["https://x/1"],
+                ["|", ("x_model_id", "in", [1, 2]), ("x_url", "in", ["https://x/1"])],
+                id="with-urls",
+            ),
+        ],
+    )
+    def test_domain(self, extra_urls, expected_domain):
+        conn = MagicMock()
+        conn.get_model.return_value.search_read.return_value = [{"id": 5}]
+
+        entries = _fetch_listings_bulk(conn, [1, 2], extra_urls)
+
+        conn.get_model.assert_called_once_with("x_listing")
+        domain = conn.get_model.return_value.search_read.call_args.args[0]
+        assert domain == expected_domain
+        assert [e.id for e in entries] == [5]
+
+    def test_nothing_to_match_skips_query(self):
+        conn = MagicMock()
+        assert _fetch_listings_bulk(conn, [], []) == []
+        conn.get_model.assert_not_called()
+
+    def test_urls_only(self):
+        conn = MagicMock()
+        conn.get_model.return_value.search_read.return_value = []
+
+        _fetch_listings_bulk(conn, [], ["https://x/1"])
+
+        domain = conn.get_model.return_value.search_read.call_args.args[0]
+        assert domain == [("x_url", "in", ["https://x/1"])]
+
+    def test_listings_for_model_matches_model_or_url(self):
+        entries = [
+            ListingRecord(id=1, x_model_id=(7, "Own"), x_url="https://x/a"),
+            ListingRecord(id=2, x_model_id=(8, "Other"), x_url="https://x/b"),
+            ListingRecord(id=3, x_model_id=(8, "Other"), x_url="https://x/c"),
+            ListingRecord(id=4, x_model_id=None, x_url=None),
+        ]
+
+        selected = _listings_for_model(entries, 7, {"https://x/c"})
+
+        assert [e.id for e in selected] == [1, 3]
+
+
+# ── _collect_all_async (mocked I/O) ──────────────────────────────────────
+
+
+class TestCollectAllAsync:
+    """--all mode collects every model on one event loop and one Reverb client."""
+
+    _MODELS = [
+        {"id": 1, "name": "Alpha", "category_slug": None, "default_shipping": 100.0},
+        {"id": 2, "name": "Beta", "category_slug": "electric-guitars", "default_shipping": 200.0},
+        {"id": 3, "name": "Gamma", "category_slug": None, "default_shipping": 300.0},
+    ]
+
+    @staticmethod
+    def _fake_search(calls: list[tuple], fail_on: str | None = None):
+        async def fake(scraper, query, *, category=None, include_sold=False):
+            calls.append((query, scraper.client, scraper.default_shipping))
+            await asyncio.sleep(0)
+            if query == fail_on:
+                raise RuntimeError("boom")
+            return [{"url": f"https://reverb.com/item/{len(calls)}-{query}", "name": query}]
+
+        return fake
+
+    async def test_shares_one_client_and_keeps_order(self):
+        calls: list[tuple] = []
+        with (
+            patch("sync_model._search_reverb_async", self._fake_search(calls)),
+            patch("sync_model._fetch_listings_bulk", return_value=[]),
+        ):
+            collected = await _collect_all_async(
+                MagicMock(), self._MODELS, workers=2, platforms=["reverb"]
+            )
+
+        assert [d["model_name"] for d in collected] == ["Alpha", "Beta", "Gamma"]
+        assert [d["create_count"] for d in collected] == [1, 1, 1]
+        assert len({id(client) for _, client, _ in calls}) == 1
+        assert sorted(shipping for _, _, shipping in calls) == ["100.00", "200.00", "300.00"]
+
+    async def test_failed_model_yields_empty_result(self):
+        calls: list[tuple] = []
+        done: list[int] = []
+        with (
+            patch("sync_model._search_reverb_async", self._fake_search(calls, fail_on="Beta")),
+            patch("sync_model._fetch_listings_bulk", return_value=[]),
+        ):
+            collected = await _collect_all_async(
+                MagicMock(),
+                self._MODELS,
+                workers=3,
+                platforms=["reverb"],
+                on_done=lambda: done.append(1),
+            )
+
+        assert collected[1]["model_id"] == 2
+        assert collected[1]["report"] == []
+        assert collected[0]["create_count"] == collected[2]["create_count"] == 1
+        assert len(done) == 3
+
+    async def test_failed_listing_read_yields_empty_results(self):
+        with (
+            patch("sync_model._search_reverb_async", self._fake_search([])),
+            patch("sync_model._fetch_listings_bulk", side_effect=RuntimeError("odoo down")),
+        ):
+            collected = await _collect_all_async(
+                MagicMock(), self._MODELS, workers=3, platforms=["reverb"]
+            )
+
+        assert [d["model_id"] for d in collected] == [1, 2, 3]
+        assert all(d["report"] == [] for d in collected)
+
+    async def test_failed_build_only_empties_that_model(self):
+        build = _build_sync_data
+
+        def flaky_build(conn, results, *, model_name, **kwargs):
+            if model_name == "Beta":
+                raise RuntimeError("bad row")
+            return build(conn, results, model_name=model_name, **kwargs)
+
+        with (
+            patch("sync_model._search_reverb_async", self._fake_search([])),
+            patch("sync_model._fetch_listings_bulk", return_value=[]),
+            patch("sync_model._build_sync_data", flaky_build),
+        ):
+            collected = await _collect_all_async(
+                MagicMock(), self._MODELS, workers=3, platforms=["reverb"]
+            )
+
+        assert [d["create_count"] for d in collected] == [1, 0, 1]
+        assert collected[1]["model_id"] == 2
+
+    async def test_workers_caps_models_in_flight(self):
+        in_flight = 0
+        peak = 0
+
+        async def fake(scraper, query, *, category=None, include_sold=False):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return []
+
+        with patch("sync_model._search_reverb_async", fake):
+            await _collect_all_async(MagicMock(), self._MODELS, workers=1, platforms=["reverb"])
+
+        assert peak == 1
+
+    async def test_odoo_listings_read_once_for_models_with_results(self):
+        calls: list[tuple] = []
+        alpha_row = ListingRecord(id=10, x_model_id=(1, "Alpha"), x_url="https://x/1")
+        beta_row = ListingRecord(id=20, x_model_id=(2, "Beta"), x_url="https://x/2")
+        bulk_calls: list[tuple] = []
+
+        def fake_bulk(conn, model_ids, extra_urls=None):
+            bulk_calls.append((model_ids, sorted(extra_urls or [])))
+            gamma_url = next(u for u in extra_urls if u.endswith("-Gamma"))
+            other = ListingRecord(id=30, x_model_id=(9, "Other"), x_url=gamma_url)
+            return [alpha_row, beta_row, other]
+
+        with (
+            patch("sync_model._search_reverb_async", self._fake_search(calls, fail_on="Beta")),
+            patch("sync_model._fetch_listings_bulk", fake_bulk),
+        ):
+            collected = await _collect_all_async(
+                MagicMock(), self._MODELS, workers=3, platforms=["reverb"]
+            )
+
+        assert len(bulk_calls) == 1
+        assert bulk_calls[0][0] == [1, 3]
+        assert len(bulk_calls[0][1]) == 2
+        assert [e.id for e in collected[0]["odoo_entries"]] == [10]
+        assert collected[1]["odoo_entries"] == []
+        assert [e.id for e in collected[2]["odoo_entries"]] == [30]
+
+    async def test_no_results_requests_no_rows(self):
+        async def empty(scraper, query, *, category=None, include_sold=False):
+            return []
+
+        with (
+            patch("sync_model._search_reverb_async", empty),
+            patch("sync_model._fetch_listings_bulk", return_value=[]) as bulk,
+        ):
+            await _collect_all_async(MagicMock(), self._MODELS, workers=3, platforms=["reverb"])
+
+        bulk.assert_called_once()
+        assert bulk.call_args.args[1:] == ([], [])
+
+    async def test_sync_platforms_run_from_registry(self):
+        import sync_model
+
+        fake_ebay = MagicMock(return_value=[])
+        with patch.object(sync_model, "PLATFORMS", {"ebay": fake_ebay}):
+            collected = await _collect_all_async(
+                MagicMock(), self._MODELS[:1], workers=1, platforms=["ebay"]
+            )
+
+        fake_ebay.assert_called_once_with(
+            "Alpha", category=None, default_shipping=100.0, include_sold=False
+        )
+        assert collected[0]["reverb_results"] == []
+
+    async def test_escaping_error_cancels_other_searches(self):
+        cancelled: list[str] = []
+
+        async def fake(scraper, query, *, category=None, include_sold=False):
+            if query == "Alpha":
+                return []
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled.append(query)
+                raise
+
+        def on_done():
+            raise RuntimeError("progress bar gone")
+
+        with (
+            patch("sync_model._search_reverb_async", fake),
+            pytest.raises(ExceptionGroup),
+        ):
+            await _collect_all_async(
+                MagicMock(), self._MODELS, workers=3, platforms=["reverb"], on_done=on_done
+            )
+
+        assert sorted(cancelled) == ["Beta", "Gamma"]
+
+    async def test_identical_searches_run_once(self):
+        calls: list[tuple] = []
+        models = [{**mi, "category_slug": None, "default_shipping": 100.0} for mi in self._MODELS]
+        done: list[int] = []
+        with (
+            patch("sync_model._search_reverb_async", self._fake_search(calls)),
+            patch("sync_model._fetch_listings_bulk", return_value=[]),
+        ):
+            collected = await _collect_all_async(
+                MagicMock(),
+                models,
+                workers=3,
+                search_query="Strat",
+                platforms=["reverb"],
+                on_done=lambda: done.append(1),
+            )
+
+        assert len(calls) == 1
+        assert [d["create_count"] for d in collected] == [1, 1, 1]
+        assert len(done) == 3
+
+    async def test_differing_shipping_is_searched_separately(self):
+        calls: list[tuple] = []
+        with (
+            patch("sync_model._search_reverb_async", self._fake_search(calls)),
+            patch("sync_model._fetch_listings_bulk", return_value=[]),
+        ):
+            await _collect_all_async(
+                MagicMock(), self._MODELS, workers=3, search_query="Strat", platforms=["reverb"]
+            )
+
+        assert len(calls) == 3
+
+
 # ── _download_image_base64 ───────────────────────────────────────────────
 
 
@@ -1922,7 +2420,7 @@ class TestApplyUpdatesImages:
         gear_mock = MagicMock()
         gear_mock.create.return_value = gear_create_return
         listing_mock = MagicMock()
-        listing_mock.create.return_value = listing_create_return
+        listing_mock.create.return_value = [listing_create_return]
 
         def _listing_search_read(domain, fields, **kwargs):
             if fields == ["id"]:
@@ -1953,11 +2451,11 @@ class TestApplyUpdatesImages:
             gear_create_return=777, listing_create_return=500
         )
         report = [
-            {
-                "action": "create",
-                "reverb": {"photo_url": "https://img.reverb.com/photo.jpg", "name": "G"},
-                "create_vals": self._make_create_vals(),
-            },
+            ReportItem(
+                action="create",
+                reverb={"photo_url": "https://img.reverb.com/photo.jpg", "name": "G"},
+                create_vals=self._make_create_vals(),
+            ),
         ]
 
         with patch("sync_model._download_image_base64", return_value="FAKEBASE64") as mock_dl:
@@ -1966,34 +2464,34 @@ class TestApplyUpdatesImages:
         assert crt == 1
         mock_dl.assert_called_once_with("https://img.reverb.com/photo.jpg")
         # The listing create call should include the image
-        call_vals = listing_mock.create.call_args[0][0]
+        (call_vals,) = listing_mock.create.call_args[0][0]
         assert call_vals["x_studio_image"] == "FAKEBASE64"
 
     def test_create_without_photo_url(self):
         conn, gear_mock, listing_mock = self._mock_conn(listing_create_return=500)
         report = [
-            {
-                "action": "create",
-                "reverb": {"photo_url": "", "name": "G"},
-                "create_vals": self._make_create_vals(),
-            },
+            ReportItem(
+                action="create",
+                reverb={"photo_url": "", "name": "G"},
+                create_vals=self._make_create_vals(),
+            ),
         ]
 
         with patch("sync_model._download_image_base64", return_value=None):
             upd, crt = _apply_updates(conn, report)
 
         assert crt == 1
-        call_vals = listing_mock.create.call_args[0][0]
+        (call_vals,) = listing_mock.create.call_args[0][0]
         assert "x_studio_image" not in call_vals
 
     def test_create_image_download_fails_gracefully(self):
         conn, gear_mock, listing_mock = self._mock_conn(listing_create_return=500)
         report = [
-            {
-                "action": "create",
-                "reverb": {"photo_url": "https://img.reverb.com/photo.jpg", "name": "G"},
-                "create_vals": self._make_create_vals(),
-            },
+            ReportItem(
+                action="create",
+                reverb={"photo_url": "https://img.reverb.com/photo.jpg", "name": "G"},
+                create_vals=self._make_create_vals(),
+            ),
         ]
 
         with patch("sync_model._download_image_base64", return_value=None):
@@ -2001,18 +2499,18 @@ class TestApplyUpdatesImages:
 
         # Entry should still be created, just without image
         assert crt == 1
-        call_vals = listing_mock.create.call_args[0][0]
+        (call_vals,) = listing_mock.create.call_args[0][0]
         assert "x_studio_image" not in call_vals
 
     def test_update_downloads_image_when_missing(self):
         conn, gear_mock, listing_mock = self._mock_conn(no_image_ids=[100])
         report = [
-            {
-                "action": "update",
-                "entry": ListingRecord.from_odoo({"id": 100}),
-                "reverb": {"photo_url": "https://img.reverb.com/photo.jpg"},
-                "changes": {"x_price": 4000.0},
-            },
+            ReportItem(
+                action="update",
+                entry=ListingRecord.from_odoo({"id": 100}),
+                reverb={"photo_url": "https://img.reverb.com/photo.jpg"},
+                changes={"x_price": 4000.0},
+            ),
         ]
 
         with patch("sync_model._download_image_base64", return_value="IMGDATA"):
@@ -2020,7 +2518,7 @@ class TestApplyUpdatesImages:
 
         assert upd == 1
         call_args = listing_mock.write.call_args[0]
-        assert call_args[0] == 100
+        assert call_args[0] == [100]
         assert call_args[1]["x_price"] == 4000.0
         assert call_args[1]["x_studio_image"] == "IMGDATA"
 
@@ -2028,12 +2526,12 @@ class TestApplyUpdatesImages:
         # no_image_ids is empty → entry 100 already has an image
         conn, gear_mock, listing_mock = self._mock_conn(no_image_ids=[])
         report = [
-            {
-                "action": "update",
-                "entry": ListingRecord.from_odoo({"id": 100}),
-                "reverb": {"photo_url": "https://img.reverb.com/photo.jpg"},
-                "changes": {"x_price": 4000.0},
-            },
+            ReportItem(
+                action="update",
+                entry=ListingRecord.from_odoo({"id": 100}),
+                reverb={"photo_url": "https://img.reverb.com/photo.jpg"},
+                changes={"x_price": 4000.0},
+            ),
         ]
 
         with patch("sync_model._download_image_base64") as mock_dl:
@@ -2048,11 +2546,11 @@ class TestApplyUpdatesImages:
         conn, gear_mock, listing_mock = self._mock_conn(listing_create_return=500)
         original_vals = self._make_create_vals()
         report = [
-            {
-                "action": "create",
-                "reverb": {"photo_url": "https://img.reverb.com/photo.jpg", "name": "G"},
-                "create_vals": original_vals,
-            },
+            ReportItem(
+                action="create",
+                reverb={"photo_url": "https://img.reverb.com/photo.jpg", "name": "G"},
+                create_vals=original_vals,
+            ),
         ]
 
         with patch("sync_model._download_image_base64", return_value="IMG"):
@@ -2065,12 +2563,12 @@ class TestApplyUpdatesImages:
         conn, gear_mock, listing_mock = self._mock_conn(no_image_ids=[100])
         original_changes = {"x_price": 4000.0}
         report = [
-            {
-                "action": "update",
-                "entry": ListingRecord.from_odoo({"id": 100}),
-                "reverb": {"photo_url": "https://img.reverb.com/photo.jpg"},
-                "changes": original_changes,
-            },
+            ReportItem(
+                action="update",
+                entry=ListingRecord.from_odoo({"id": 100}),
+                reverb={"photo_url": "https://img.reverb.com/photo.jpg"},
+                changes=original_changes,
+            ),
         ]
 
         with patch("sync_model._download_image_base64", return_value="IMG"):
@@ -2282,3 +2780,40 @@ def test_resolve_platforms_ebay_without_credentials_raises(monkeypatch):
 
     with pytest.raises(EbayAuthError, match="EBAY_CLIENT_ID"):
         EbayAuth.from_env()
+
+
+def test_collect_sync_data_searches_platforms_concurrently(monkeypatch):
+    """Both platform searches must be in flight at the same time."""
+    import threading
+
+    import sync_model
+
+    barrier = threading.Barrier(2, timeout=5)
+
+    def fake_search(url):
+        def search(query, **kwargs):
+            barrier.wait()  # raises BrokenBarrierError if run one after the other
+            return [{"url": url, "name": query, "sale_ended": False}]
+
+        return search
+
+    monkeypatch.setattr(
+        sync_model,
+        "PLATFORMS",
+        {"reverb": fake_search("https://reverb.com/item/1-a"), "ebay": fake_search("https://e/1")},
+    )
+    monkeypatch.setattr(sync_model, "_fetch_listings", lambda *a, **kw: [])
+
+    data = sync_model._collect_sync_data(
+        MagicMock(),
+        model_id=1,
+        model_name="Test",
+        category_slug=None,
+        default_shipping=250.0,
+        platforms=["reverb", "ebay"],
+    )
+
+    assert [r["url"] for r in data["reverb_results"]] == [
+        "https://reverb.com/item/1-a",
+        "https://e/1",
+    ]
@@ -1,5 +1,6 @@
 """Tests for validate_model — Odoo→Reverb validation / sanitization."""
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -90,6 +91,65 @@ class TestValidateCli:
         result = self.runner.invoke(cli, ["--all", "--workers", "abc"])
         assert result.exit_code != 0
 
+    def test_all_reports_models_in_input_order(self):
+        """Models finishing out of order are still reported in input order."""
+        models = [
+            {"id": i, "name": name, "category_slug": None, "default_shipping": 250.0}
+            for i, name in enumerate(["Slow", "Medium", "Fast"], 1)
+        ]
+        delays = {"Slow": 0.05, "Medium": 0.02, "Fast": 0.0}
+
+        async def fake_collect(conn, *, model_id, model_name, default_shipping, include_sold):
+            await asyncio.sleep(delays[model_name])
+            return {
+                "model_id": model_id,
+                "model_name": model_name,
+                "default_shipping": default_shipping,
+                "entries": [],
+                "reverb_data": {},
+                "report": [],
+                "update_count": 0,
+            }
+
+        with (
+            patch("validate_model._fetch_all_models", return_value=models),
+            patch("validate_model._collect_model_data", fake_collect),
+        ):
+            result = self.runner.invoke(cli, ["--all", "--workers", "3"], obj={"conn": MagicMock()})
+
+        assert result.exit_code == 0, result.output
+        lines = [line for line in result.output.splitlines() if "no entries" in line]
+        assert [line.split()[1] for line in lines] == ["Slow", "Medium", "Fast"]
+
+    def test_all_failed_model_does_not_abort_batch(self):
+        models = [
+            {"id": i, "name": name, "category_slug": None, "default_shipping": 250.0}
+            for i, name in enumerate(["Good", "Broken"], 1)
+        ]
+
+        async def fake_collect(conn, *, model_id, model_name, default_shipping, include_sold):
+            if model_name == "Broken":
+                raise RuntimeError("boom")
+            return {
+                "model_id": model_id,
+                "model_name": model_name,
+                "default_shipping": default_shipping,
+                "entries": [],
+                "reverb_data": {},
+                "report": [],
+                "update_count": 0,
+            }
+
+        with (
+            patch("validate_model._fetch_all_models", return_value=models),
+            patch("validate_model._collect_model_data", fake_collect),
+        ):
+            result = self.runner.invoke(cli, ["--all"], obj={"conn": MagicMock()})
+
+        assert result.exit_code == 0, result.output
+        assert "Error collecting data for 'Broken'" in result.output
+        assert sum("no entries" in line for line in result.output.splitlines()) == 2
+
 
 # ── _build_validation_report ─────────────────────────────────────────────
 
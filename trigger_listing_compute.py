@@ -22,6 +22,7 @@ from __future__ import annotations
 import click
 from loguru import logger
 
+from odoo_connector import search_read_all
 from sync_model import _find_model
 
 
@@ -33,8 +34,7 @@ def _fetch_listings_for_model(conn, model_id: int) -> list[dict]:
 
 def _fetch_all_listings(conn) -> list[dict]:
     """Return all x_listing records."""
-    xl = conn.get_model("x_listing")
-    return xl.search_read([], ["id", "x_studio_compute"])
+    return search_read_all(conn, "x_listing", [], ["id", "x_studio_compute"])
 
 
 def _fetch_wanna_listings(conn) -> list[dict]:
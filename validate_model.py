@@ -14,7 +14,7 @@ from __future__ import annotations
 
 import asyncio
 import re
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 import click
@@ -491,7 +491,6 @@ def cli(
         )
 
         # Phase 1 — collect data in parallel (I/O-heavy) ----------------------
-        collected: list[dict[str, Any]] = [{}] * len(all_model_info)
         with Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
@@ -504,54 +503,52 @@ def cli(
                 f"[cyan]Scraping Reverb data[/cyan] ({n_workers} workers)…",
                 total=len(all_model_info),
             )
-            with ThreadPoolExecutor(max_workers=n_workers) as pool:
-                future_to_idx = {
-                    pool.submit(
-                        asyncio.run,
+
+            def _collect(mi: dict[str, Any]) -> dict[str, Any]:
+                # Logs and advances the bar itself (Rich progress is
+                # thread-safe), so pool.map can return results in order.
+                try:
+                    result = asyncio.run(
                         _collect_model_data(
                             conn,
                             model_id=mi["id"],
                             model_name=mi["name"],
                             default_shipping=mi["default_shipping"],
                             include_sold=include_sold,
-                        ),
-                    ): idx
-                    for idx, mi in enumerate(all_model_info)
-                }
-                for future in as_completed(future_to_idx):
-                    idx = future_to_idx[future]
-                    mi = all_model_info[idx]
-                    try:
-                        result = future.result()
-                        collected[idx] = result
-                        n_listings = len(result.get("entries", []))
-                        n_updates = result.get("update_count", 0)
-                        status = (
-                            f"[yellow]{n_updates} to update[/yellow]"
-                            if n_updates
-                            else "[green]ok[/green]"
-                        )
-                        progress.console.log(
-                            f"[cyan]{escape(mi['name'])}[/cyan]: {n_listings} listing(s) — {status}"
-                        )
-                    # catch all to avoid crashing the whole batch
-                    # It is hard to predict what might go wrong in the scraping phase,
-                    # and we want to continue processing other models even if one fails.
-                    except Exception:  # noqa
-                        progress.console.log(
-                            f"[bold red]✗[/bold red] [red]Error collecting data for"
-                            f" '{escape(mi['name'])}' (id={mi['id']})[/red]"
                         )
-                        collected[idx] = {
-                            "model_id": mi["id"],
-                            "model_name": mi["name"],
-                            "default_shipping": mi["default_shipping"],
-                            "entries": [],
-                            "reverb_data": {},
-                            "report": [],
-                            "update_count": 0,
-                        }
-                    progress.advance(task)
+                    )
+                    n_listings = len(result.get("entries", []))
+                    n_updates = result.get("update_count", 0)
+                    status = (
+                        f"[yellow]{n_updates} to update[/yellow]"
+                        if n_updates
+                        else "[green]ok[/green]"
+                    )
+                    progress.console.log(
+                        f"[cyan]{escape(mi['name'])}[/cyan]: {n_listings} listing(s) — {status}"
+                    )
+                # catch all to avoid crashing the whole batch
+                # It is hard to predict what might go wrong in the scraping phase,
+                # and we want to continue processing other models even if one fails.
+                except Exception:  # noqa
+                    progress.console.log(
+                        f"[bold red]✗[/bold red] [red]Error collecting data for"
+                        f" '{escape(mi['name'])}' (id={mi['id']})[/red]"
+                    )
+                    result = {
+                        "model_id": mi["id"],
+                        "model_name": mi["name"],
+                        "default_shipping": mi["default_shipping"],
+                        "entries": [],
+                        "reverb_data": {},
+                        "report": [],
+                        "update_count": 0,
+                    }
+                progress.advance(task)
+                return result
+
+            with ThreadPoolExecutor(max_workers=n_workers, thread_name_prefix="validate") as pool:
+                collected = list(pool.map(_collect, all_model_info))
 
         # Phase 2 — print reports & apply updates sequentially -----------------
         total_updated = 0